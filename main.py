@@ -1,12 +1,20 @@
+import argparse
 from src.ui import build_main_screen
+from src.profiles import ProfileManager
 from src.reminders import schedule_next_reminder
 from src.utils import log_message
 
 def main():
+    parser = argparse.ArgumentParser(description="Squats reminder and tracker.")
+    parser.add_argument("--profiles", metavar="DIR", help="serve every profile in this folder, e.g. on a shared kiosk")
+    parser.add_argument("--profile", help="profile shown at start (default: the first one)")
+    args = parser.parse_args()
+    profiles = ProfileManager(args.profiles) if args.profiles else None
+
     log_message("Squat reminder program started.")
-    root = build_main_screen()
-    schedule_next_reminder(5)  # Start the first reminder after 5 seconds
+    # Start the first reminder 5 seconds after the history has finished loading
+    root = build_main_screen(on_ready=lambda: schedule_next_reminder(5), profiles=profiles, profile=args.profile)
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
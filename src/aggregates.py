@@ -0,0 +1,108 @@
+"""
+Module for caching derived progress aggregates per day, week and month.
+"""
+
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta
+from src.viewmodel import summarize_day
+
+DEFAULT_MAX_ENTRIES = 512
+
+PeriodAggregate = namedtuple(
+    "PeriodAggregate",
+    ["completed", "total", "days_tracked", "days_completed", "percentage"],
+)
+
+
+def period_keys(date):
+    """
+    Returns the day, week and month cache keys that contain the given date.
+    """
+    day = datetime.strptime(date, "%Y-%m-%d").date()
+    week_start = day - timedelta(days=day.weekday())
+    return [("day", date), ("week", week_start.strftime("%Y-%m-%d")), ("month", date[:7])]
+
+
+class AggregateCache:
+    """
+    Size-bounded LRU cache of day, week and month aggregates for a tracker.
+    """
+
+    def __init__(self, tracker, max_entries=DEFAULT_MAX_ENTRIES):
+        self.tracker = tracker
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key, compute):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        value = compute()
+        self.entries[key] = value
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def day(self, date):
+        """
+        Returns the DayAggregate for a date, or None if the date has no data.
+        """
+        def compute():
+            slots = self.tracker.tracker_data.get(date)
+            return None if slots is None else summarize_day(slots)
+        return self._lookup(("day", date), compute)
+
+    def _period(self, key, start, end):
+        def compute():
+            completed = total = days_tracked = days_completed = 0
+            current = start
+            while current <= end:
+                aggregate = self.day(current.strftime("%Y-%m-%d"))
+                if aggregate is not None:
+                    completed += aggregate.completed
+                    total += aggregate.total
+                    days_tracked += 1
+                    days_completed += aggregate.mark == "completed"
+                current += timedelta(days=1)
+            percentage = (completed / total) * 100 if total else 0
+            return PeriodAggregate(completed, total, days_tracked, days_completed, percentage)
+        return self._lookup(key, compute)
+
+    def week(self, date):
+        """
+        Returns the PeriodAggregate for the Monday-based week containing date.
+        """
+        day = datetime.strptime(date, "%Y-%m-%d").date()
+        start = day - timedelta(days=day.weekday())
+        return self._period(("week", start.strftime("%Y-%m-%d")), start, start + timedelta(days=6))
+
+    def month(self, date):
+        """
+        Returns the PeriodAggregate for the calendar month containing date.
+        """
+        start = datetime.strptime(date[:7], "%Y-%m").date()
+        end = (start + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+        return self._period(("month", date[:7]), start, end)
+
+    def invalidate_day(self, date):
+        """
+        Drops the cached day, week and month aggregates affected by a change to date.
+        """
+        for key in period_keys(date):
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """
+        Drops every cached aggregate, e.g. after a bulk load or reset.
+        """
+        self.entries.clear()
+
+    def stats(self):
+        """
+        Returns the cache hit/miss counters and current size.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
@@ -0,0 +1,192 @@
+"""
+Module for streak and adherence analytics over the tracker data.
+"""
+
+from bisect import bisect_right, insort
+from collections import Counter
+from datetime import datetime
+
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def _ordinal(date):
+    return datetime.strptime(date, "%Y-%m-%d").toordinal()
+
+
+class StreakAnalytics:
+    """
+    Keeps streaks, per-slot hit rates and a weekday x slot heatmap up to date
+    as individual slots change. Only bulk loads trigger a full rescan, and that
+    rescan is deferred until the statistics are first read.
+    """
+
+    def __init__(self, tracker, slot_count):
+        self.tracker = tracker
+        self.slot_count = slot_count
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Marks the statistics stale after a bulk load; the next read rebuilds them.
+        """
+        self.stale = True
+
+    def _ensure_current(self):
+        if self.stale:
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Recomputes every statistic from scratch, e.g. after a bulk load.
+        """
+        self.stale = False
+        self.slot_hits = [0] * self.slot_count
+        self.heatmap = [[0] * self.slot_count for _ in range(7)]
+        self.weekday_days = [0] * 7
+        self.run_starts = []  # Sorted ordinals of the first day of each completed run
+        self.run_ends = {}  # Run start ordinal -> run end ordinal
+        self.run_lengths = Counter()
+        self.longest = 0
+        tracker_data = self.tracker.tracker_data
+        # Tiered data can stream archived weeks without evicting the working set
+        for date, slots in getattr(tracker_data, "scan", tracker_data.items)():
+            self.day_added(date)
+            weekday = datetime.strptime(date, "%Y-%m-%d").weekday()
+            for slot_index, completed in enumerate(slots[:self.slot_count]):
+                if completed:
+                    self.slot_hits[slot_index] += 1
+                    self.heatmap[weekday][slot_index] += 1
+            if slots and all(slots):
+                self._add_complete_day(_ordinal(date))
+
+    def day_added(self, date):
+        """
+        Records that a new day was added to the tracker data.
+        """
+        if self.stale:
+            return
+        self.weekday_days[datetime.strptime(date, "%Y-%m-%d").weekday()] += 1
+
+    def slot_changed(self, date, slot_index, old, new):
+        """
+        Applies a single slot change. The tracker data must already hold the new value.
+        """
+        if self.stale:
+            return  # The pending rebuild will see the new value
+        if bool(old) != bool(new) and 0 <= slot_index < self.slot_count:
+            delta = 1 if new else -1
+            self.slot_hits[slot_index] += delta
+            self.heatmap[datetime.strptime(date, "%Y-%m-%d").weekday()][slot_index] += delta
+
+        ordinal = _ordinal(date)
+        was_complete = self._run_containing(ordinal) is not None
+        is_complete = all(self.tracker.tracker_data.get(date, [False]))
+        if is_complete and not was_complete:
+            self._add_complete_day(ordinal)
+        elif was_complete and not is_complete:
+            self._remove_complete_day(ordinal)
+
+    def _run_containing(self, ordinal):
+        index = bisect_right(self.run_starts, ordinal) - 1
+        if index >= 0 and self.run_ends[self.run_starts[index]] >= ordinal:
+            return self.run_starts[index]
+        return None
+
+    def _add_run(self, start, end):
+        insort(self.run_starts, start)
+        self.run_ends[start] = end
+        length = end - start + 1
+        self.run_lengths[length] += 1
+        self.longest = max(self.longest, length)
+
+    def _remove_run(self, start):
+        self.run_starts.remove(start)
+        length = self.run_ends.pop(start) - start + 1
+        self.run_lengths[length] -= 1
+        if not self.run_lengths[length]:
+            del self.run_lengths[length]
+            if length == self.longest:
+                self.longest = max(self.run_lengths, default=0)
+
+    def _add_complete_day(self, ordinal):
+        start = end = ordinal
+        left = self._run_containing(ordinal - 1)
+        if left is not None:
+            start = left
+            self._remove_run(left)
+        if ordinal + 1 in self.run_ends:
+            end = self.run_ends[ordinal + 1]
+            self._remove_run(ordinal + 1)
+        self._add_run(start, end)
+
+    def _remove_complete_day(self, ordinal):
+        start = self._run_containing(ordinal)
+        end = self.run_ends[start]
+        self._remove_run(start)
+        if start < ordinal:
+            self._add_run(start, ordinal - 1)
+        if ordinal < end:
+            self._add_run(ordinal + 1, end)
+
+    def current_streak(self, today=None):
+        """
+        Returns the number of consecutive completed days ending today, which defaults to
+        the date on the tracker's clock. An unfinished today does not break a streak that
+        ran through yesterday.
+        """
+        self._ensure_current()
+        today = today or self.tracker.clock.today()
+        for ordinal in (today.toordinal(), today.toordinal() - 1):
+            start = self._run_containing(ordinal)
+            if start is not None:
+                return ordinal - start + 1
+        return 0
+
+    def longest_streak(self):
+        """
+        Returns the longest run of consecutive completed days.
+        """
+        self._ensure_current()
+        return self.longest
+
+    def slot_hit_rates(self):
+        """
+        Returns the fraction of tracked days on which each slot was completed.
+        """
+        self._ensure_current()
+        days = sum(self.weekday_days)
+        return [hits / days if days else 0 for hits in self.slot_hits]
+
+    def best_weekday(self):
+        """
+        Returns the name of the weekday with the highest completion rate, or None.
+        """
+        self._ensure_current()
+        rates = [
+            sum(row) / (days * self.slot_count) if days else -1
+            for row, days in zip(self.heatmap, self.weekday_days)
+        ]
+        best = max(range(7), key=lambda weekday: rates[weekday])
+        return WEEKDAY_NAMES[best] if rates[best] > 0 else None
+
+    def summary(self, today=None):
+        """
+        Returns all statistics as a dictionary for display.
+        """
+        self._ensure_current()
+        return {
+            "current_streak": self.current_streak(today),
+            "longest_streak": self.longest_streak(),
+            "best_weekday": self.best_weekday(),
+            "slot_hit_rates": self.slot_hit_rates(),
+            "heatmap": [row[:] for row in self.heatmap],
+        }
+
+
+def streak_text(analytics, today=None):
+    """
+    Formats the current and longest streak for a status label.
+    """
+    days = analytics.current_streak(today)
+    unit = "day" if days == 1 else "days"
+    return f"Streak: {days} {unit} (best: {analytics.longest_streak()})"
@@ -0,0 +1,125 @@
+"""
+Module for the clocks the squats app reads the time from.
+
+SystemClock is the wall clock and runs delayed calls on threading.Timer. VirtualClock
+only moves when advanced and runs its delayed calls synchronously, so days of slots,
+reminders and week rollovers can be replayed in seconds and deterministically.
+"""
+
+import heapq
+import itertools
+import threading
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """
+    The wall clock.
+    """
+
+    def now(self):
+        """
+        Returns the current local time.
+        """
+        return datetime.now()
+
+    def today(self):
+        """
+        Returns the current local date.
+        """
+        return self.now().date()
+
+    def call_later(self, delay, callback, *args):
+        """
+        Calls callback(*args) after delay seconds on a timer thread. Returns a handle with cancel().
+        """
+        timer = threading.Timer(delay, callback, args)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+
+class VirtualTimer:
+    """
+    Handle for a call scheduled on a VirtualClock.
+    """
+
+    def __init__(self, due, sequence, callback, args):
+        self.due = due
+        self.sequence = sequence
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.due, self.sequence) < (other.due, other.sequence)
+
+    def cancel(self):
+        """
+        Prevents the call from running.
+        """
+        self.cancelled = True
+
+
+class VirtualClock:
+    """
+    Clock that stands still until advanced. Scheduled calls run in due order on the thread that
+    advances the clock, with now() reading their due time. call_later may be used from any thread.
+    """
+
+    def __init__(self, start):
+        self.current = start
+        self.timers = []
+        self.sequence = itertools.count()
+        self.lock = threading.Lock()
+
+    def now(self):
+        """
+        Returns the virtual current time.
+        """
+        return self.current
+
+    def today(self):
+        """
+        Returns the virtual current date.
+        """
+        return self.current.date()
+
+    def call_later(self, delay, callback, *args):
+        """
+        Schedules callback(*args) delay seconds from the virtual now. Returns a handle with cancel().
+        """
+        with self.lock:
+            timer = VirtualTimer(self.current + timedelta(seconds=delay), next(self.sequence), callback, args)
+            heapq.heappush(self.timers, timer)
+        return timer
+
+    def pending(self):
+        """
+        Returns the number of scheduled calls that have not run or been cancelled.
+        """
+        with self.lock:
+            return sum(1 for timer in self.timers if not timer.cancelled)
+
+    def advance_to(self, when):
+        """
+        Runs every call due up to when, moving the clock to each one's due time, then to when.
+        """
+        while True:
+            with self.lock:
+                if not self.timers or self.timers[0].due > when:
+                    break
+                timer = heapq.heappop(self.timers)
+            self.current = max(self.current, timer.due)
+            if not timer.cancelled:
+                timer.callback(*timer.args)
+        self.current = max(self.current, when)
+
+    def advance(self, seconds=0, **kwargs):
+        """
+        Advances the clock by a duration given as seconds and/or timedelta keywords such as days=1.
+        """
+        self.advance_to(self.current + timedelta(seconds=seconds, **kwargs))
+
+
+SYSTEM_CLOCK = SystemClock()
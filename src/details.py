@@ -0,0 +1,229 @@
+"""
+Module for per-slot set details: rep counts, set durations and completion times.
+
+The boolean slot lists in squats_tracker.json stay the source of truth for done / not done.
+The details live column-wise in typed arrays, 8 bytes per slot: uint16 reps, uint16 seconds
+and uint32 epoch seconds, where 0 means "not recorded". They are kept in an append-only
+sidecar file in which a later entry for a day supersedes earlier ones.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from collections import namedtuple
+from datetime import date as date_type
+
+ENTRY_MAGIC = b"SQDR"
+ENTRY_HEADER = struct.Struct("<4sIH")  # magic, day ordinal, slot count
+MAX_UINT16 = 0xFFFF
+MAX_SLOT_COUNT = 24 * 60  # One slot a minute; larger counts in a header mean it is damaged
+COMPACT_SLACK_BYTES = 64 * 1024  # Rewrite the sidecar once superseded entries exceed this
+
+DayRecord = namedtuple("DayRecord", ["reps", "durations", "completed_at"])
+
+
+def check_details(reps, duration):
+    """
+    Raises ValueError unless reps and duration (seconds) fit in the 16-bit columns.
+    """
+    if not 0 <= reps <= MAX_UINT16 or not 0 <= duration <= MAX_UINT16:
+        raise ValueError(f"Reps and duration must be between 0 and {MAX_UINT16}.")
+
+
+def _to_little_endian(values):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode, raw):
+    values = array(typecode)
+    values.frombytes(raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _entry_day(magic, ordinal, slot_count):
+    """
+    Returns the "YYYY-MM-DD" day of a well-formed entry header, or None if the header is damaged.
+    """
+    if magic != ENTRY_MAGIC or not 1 <= slot_count <= MAX_SLOT_COUNT:
+        return None
+    try:
+        return date_type.fromordinal(ordinal).strftime("%Y-%m-%d")
+    except (ValueError, OverflowError):
+        return None
+
+
+class DetailStore:
+    """
+    Rep counts, durations and completion times of every recorded day, one row of slot_count
+    entries per day in each column. The sidecar is read on first use.
+    """
+
+    def __init__(self, path, slot_count):
+        self.path = path
+        self.slot_count = slot_count
+        self.rows = {}  # "YYYY-MM-DD" -> row number
+        self.reps = array("H")
+        self.durations = array("H")
+        self.completed_at = array("I")
+        self.dirty = {}  # "YYYY-MM-DD" -> slot indexes changed here since the last flush
+        self.loaded = False
+        self.scanned_to = 0
+        self.file_id = None  # (device, inode) of the scanned sidecar; compaction replaces the file
+
+    def _ensure_loaded(self):
+        if not self.loaded:
+            self.loaded = True
+            self.refresh()
+
+    def refresh(self):
+        """
+        Reads the entries appended to the sidecar since the last scan, e.g. by another instance.
+        If another instance compacted it into a new file, the new file is scanned from the start.
+        Slots changed here and not yet flushed keep their local values; the rest of their
+        day follows the file, like the tracker's per-slot merge.
+        Damaged bytes are skipped up to the next entry. Only a damaged or incomplete last entry
+        stops the scan; it is overwritten by the next flush.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.scanned_to, self.file_id = 0, None
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self.file_id or stat.st_size < self.scanned_to:
+            self.scanned_to, self.file_id = 0, file_id
+        if stat.st_size == self.scanned_to:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self.scanned_to)
+            data = f.read()
+        offset = 0
+        while offset + ENTRY_HEADER.size <= len(data):
+            magic, ordinal, slot_count = ENTRY_HEADER.unpack_from(data, offset)
+            end = offset + ENTRY_HEADER.size + 8 * slot_count
+            day = _entry_day(magic, ordinal, slot_count)
+            if day is None or end > len(data):
+                next_entry = data.find(ENTRY_MAGIC, offset + 1)
+                if next_entry < 0:
+                    break
+                print(f"Warning: skipped {next_entry - offset} damaged bytes in {self.path}.")
+                offset = next_entry
+                continue
+            start = offset + ENTRY_HEADER.size
+            self._merge_row(
+                day,
+                _from_little_endian("H", data[start:start + 2 * slot_count]),
+                _from_little_endian("H", data[start + 2 * slot_count:start + 4 * slot_count]),
+                _from_little_endian("I", data[start + 4 * slot_count:end]),
+            )
+            offset = end
+        self.scanned_to += offset
+
+    def _row(self, day, create=False):
+        row = self.rows.get(day)
+        if row is None and create:
+            row = self.rows[day] = len(self.rows)
+            self.reps.extend([0] * self.slot_count)
+            self.durations.extend([0] * self.slot_count)
+            self.completed_at.extend([0] * self.slot_count)
+        return row
+
+    def _store_row(self, day, reps, durations, completed_at):
+        start = self._row(day, create=True) * self.slot_count
+        for column, values in ((self.reps, reps), (self.durations, durations), (self.completed_at, completed_at)):
+            values = values[:self.slot_count]
+            values.extend([0] * (self.slot_count - len(values)))  # Slot count changed since it was written
+            column[start:start + self.slot_count] = values
+
+    def _merge_row(self, day, reps, durations, completed_at):
+        columns = (self.reps, self.durations, self.completed_at)
+        row = self._row(day)
+        kept = {}  # Position -> local values of a slot changed here
+        if row is not None:
+            for slot_index in self.dirty.get(day, ()):
+                position = row * self.slot_count + slot_index
+                kept[position] = [column[position] for column in columns]
+        self._store_row(day, reps, durations, completed_at)
+        for position, values in kept.items():
+            for column, value in zip(columns, values):
+                column[position] = value
+
+    def day(self, day):
+        """
+        Returns a DayRecord of column slices for a day, or None if nothing was recorded for it.
+        """
+        self._ensure_loaded()
+        row = self._row(day)
+        if row is None:
+            return None
+        start, end = row * self.slot_count, (row + 1) * self.slot_count
+        return DayRecord(self.reps[start:end], self.durations[start:end], self.completed_at[start:end])
+
+    def set_slot(self, day, slot_index, reps=0, duration=0, completed_at=0):
+        """
+        Records the details of a completed slot. reps and duration (seconds) must fit in 16 bits.
+        """
+        check_details(reps, duration)
+        self._ensure_loaded()
+        position = self._row(day, create=True) * self.slot_count + slot_index
+        self.reps[position] = reps
+        self.durations[position] = duration
+        self.completed_at[position] = int(completed_at)
+        self.dirty.setdefault(day, set()).add(slot_index)
+
+    def clear_slot(self, day, slot_index):
+        """
+        Forgets the details of a slot that was marked as not completed.
+        """
+        self._ensure_loaded()
+        row = self._row(day)
+        if row is not None:
+            position = row * self.slot_count + slot_index
+            self.reps[position] = self.durations[position] = self.completed_at[position] = 0
+            self.dirty.setdefault(day, set()).add(slot_index)
+
+    def _entry(self, day):
+        record = self.day(day)
+        ordinal = date_type.fromisoformat(day).toordinal()
+        return (
+            ENTRY_HEADER.pack(ENTRY_MAGIC, ordinal, self.slot_count)
+            + _to_little_endian(record.reps)
+            + _to_little_endian(record.durations)
+            + _to_little_endian(record.completed_at)
+        )
+
+    def flush(self):
+        """
+        Appends the days changed since the last flush, compacting the sidecar when it holds
+        more superseded entries than COMPACT_SLACK_BYTES. Call with the tracker's file lock held.
+        """
+        if not self.dirty:
+            return
+        self.refresh()  # Pick up other instances' entries before a compaction could drop them
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        live_bytes = len(self.rows) * (ENTRY_HEADER.size + 8 * self.slot_count)
+        if size + len(self.dirty) * (ENTRY_HEADER.size + 8 * self.slot_count) > live_bytes + COMPACT_SLACK_BYTES:
+            temp_file = f"{self.path}.tmp"
+            with open(temp_file, "wb") as f:
+                f.write(b"".join(self._entry(day) for day in sorted(self.rows)))
+            os.replace(temp_file, self.path)
+            stat = os.stat(self.path)
+            self.scanned_to, self.file_id = live_bytes, (stat.st_dev, stat.st_ino)
+        else:
+            with open(self.path, "ab") as f:
+                if self.file_id is None:
+                    stat = os.fstat(f.fileno())
+                    self.file_id = (stat.st_dev, stat.st_ino)
+                if f.tell() > self.scanned_to:
+                    f.truncate(self.scanned_to)  # Drop a truncated or damaged tail before appending
+                    f.seek(self.scanned_to)
+                entries = b"".join(self._entry(day) for day in sorted(self.dirty))
+                f.write(entries)
+            self.scanned_to += len(entries)
+        self.dirty.clear()
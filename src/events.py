@@ -0,0 +1,46 @@
+"""
+Module for the in-process change notification bus.
+
+The Tracker publishes one typed event per change. The aggregate cache, the streak
+analytics and the UI subscribe and update only the dates named in the event.
+"""
+
+from collections import defaultdict, namedtuple
+
+SlotChanged = namedtuple("SlotChanged", ["date", "slot_index", "old", "new"])
+DayAdded = namedtuple("DayAdded", ["date"])
+DaysReloaded = namedtuple("DaysReloaded", ["dates"])  # Days whose stored slots were replaced as a whole
+DataReplaced = namedtuple("DataReplaced", [])  # The whole tracker data was loaded or reset
+
+EVENT_TYPES = (SlotChanged, DayAdded, DaysReloaded, DataReplaced)
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe by event type. Handlers run in subscription order on the
+    publishing thread, after the tracker data already holds the change.
+    """
+
+    def __init__(self):
+        self.handlers = defaultdict(list)
+
+    def subscribe(self, event_type, handler):
+        """
+        Calls handler(event) for every published event of event_type. Returns the handler.
+        """
+        self.handlers[event_type].append(handler)
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        """
+        Stops calling a handler; unknown handlers are ignored.
+        """
+        if handler in self.handlers[event_type]:
+            self.handlers[event_type].remove(handler)
+
+    def publish(self, event):
+        """
+        Delivers an event to the handlers subscribed to its type.
+        """
+        for handler in list(self.handlers[type(event)]):
+            handler(event)
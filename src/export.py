@@ -0,0 +1,183 @@
+"""
+Module for exporting squats history to CSV, JSON Lines or a compact columnar binary format.
+
+Every format is produced by a generator pipeline that yields fixed-size chunks,
+so the whole output is never held in memory.
+
+Usage:
+    python -m src.export history.csv --format csv --start 2025-01-01 --end 2025-12-31
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+from src.storage import TieredTrackerData
+
+CHUNK_ROWS = 1024
+FORMATS = ("csv", "jsonl", "columnar")
+COLUMNAR_MAGIC = b"SQTC"
+COLUMNAR_VERSION = 1
+COLUMNAR_HEADER = struct.Struct("<4sBH")  # magic, version, slot count
+CHUNK_HEADER = struct.Struct("<I")  # rows in chunk
+
+
+def iter_days(tracker_data, start=None, end=None):
+    """
+    Yields (date, slots) pairs in date order, limited to [start, end] when given.
+    Dates are "YYYY-MM-DD" strings, so they sort chronologically as text.
+    Tiered data is streamed one archived week at a time.
+    """
+    if isinstance(tracker_data, TieredTrackerData):
+        yield from tracker_data.scan(start, end)
+        return
+    for day in sorted(key for key in tracker_data if (start is None or key >= start) and (end is None or key <= end)):
+        yield day, tracker_data[day]
+
+
+def _chunked(days, chunk_rows):
+    chunk = []
+    for day in days:
+        chunk.append(day)
+        if len(chunk) == chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_csv_chunks(days, time_slots, chunk_rows=CHUNK_ROWS):
+    """
+    Yields CSV text with a header row and one row per day (1 = completed, 0 = not).
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["date", *time_slots, "completed"])
+    for chunk in _chunked(days, chunk_rows):
+        for day, slots in chunk:
+            writer.writerow([day, *(int(bool(slot)) for slot in slots), sum(1 for slot in slots if slot)])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_jsonl_chunks(days, chunk_rows=CHUNK_ROWS):
+    """
+    Yields JSON Lines text, one {"date": ..., "slots": [...]} object per day.
+    """
+    for chunk in _chunked(days, chunk_rows):
+        yield "".join(json.dumps({"date": day, "slots": slots}) + "\n" for day, slots in chunk)
+
+
+def _little_endian(values):
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def iter_columnar_chunks(days, slot_count, chunk_rows=CHUNK_ROWS):
+    """
+    Yields the columnar binary format: a header, then per chunk the row count,
+    a uint32 column of day ordinals and a column of packed slot bitmasks.
+    """
+    mask_bytes = (slot_count + 7) // 8
+    yield COLUMNAR_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, slot_count)
+    for chunk in _chunked(days, chunk_rows):
+        ordinals = array("I", (date.fromisoformat(day).toordinal() for day, _ in chunk))
+        masks = bytearray(len(chunk) * mask_bytes)
+        for row, (_, slots) in enumerate(chunk):
+            for slot_index, completed in enumerate(slots[:slot_count]):
+                if completed:
+                    masks[row * mask_bytes + slot_index // 8] |= 1 << (slot_index % 8)
+        yield CHUNK_HEADER.pack(len(chunk)) + _little_endian(ordinals) + bytes(masks)
+
+
+def read_columnar(path):
+    """
+    Yields (date, slots) pairs back from a columnar export, one chunk in memory at a time.
+    """
+    with open(path, "rb") as f:
+        magic, version, slot_count = COLUMNAR_HEADER.unpack(f.read(COLUMNAR_HEADER.size))
+        if magic != COLUMNAR_MAGIC or version != COLUMNAR_VERSION:
+            raise ValueError(f"{path} is not a squats columnar export.")
+        mask_bytes = (slot_count + 7) // 8
+        while True:
+            header = f.read(CHUNK_HEADER.size)
+            if not header:
+                return
+            (rows,) = CHUNK_HEADER.unpack(header)
+            ordinals = array("I")
+            ordinals.frombytes(f.read(rows * ordinals.itemsize))
+            if sys.byteorder == "big":
+                ordinals.byteswap()
+            masks = f.read(rows * mask_bytes)
+            for row, ordinal in enumerate(ordinals):
+                yield date.fromordinal(ordinal).strftime("%Y-%m-%d"), [
+                    bool(masks[row * mask_bytes + slot_index // 8] & (1 << (slot_index % 8)))
+                    for slot_index in range(slot_count)
+                ]
+
+
+def export_history(tracker_data, path, time_slots, fmt="csv", start=None, end=None, chunk_rows=CHUNK_ROWS):
+    """
+    Streams the tracker data in date order to path in the given format.
+    Writes to a temporary file first so a failed export never leaves a partial file behind.
+    """
+    days = iter_days(tracker_data, start, end)
+    if fmt == "csv":
+        chunks, mode = iter_csv_chunks(days, time_slots, chunk_rows), "w"
+    elif fmt == "jsonl":
+        chunks, mode = iter_jsonl_chunks(days, chunk_rows), "w"
+    elif fmt == "columnar":
+        chunks, mode = iter_columnar_chunks(days, len(time_slots), chunk_rows), "wb"
+    else:
+        raise ValueError(f"Unknown export format '{fmt}'. Expected one of: {', '.join(FORMATS)}.")
+
+    temp_file = f"{path}.tmp"
+    try:
+        if mode == "wb":
+            f = open(temp_file, "wb")  # pylint: disable=consider-using-with
+        else:
+            f = open(temp_file, "w", encoding="utf-8", newline="")  # pylint: disable=consider-using-with
+        with f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_file, path)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+
+
+def _date_arg(text):
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid date '{text}', expected YYYY-MM-DD") from e
+
+
+def main(argv=None):
+    """
+    Command-line entry point for exporting the tracker history.
+    """
+    parser = argparse.ArgumentParser(description="Export squats history.")
+    parser.add_argument("output", help="Path of the file to write.")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--start", type=_date_arg, help="First date to export (YYYY-MM-DD).")
+    parser.add_argument("--end", type=_date_arg, help="Last date to export (YYYY-MM-DD).")
+    args = parser.parse_args(argv)
+
+    from src.tracker import tracker, time_slots  # Loaded here so importing this module has no side effects
+    export_history(tracker.tracker_data, args.output, time_slots, args.format, args.start, args.end)
+    print(f"Exported squats history to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
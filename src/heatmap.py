@@ -0,0 +1,155 @@
+"""
+Module for the GitHub-style year heatmap view of squats progress.
+"""
+
+from datetime import date, timedelta
+import tkinter as tk
+from tkinter import ttk
+from src.storage import TieredTrackerData
+
+CELL_SIZE = 12
+CELL_GAP = 3
+LEFT_MARGIN = 34
+TOP_MARGIN = 20
+NO_DATA_COLOR = "#ebedf0"
+LEVEL_COLORS = ["#ffcccc", "#c6e48b", "#7bc96f", "#239a3b", "#196127"]
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+ROW_LABELS = {0: "Mon", 2: "Wed", 4: "Fri"}
+
+
+def completion_matrix(year, tracker_data, slot_count):
+    """
+    Builds a days x slots completion array for the year in one pass over its stored days.
+    Archived weeks are read once each, past the week cache, so the displayed months stay cached.
+    Returns (matrix, has_data), both bytearrays; matrix is row-major with one row per day.
+    """
+    start = date(year, 1, 1)
+    days = (date(year + 1, 1, 1) - start).days
+    matrix = bytearray(days * slot_count)
+    has_data = bytearray(days)
+    first, last = f"{year:04d}-01-01", f"{year:04d}-12-31"
+    if isinstance(tracker_data, TieredTrackerData):
+        stored = tracker_data.scan(first, last)
+    else:
+        stored = ((day, slots) for day, slots in tracker_data.items() if first <= day <= last)
+    for day, slots in stored:
+        offset = (date.fromisoformat(day) - start).days
+        has_data[offset] = 1
+        row = offset * slot_count
+        for slot_index, completed in enumerate(slots[:slot_count]):
+            if completed:
+                matrix[row + slot_index] = 1
+    return matrix, has_data
+
+
+def cell_position(year, offset):
+    """
+    Returns the (column, row) of the day at offset in the year: one column per week, Monday on top.
+    """
+    first = date(year, 1, 1)
+    day = first + timedelta(days=offset)
+    return (offset + first.weekday()) // 7, day.weekday()
+
+
+def cell_color(completed, slot_count, has_data=True):
+    """
+    Returns the fill color for a day with the given number of completed slots.
+    """
+    if not has_data or not slot_count:
+        return NO_DATA_COLOR
+    if not completed:
+        return LEVEL_COLORS[0]
+    return LEVEL_COLORS[1 + min(3, (completed * 4 - 1) // slot_count)]
+
+
+class YearHeatmap:
+    """
+    Paints a whole year as one canvas of day cells, with hover details.
+    """
+
+    def __init__(self, parent, year, tracker_data, time_slots):
+        self.year = year
+        self.time_slots = time_slots
+        self.slot_count = len(time_slots)
+        self.matrix, self.has_data = completion_matrix(year, tracker_data, self.slot_count)
+
+        columns = cell_position(year, len(self.has_data) - 1)[0] + 1
+        pitch = CELL_SIZE + CELL_GAP
+        self.canvas = tk.Canvas(
+            parent, width=LEFT_MARGIN + columns * pitch, height=TOP_MARGIN + 7 * pitch,
+            background="white", highlightthickness=0,
+        )
+        self.canvas.pack(padx=10, pady=10)
+        self.detail_label = ttk.Label(parent, text="Hover over a day for details.", font=("Helvetica", 11))
+        self.detail_label.pack(pady=(0, 10))
+        self.paint()
+        self.canvas.bind("<Motion>", self.on_hover)
+
+    def completed_on(self, offset):
+        """
+        Returns the number of completed slots for the day at offset.
+        """
+        row = offset * self.slot_count
+        return sum(self.matrix[row:row + self.slot_count])
+
+    def paint(self):
+        """
+        Draws every day cell, the month labels and the weekday labels in a single pass.
+        """
+        pitch = CELL_SIZE + CELL_GAP
+        for row, label in ROW_LABELS.items():
+            self.canvas.create_text(
+                LEFT_MARGIN - 6, TOP_MARGIN + row * pitch + CELL_SIZE / 2, text=label, anchor="e",
+                font=("Helvetica", 8),
+            )
+        first = date(self.year, 1, 1)
+        for offset, has_data in enumerate(self.has_data):
+            column, row = cell_position(self.year, offset)
+            x = LEFT_MARGIN + column * pitch
+            y = TOP_MARGIN + row * pitch
+            if (first + timedelta(days=offset)).day == 1:
+                month = (first + timedelta(days=offset)).month
+                self.canvas.create_text(x, TOP_MARGIN - 6, text=MONTH_NAMES[month - 1], anchor="sw",
+                                        font=("Helvetica", 8))
+            color = cell_color(self.completed_on(offset), self.slot_count, has_data)
+            self.canvas.create_rectangle(x, y, x + CELL_SIZE, y + CELL_SIZE, fill=color, outline="")
+
+    def offset_at(self, x, y):
+        """
+        Returns the day offset under canvas coordinates (x, y), or None.
+        """
+        pitch = CELL_SIZE + CELL_GAP
+        column, row = (x - LEFT_MARGIN) // pitch, (y - TOP_MARGIN) // pitch
+        if x < LEFT_MARGIN or y < TOP_MARGIN or row > 6:
+            return None
+        offset = column * 7 + row - date(self.year, 1, 1).weekday()
+        return offset if 0 <= offset < len(self.has_data) else None
+
+    def on_hover(self, event):
+        """
+        Shows the date and slot details for the cell under the pointer.
+        """
+        offset = self.offset_at(event.x, event.y)
+        if offset is None:
+            return
+        day = (date(self.year, 1, 1) + timedelta(days=offset)).strftime("%Y-%m-%d")
+        if not self.has_data[offset]:
+            self.detail_label.config(text=f"{day}: No data")
+            return
+        row = offset * self.slot_count
+        done = [slot for index, slot in enumerate(self.time_slots) if self.matrix[row + index]]
+        text = f"{day}: {len(done)}/{self.slot_count} completed"
+        if done:
+            text += f" ({', '.join(done)})"
+        self.detail_label.config(text=text)
+
+
+def show_year_heatmap(root, year, tracker_data, time_slots):
+    """
+    Opens a window with the year heatmap for the given year.
+    """
+    window = tk.Toplevel(root)
+    window.title(f"Squats in {year}")
+    window.configure(bg="#f0f8ff")
+    ttk.Label(window, text=f"Squats Progress {year}", font=("Helvetica", 14, "bold")).pack(pady=(10, 0))
+    return YearHeatmap(window, year, tracker_data, time_slots)
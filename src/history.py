@@ -0,0 +1,144 @@
+"""
+Module for rebuilding squats progress from the activity log.
+
+Every change to the tracker is written to the log, either as a full state dump
+(e.g. "Tracker data loaded from file: {...}") or as a slot mark
+(e.g. "User marked slot 3 on 2025-04-01 as completed. ..."). Replaying those
+lines in order recovers the tracker data when both JSON files are lost.
+"""
+
+import glob
+import gzip
+import json
+import os
+import re
+from collections import namedtuple
+
+# Events produced by the log parser
+StateDump = namedtuple("StateDump", ["data"])
+SlotMark = namedtuple("SlotMark", ["date", "slot_index", "completed", "day"])
+
+DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
+MARK_RE = re.compile(
+    rf"User marked slot (\d+) on ({DATE_PATTERN}) as (completed|not completed)\."
+    r"(?: Current tracker data: (\[.*\]))?"
+)
+PROGRESS_RE = re.compile(rf"Progress updated for ({DATE_PATTERN}), slot (\d+)\.")
+DUMP_MARKER = "racker data"
+ROTATED_SUFFIX_RE = re.compile(r"\.(\d+)(\.gz)?")  # The whole suffix after the log name
+
+
+def find_log_sources(log_file):
+    """
+    Returns the log file and its rotated archives, oldest first.
+    Archives follow the logrotate naming scheme (log.1 is newer than log.2.gz).
+    """
+    archives = []
+    for path in glob.glob(f"{glob.escape(log_file)}.*"):
+        match = ROTATED_SUFFIX_RE.fullmatch(path[len(log_file):])
+        if match:
+            archives.append((int(match.group(1)), path))
+    sources = [path for _, path in sorted(archives, reverse=True)]
+    if os.path.exists(log_file):
+        sources.append(log_file)
+    return sources
+
+
+def iter_log_lines(paths):
+    """
+    Yields log lines from the given files one at a time, in order.
+    Gzip-compressed archives are decompressed on the fly.
+    """
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8", errors="replace") as log:
+            yield from log
+
+
+def _parse_literal(text):
+    """
+    Parses a Python literal as written by log_message (repr of dicts and lists).
+    Returns None for truncated or otherwise unreadable dumps.
+    """
+    text = text.replace("'", '"').replace("True", "true").replace("False", "false")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def _is_valid_day(slots):
+    return isinstance(slots, list) and all(isinstance(slot, bool) for slot in slots)
+
+
+def parse_log_events(lines):
+    """
+    Converts raw log lines into StateDump and SlotMark events.
+    Lines that are neither are skipped, as are corrupted dumps.
+    """
+    for line in lines:
+        line = line.rstrip("\n")
+        if "User marked slot" in line:
+            match = MARK_RE.search(line)
+            if match:
+                day = _parse_literal(match.group(4)) if match.group(4) else None
+                yield SlotMark(
+                    match.group(2),
+                    int(match.group(1)),
+                    match.group(3) == "completed",
+                    day if _is_valid_day(day) else None,
+                )
+        elif "Progress updated for" in line:
+            match = PROGRESS_RE.search(line)
+            if match:
+                yield SlotMark(match.group(1), int(match.group(2)), True, None)
+        elif DUMP_MARKER in line:
+            start = line.find(": {", line.find(DUMP_MARKER))
+            if start == -1:
+                continue
+            data = _parse_literal(line[start + 2:])
+            if isinstance(data, dict) and all(_is_valid_day(slots) for slots in data.values()):
+                yield StateDump(data)
+
+
+def replay_events(events, slot_count):
+    """
+    Replays log events into tracker data.
+    Each state dump replaces the state, so the result resumes from the last good dump.
+    """
+    tracker_data = {}
+    for event in events:
+        if isinstance(event, StateDump):
+            tracker_data = event.data
+        elif event.day is not None:
+            tracker_data[event.date] = event.day
+        elif 0 <= event.slot_index < slot_count:
+            slots = tracker_data.setdefault(event.date, [False] * slot_count)
+            slots[event.slot_index] = event.completed
+    return tracker_data
+
+
+def write_verified_snapshot(tracker_data, snapshot_file):
+    """
+    Writes the tracker data to snapshot_file and reads it back before replacing it.
+    Raises ValueError if the written snapshot does not match.
+    """
+    temp_file = f"{snapshot_file}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(tracker_data, f, indent=4)
+    with open(temp_file, "r", encoding="utf-8") as f:
+        if json.load(f) != tracker_data:
+            raise ValueError(f"Snapshot verification failed for {snapshot_file}.")
+    os.replace(temp_file, snapshot_file)
+
+
+def rebuild_tracker_data(log_file, snapshot_file, slot_count):
+    """
+    Rebuilds the tracker data from the log and its archives in a single streaming pass.
+    Writes a verified snapshot and returns the data, or an empty dict if nothing was found.
+    """
+    lines = iter_log_lines(find_log_sources(log_file))
+    tracker_data = replay_events(parse_log_events(lines), slot_count)
+    if tracker_data:
+        write_verified_snapshot(tracker_data, snapshot_file)
+    return tracker_data
@@ -0,0 +1,229 @@
+"""
+Module for tracking how long after a slot's reminder the slot is marked as done.
+
+Delays are fed into mergeable streaming quantile sketches (log-spaced buckets in the
+style of DDSketch), one per slot and one per week. Any percentile of any span of
+history can then be reported within 1% relative error, in memory that does not grow
+with the number of samples. The report is printed by src/latency_report.py.
+"""
+
+import json
+import math
+import os
+from collections import defaultdict
+
+LATENCY_FILE = "squats_latency.json"  # Per profile, next to the tracker file
+RELATIVE_ACCURACY = 0.01
+MAX_BUCKETS = 2048  # Beyond this the lowest buckets are folded together
+MIN_DELAY = 1.0  # Seconds; shorter delays are counted as 0
+REPORT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch with relative accuracy. Values fall into buckets whose bounds
+    grow by a factor gamma, so a bucket's midpoint is within the accuracy of every value in it.
+    Sketches with the same accuracy merge by adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY, max_buckets=MAX_BUCKETS):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = defaultdict(int)  # Bucket key -> count
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value, count=1):
+        """
+        Adds a non-negative value.
+        """
+        if value < MIN_DELAY:
+            self.zero_count += count
+        else:
+            self.buckets[math.ceil(math.log(value) / self.log_gamma)] += count
+            self._collapse()
+        self.count += count
+
+    def merge(self, other):
+        """
+        Adds the counts of another sketch with the same accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        for key, count in other.buckets.items():
+            self.buckets[key] += count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self._collapse()
+
+    def _collapse(self):
+        if len(self.buckets) <= self.max_buckets:
+            return
+        keys = sorted(self.buckets)
+        folded = keys[:len(keys) - self.max_buckets + 1]
+        self.buckets[folded[-1]] += sum(self.buckets.pop(key) for key in folded[:-1])
+
+    def quantile(self, q):
+        """
+        Returns the estimated q-quantile (0 <= q <= 1), or None if the sketch is empty.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self):
+        """
+        Returns a JSON-serializable form of the sketch.
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zero_count": self.zero_count,
+            "buckets": {str(key): count for key, count in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds a sketch from to_dict() output.
+        """
+        sketch = cls(data["relative_accuracy"])
+        sketch.zero_count = data["zero_count"]
+        for key, count in data["buckets"].items():
+            sketch.buckets[int(key)] = count
+        sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+        sketch._collapse()
+        return sketch
+
+
+def _sketch_map(data):
+    return defaultdict(QuantileSketch, {key: QuantileSketch.from_dict(value) for key, value in data.items()})
+
+
+class LatencyStore:
+    """
+    Reminder-to-completion delay sketches per slot index and per week start, persisted as JSON.
+    Samples not yet saved are also kept as separate delta sketches, so a save can merge them
+    into whatever other instances saved meanwhile instead of overwriting it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.slots = None  # Slot index (as str) -> QuantileSketch, loaded on first use
+        self.weeks = None  # Week start -> QuantileSketch
+        self.delta_slots = defaultdict(QuantileSketch)
+        self.delta_weeks = defaultdict(QuantileSketch)
+        self.fires_date = None
+        self.fires = {}  # Slot index -> epoch seconds of the first reminder since the slot started
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return _sketch_map(data.get("slots", {})), _sketch_map(data.get("weeks", {}))
+        except FileNotFoundError:
+            pass
+        except (ValueError, AttributeError, KeyError, TypeError):  # Not JSON, or not shaped like a saved store
+            print(f"Warning: {self.path} is corrupted. Starting latency tracking afresh.")
+        return _sketch_map({}), _sketch_map({})
+
+    def _ensure_loaded(self):
+        if self.slots is None:
+            self.slots, self.weeks = self._read()
+
+    def reminder_fired(self, date, slot_index, fired_at):
+        """
+        Remembers the first reminder for an open slot today. Earlier days' reminders are dropped.
+        """
+        if date != self.fires_date:
+            self.fires_date, self.fires = date, {}
+        self.fires.setdefault(slot_index, fired_at)
+
+    def record_completion(self, date, week, slot_index, slot_start, completed_at):
+        """
+        Records the delay from the slot's reminder, or from its start if no reminder fired, to
+        its completion. Completions before the slot started are not responsiveness and are skipped.
+        """
+        fired_at = self.fires.pop(slot_index, None) if date == self.fires_date else None
+        delay = completed_at - (fired_at if fired_at is not None else slot_start)
+        if delay < 0:
+            return None
+        self._ensure_loaded()
+        key = str(slot_index)
+        for sketches in (self.slots[key], self.delta_slots[key], self.weeks[week], self.delta_weeks[week]):
+            sketches.add(delay)
+        return delay
+
+    def flush(self):
+        """
+        Merges the unsaved samples into the file. Call with the tracker's file lock held.
+        """
+        if not self.delta_slots:
+            return
+        slots, weeks = self._read()
+        for merged, deltas in ((slots, self.delta_slots), (weeks, self.delta_weeks)):
+            for key, sketch in deltas.items():
+                merged[key].merge(sketch)
+        temp_file = f"{self.path}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "slots": {key: sketch.to_dict() for key, sketch in sorted(slots.items())},
+                "weeks": {key: sketch.to_dict() for key, sketch in sorted(weeks.items())},
+            }, f)
+        os.replace(temp_file, self.path)
+        self.slots, self.weeks = slots, weeks
+        self.delta_slots.clear()
+        self.delta_weeks.clear()
+
+    def slot_sketch(self, slot_index):
+        """
+        Returns the sketch of all delays recorded for a slot.
+        """
+        self._ensure_loaded()
+        return self.slots.get(str(slot_index)) or QuantileSketch()
+
+    def span_sketch(self, first_week=None, last_week=None):
+        """
+        Returns one sketch merged from the weeks in [first_week, last_week] (both optional).
+        """
+        self._ensure_loaded()
+        merged = QuantileSketch()
+        for week, sketch in self.weeks.items():
+            if (first_week is None or week >= first_week) and (last_week is None or week <= last_week):
+                merged.merge(sketch)
+        return merged
+
+
+def _format_delay(seconds):
+    if seconds is None:
+        return "-"
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def format_latency_report(store, time_slots, first_week=None, last_week=None):
+    """
+    Formats p50/p90/p99 reminder-to-completion delays per slot and for the selected weeks.
+    """
+    header = f"{'Slot':<10} {'Sets':>6} " + " ".join(f"{'p' + str(round(q * 100)):>7}" for q in REPORT_QUANTILES)
+    lines = [header]
+
+    def row(label, sketch):
+        delays = " ".join(f"{_format_delay(sketch.quantile(q)):>7}" for q in REPORT_QUANTILES)
+        return f"{label:<10} {sketch.count:>6} {delays}"
+
+    for index, slot in enumerate(time_slots):
+        lines.append(row(slot, store.slot_sketch(index)))
+    span = "All weeks" if first_week is None and last_week is None else f"{first_week or '...'} to {last_week or '...'}"
+    lines.append(row("Total", store.span_sketch(first_week, last_week)) + f"  ({span})")
+    return "\n".join(lines)
@@ -0,0 +1,28 @@
+"""
+Command-line report of how long after each reminder squats are done, see src/latency.py.
+
+Usage:
+    python -m src.latency_report --from-week 2025-01-06 --to-week 2025-03-31
+"""
+
+import argparse
+from src.latency import LATENCY_FILE, LatencyStore, format_latency_report
+
+
+def main(argv=None):
+    """
+    Command-line entry point: prints the responsiveness report.
+    """
+    parser = argparse.ArgumentParser(description="Report how long after each reminder squats are done.")
+    parser.add_argument("--from-week", help="first week start (YYYY-MM-DD) of the total")
+    parser.add_argument("--to-week", help="last week start (YYYY-MM-DD) of the total")
+    parser.add_argument("--profile", metavar="DIR", help="profile folder (default: the working directory)")
+    args = parser.parse_args(argv)
+
+    from src.tracker import profile_path, time_slots  # Loaded here so importing this module has no side effects
+    store = LatencyStore(profile_path(args.profile, LATENCY_FILE))
+    print(format_latency_report(store, time_slots, args.from_week, args.to_week))
+
+
+if __name__ == "__main__":
+    main()
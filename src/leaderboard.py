@@ -0,0 +1,170 @@
+"""
+Module for building a team leaderboard from many tracker files.
+
+Profile files are read directly (no Tracker instances, no logging) and sharded across
+a process pool. The parent merges the per-profile summaries into a top-k leaderboard.
+
+Usage:
+    python -m src.leaderboard profiles/ --top 10 --period week --date 2025-04-04
+"""
+
+import argparse
+import glob
+import heapq
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from src.clock import SYSTEM_CLOCK
+from src.storage import TieredTrackerData, WeekArchive
+
+TRACKER_FILE_NAME = "squats_tracker.json"
+ARCHIVE_FILE_NAME = "squats_archive.dat"
+SHARD_SIZE = 64
+
+ProfileSummary = namedtuple(
+    "ProfileSummary",
+    ["profile", "week_completed", "week_total", "month_completed", "month_total"],
+)
+
+
+def profile_name(path):
+    """
+    Names a profile after its file, or after its directory for per-profile tracker files.
+    """
+    if os.path.basename(path) == TRACKER_FILE_NAME:
+        return os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def find_profiles(paths):
+    """
+    Expands directories into the tracker files they contain, skipping backup files.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = glob.glob(os.path.join(path, "*.json")) + glob.glob(os.path.join(path, "*", TRACKER_FILE_NAME))
+            found.extend(sorted(c for c in candidates if not c.endswith("_backup.json")))
+        else:
+            found.append(path)
+    return found
+
+
+def is_tracker_data(data):
+    """
+    Checks that loaded JSON has the tracker file's shape: {date: [bool, ...]}.
+    """
+    return isinstance(data, dict) and all(
+        isinstance(slots, list) and all(isinstance(slot, bool) for slot in slots) for slots in data.values()
+    )
+
+
+def summarize_profile(path, week_start, month):
+    """
+    Computes the weekly and monthly completed/total slot counts for one tracker file.
+    Sealed weeks are read from the profile's archive when it has one.
+    Returns None if the file cannot be read or is not a tracker file.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tracker_data = json.load(f)
+        if not is_tracker_data(tracker_data):
+            return None
+        archive_path = os.path.join(os.path.dirname(path), ARCHIVE_FILE_NAME)
+        if os.path.basename(path) == TRACKER_FILE_NAME and os.path.exists(archive_path):
+            tracker_data = TieredTrackerData(tracker_data, WeekArchive(archive_path))
+    except (OSError, ValueError):
+        return None
+
+    week_days = {(week_start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)}
+    month_start = datetime.strptime(month, "%Y-%m").date()
+    month_days = {
+        (month_start + timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range(31) if (month_start + timedelta(days=i)).strftime("%Y-%m") == month
+    }
+    week_completed = week_total = month_completed = month_total = 0
+    for day in sorted(week_days | month_days):
+        slots = tracker_data.get(day)
+        if slots is None:
+            continue
+        in_week, in_month = day in week_days, day in month_days
+        completed = sum(1 for slot in slots if slot)
+        if in_week:
+            week_completed += completed
+            week_total += len(slots)
+        if in_month:
+            month_completed += completed
+            month_total += len(slots)
+    return ProfileSummary(profile_name(path), week_completed, week_total, month_completed, month_total)
+
+
+def summarize_shard(paths, week_start, month):
+    """
+    Worker entry point: summarizes a shard of profile files, dropping unreadable ones.
+    """
+    summaries = (summarize_profile(path, week_start, month) for path in paths)
+    return [summary for summary in summaries if summary is not None]
+
+
+def _ranking_key(period):
+    if period == "week":
+        return lambda s: (s.week_completed, s.week_completed / s.week_total if s.week_total else 0)
+    return lambda s: (s.month_completed, s.month_completed / s.month_total if s.month_total else 0)
+
+
+def build_leaderboard(
+    paths, top_k=10, period="week", reference_date=None, workers=None, shard_size=SHARD_SIZE, clock=SYSTEM_CLOCK
+):
+    """
+    Summarizes every profile in parallel and returns the top_k summaries for the period.
+    The period is the one containing reference_date, or clock's today if it is not given.
+    """
+    if period not in ("week", "month"):
+        raise ValueError(f"Unknown leaderboard period '{period}'. Expected 'week' or 'month'.")
+    reference_date = reference_date or clock.today()
+    week_start = reference_date - timedelta(days=reference_date.weekday())
+    month = reference_date.strftime("%Y-%m")
+
+    shards = [paths[i:i + shard_size] for i in range(0, len(paths), shard_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(summarize_shard, shards, [week_start] * len(shards), [month] * len(shards))
+        summaries = (summary for shard in results for summary in shard)
+        return heapq.nlargest(top_k, summaries, key=_ranking_key(period))
+
+
+def format_leaderboard(leaders, period="week"):
+    """
+    Formats leaderboard entries as ranked text lines.
+    """
+    lines = []
+    for rank, summary in enumerate(leaders, start=1):
+        completed, total = (
+            (summary.week_completed, summary.week_total) if period == "week"
+            else (summary.month_completed, summary.month_total)
+        )
+        lines.append(f"{rank}. {summary.profile}: {completed}/{total}")
+    return lines
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the team leaderboard.
+    """
+    parser = argparse.ArgumentParser(description="Build a squats leaderboard from tracker files.")
+    parser.add_argument("paths", nargs="+", help="Tracker files or directories of profiles.")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--period", choices=("week", "month"), default="week")
+    parser.add_argument("--date", help="Reference date (YYYY-MM-DD), defaults to today.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes, defaults to the CPU count.")
+    args = parser.parse_args(argv)
+
+    reference_date = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else None
+    leaders = build_leaderboard(find_profiles(args.paths), args.top, args.period, reference_date, args.workers)
+    for line in format_leaderboard(leaders, args.period):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
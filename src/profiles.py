@@ -0,0 +1,105 @@
+"""
+Module for serving several people's trackers from one running app, e.g. on a shared kiosk.
+
+Each profile is a folder under the profiles directory holding that person's tracker, backup,
+log, archive, lock, details and latency files; this is the layout src.leaderboard reads.
+Recently used profiles stay loaded, so switching back to them is instant.
+"""
+
+import os
+from collections import OrderedDict
+from src.tracker import TRACKER_FILE, Tracker
+
+PROFILES_DIR = "profiles"
+DEFAULT_CAPACITY = 4  # Loaded trackers kept in memory
+
+
+class ProfileManager:
+    """
+    Bounded LRU of loaded trackers keyed by profile name. The least recently used tracker
+    is saved if it has unsaved changes, then dropped, when a new profile is loaded past capacity.
+    A tracker whose save fails stays loaded, so its changes are not lost.
+    """
+
+    def __init__(self, root_dir=PROFILES_DIR, capacity=DEFAULT_CAPACITY, clock=None):
+        if capacity < 1:
+            raise ValueError("At least one profile must stay loaded.")
+        self.root_dir = root_dir
+        self.capacity = capacity
+        self.clock = clock
+        self.trackers = OrderedDict()  # Profile name -> Tracker, least recently used first
+
+    def profile_dir(self, name):
+        """
+        Returns the folder of a profile. Names are single folder names, not paths.
+        """
+        name = name.strip()
+        # Checked on every platform: on Windows "C:x" is drive-relative and escapes root_dir
+        if not name or name in (".", "..") or os.path.splitdrive(name)[0] or any(c in name for c in "/\\:"):
+            raise ValueError(f"Invalid profile name: '{name}'.")
+        return os.path.join(self.root_dir, name)
+
+    def names(self):
+        """
+        Returns the sorted names of the profiles on disk and of those loaded but not yet saved.
+        """
+        on_disk = set()
+        if os.path.isdir(self.root_dir):
+            on_disk = {
+                entry for entry in os.listdir(self.root_dir)
+                if os.path.exists(os.path.join(self.root_dir, entry, TRACKER_FILE))
+            }
+        return sorted(on_disk | set(self.trackers))
+
+    def get(self, name):
+        """
+        Returns the tracker of a profile, loading (or creating) it if it is not in memory.
+        """
+        name = name.strip()
+        tracker = self.trackers.get(name)
+        if tracker is not None:
+            self.trackers.move_to_end(name)
+            return tracker
+        tracker = Tracker(self.clock, profile_dir=self.profile_dir(name))
+        self.trackers[name] = tracker
+        while len(self.trackers) > self.capacity:
+            try:
+                self.evict()
+            except OSError as e:
+                print(f"Warning: {e} Keeping more than {self.capacity} profiles loaded.")
+                break
+        return tracker
+
+    def evict(self):
+        """
+        Drops the least recently used tracker after saving its unsaved changes. Returns its name.
+        Raises OSError and keeps the tracker if its changes could not be saved.
+        """
+        name, tracker = next(iter(self.trackers.items()))
+        if tracker.has_unsaved_changes():
+            tracker.save_tracker()
+            if tracker.has_unsaved_changes():
+                raise OSError(f"Could not save profile '{name}'; see its log file.")
+        del self.trackers[name]
+        return name
+
+    def flush_all(self):
+        """
+        Saves every loaded tracker that has unsaved changes, e.g. before the app exits.
+        Returns the names of the profiles that could not be saved.
+        """
+        failed = []
+        for name, tracker in self.trackers.items():
+            if tracker.has_unsaved_changes():
+                tracker.save_tracker()
+                if tracker.has_unsaved_changes():
+                    failed.append(name)
+        return failed
+
+    def use_clock(self, clock):
+        """
+        Makes loaded and future trackers read the time from clock.
+        """
+        self.clock = clock
+        for tracker in self.trackers.values():
+            tracker.clock = clock
@@ -7,14 +7,11 @@ import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
-from src.tracker import Tracker
+from src.clock import SYSTEM_CLOCK
 
 # Configure logging for debugging
 logging.basicConfig(level=logging.DEBUG)
 
-# Create a global instance of Tracker
-tracker = Tracker()
-
 class ReminderConfig:
     """
     Configuration for reminders, including test messages.
@@ -29,52 +26,158 @@ class ReminderConfig:
         ReminderConfig.TEST_CONGRATULATORY_MESSAGE = None
 
 
+SNOOZE_SECONDS = 300
+DEFAULT_INTERVAL_MINUTES = 30
+
+_MANAGER = None  # The NotificationManager of the main window, once it exists
+CLOCK = SYSTEM_CLOCK  # Runs reminders while there is no main window
+
+
+class NotificationManager:
+    """
+    Owns one hidden Toplevel on the main window that is reused for every reminder,
+    snooze and configuration dialog, and schedules reminders on the Tk event loop.
+    """
+
+    def __init__(self, root, on_reminder=None):
+        self.root = root
+        self.on_reminder = on_reminder  # Called with the time every reminder is shown
+        self.pending = None  # after() id of the next reminder
+
+        self.window = tk.Toplevel(root)
+        self.window.withdraw()
+        self.window.geometry("300x170")
+        self.window.configure(bg="#fff0e0")
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+
+        self.message = ttk.Label(self.window, font=("Helvetica", 12), wraplength=250)
+        self.message.pack(pady=20)
+
+        self.reminder_frame = ttk.Frame(self.window)
+        ttk.Button(self.reminder_frame, text="OK", command=self.hide).pack(side="left", padx=10, pady=10)
+        ttk.Button(self.reminder_frame, text="Snooze", command=self.snooze).pack(side="right", padx=10, pady=10)
+
+        self.config_frame = ttk.Frame(self.window)
+        self.interval_var = tk.IntVar(value=DEFAULT_INTERVAL_MINUTES)
+        ttk.Entry(self.config_frame, textvariable=self.interval_var).pack(pady=5)
+        ttk.Button(self.config_frame, text="Save", command=self.save_interval).pack(pady=10)
+
+    def _show(self, title, text, frame):
+        self.window.title(title)
+        self.message.config(text=text)
+        for other in (self.reminder_frame, self.config_frame):
+            if other is not frame:
+                other.pack_forget()
+        frame.pack()
+        self.window.deiconify()
+        self.window.lift()
+
+    def show_reminder(self):
+        """
+        Shows the reminder in the shared window.
+        """
+        self._show("Reminder", "Time to take a break and do some squats!", self.reminder_frame)
+        if self.on_reminder is not None:
+            self.on_reminder(CLOCK.now())
+
+    def show_config(self):
+        """
+        Shows the reminder interval settings in the shared window.
+        """
+        self._show("Configure Reminders", "Set Reminder Interval (minutes):", self.config_frame)
+
+    def hide(self):
+        """
+        Hides the shared window without destroying it.
+        """
+        self.window.withdraw()
+
+    def schedule(self, delay, callback):
+        """
+        Runs callback after delay seconds on the Tk event loop, replacing any pending reminder.
+        """
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+        self.pending = self.root.after(int(delay * 1000), lambda: self._fire(callback))
+        return self.pending
+
+    def _fire(self, callback):
+        self.pending = None
+        callback()
+
+    def snooze(self):
+        """
+        Hides the reminder and shows it again after the snooze delay.
+        """
+        self.hide()
+        schedule_next_reminder(SNOOZE_SECONDS)
+
+    def save_interval(self):
+        """
+        Schedules the next reminder after the entered number of minutes.
+        """
+        interval = self.interval_var.get()
+        schedule_next_reminder(interval * 60)
+        messagebox.showinfo("Success", f"Reminder interval set to {interval} minutes.", parent=self.window)
+        self.hide()
+
+
+def install_notification_manager(root, on_reminder=None):
+    """
+    Builds the shared notification window on the main window. Call once after creating it.
+    on_reminder(fired_at) is called whenever a reminder is shown.
+    """
+    global _MANAGER
+    _MANAGER = NotificationManager(root, on_reminder)
+    return _MANAGER
+
+
+def get_notification_manager():
+    """
+    Returns the installed NotificationManager, or None before the main window exists.
+    """
+    return _MANAGER
+
+
+def use_clock(clock):
+    """
+    Makes reminders scheduled without a main window run on the given clock.
+    """
+    global CLOCK
+    CLOCK = clock
+
+
 def schedule_next_reminder(delay, mock_timer=None):
     """
-    Schedules the next reminder after a specified delay.
+    Schedules the next reminder after a specified delay in seconds.
+    Uses the main window's event loop once the notification manager is installed, else the clock.
     """
-    timer = mock_timer or threading.Timer
-    timer(delay, popup).start()
+    if mock_timer is not None:
+        mock_timer(delay, popup).start()
+    elif _MANAGER is not None:
+        _MANAGER.schedule(delay, popup)
+    else:
+        CLOCK.call_later(delay, popup)
 
 
 def popup():
     """
-    Displays a popup reminder window.
+    Displays the reminder in the shared notification window.
     """
     # Allow popup to be mocked during tests
     if hasattr(popup, "trigger_mock"):
         popup.trigger_mock()  # Trigger mock if set
         return
 
-    if threading.current_thread() != threading.main_thread():
-        print("Warning: popup called from a non-main thread. Scheduling on the main thread.")
-        tk.Tk().after(0, popup)  # Schedule popup on the main thread using a temporary Tk instance
+    if _MANAGER is None:
+        print("Warning: popup called before the main window exists. Skipping reminder.")
         return
 
-    reminder_window = tk.Tk()
-    reminder_window.title("Reminder")
-    reminder_window.geometry("300x150")
-    reminder_window.configure(bg="#fff0e0")
-
-    label = ttk.Label(
-        reminder_window,
-        text="Time to take a break and do some squats!",
-        font=("Helvetica", 12),
-        wraplength=250,
-    )
-    label.pack(pady=20)
-
-    def snooze():
-        reminder_window.destroy()
-        schedule_next_reminder(300)
-
-    ok_button = ttk.Button(reminder_window, text="OK", command=reminder_window.destroy)
-    ok_button.pack(side="left", padx=10, pady=10)
-
-    snooze_button = ttk.Button(reminder_window, text="Snooze", command=snooze)
-    snooze_button.pack(side="right", padx=10, pady=10)
+    if threading.current_thread() != threading.main_thread():
+        _MANAGER.root.after(0, popup)  # Schedule popup on the main thread
+        return
 
-    reminder_window.mainloop()
+    _MANAGER.show_reminder()
 
 
 def set_popup_mock(mock_call):
@@ -92,9 +195,10 @@ def reset_popup_mock():
         del popup.trigger_mock
 
 
-def show_congratulatory_message(status_label=None):
+def show_congratulatory_message(status_label=None, streak=0):
     """
     Displays a congratulatory message on the banner.
+    Streaks longer than one day are celebrated as well.
     """
     messages = [
         "Your squats are shaping a masterpiece!",
@@ -131,6 +235,8 @@ def show_congratulatory_message(status_label=None):
 
     # Use the test message if set, otherwise pick a random one
     message = ReminderConfig.TEST_CONGRATULATORY_MESSAGE or random.choice(messages)
+    if streak > 1:
+        message = f"{message} That's a {streak}-day streak!"
 
     if status_label is not None:
         status_label.config(text=message, foreground="#006600")
@@ -152,26 +258,9 @@ def reset_test_congratulatory_message():
 
 def configure_reminders():
     """
-    Opens a GUI to configure reminder intervals.
+    Opens the reminder interval settings in the shared notification window.
     """
-    config_window = tk.Tk()
-    config_window.title("Configure Reminders")
-    config_window.geometry("300x200")
-
-    label = ttk.Label(config_window, text="Set Reminder Interval (minutes):", font=("Helvetica", 12))
-    label.pack(pady=10)
-
-    interval_var = tk.IntVar(value=30)
-    interval_entry = ttk.Entry(config_window, textvariable=interval_var)
-    interval_entry.pack(pady=5)
-
-    def save_interval():
-        interval = interval_var.get()
-        schedule_next_reminder(interval)
-        messagebox.showinfo("Success", f"Reminder interval set to {interval} minutes.")
-        config_window.destroy()
-
-    save_button = ttk.Button(config_window, text="Save", command=save_interval)
-    save_button.pack(pady=10)
-
-    config_window.mainloop()
+    if _MANAGER is None:
+        print("Warning: configure_reminders called before the main window exists.")
+        return
+    _MANAGER.show_config()
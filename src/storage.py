@@ -0,0 +1,388 @@
+"""
+Module for tiered storage of tracker data.
+
+The current week stays hot as a plain dict that is saved to the tracker JSON file.
+Closed weeks are sealed into an append-only archive of compressed, immutable blocks
+and only decompressed when they are read, through a small LRU of weeks.
+"""
+
+import heapq
+import json
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+ARCHIVE_CACHE_WEEKS = 16  # Enough for the displayed month and both neighbours
+BLOCK_MAGIC = b"SQWK"
+BLOCK_HEADER = struct.Struct("<4s10sBI")  # magic, week start, day mask, payload length
+
+
+def week_start_of(date):
+    """
+    Returns the "YYYY-MM-DD" Monday of the week containing the given date string.
+    """
+    day = datetime.strptime(date, "%Y-%m-%d").date()
+    return (day - timedelta(days=day.weekday())).strftime("%Y-%m-%d")
+
+
+def month_week_starts(year, month):
+    """
+    Returns the Monday week starts of every week that overlaps the given month.
+    """
+    first = datetime(year, month, 1).date()
+    last = (first + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+    week = first - timedelta(days=first.weekday())
+    starts = []
+    while week <= last:
+        starts.append(week.strftime("%Y-%m-%d"))
+        week += timedelta(days=7)
+    return starts
+
+
+def adjacent_months(year, month):
+    """
+    Returns the (year, month) pairs before and after the given month.
+    """
+    previous = (year - 1, 12) if month == 1 else (year, month - 1)
+    following = (year + 1, 1) if month == 12 else (year, month + 1)
+    return [previous, following]
+
+
+def _week_days(week):
+    start = datetime.strptime(week, "%Y-%m-%d").date()
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+
+
+def _parse_header(header):
+    """
+    Returns (week, day mask, payload length) of a block header, or None if it is not one.
+    """
+    if len(header) < BLOCK_HEADER.size:
+        return None
+    magic, week, mask, length = BLOCK_HEADER.unpack(header)
+    if magic != BLOCK_MAGIC:
+        return None
+    try:
+        week = week.decode("ascii")
+        datetime.strptime(week, "%Y-%m-%d")
+    except ValueError:
+        return None
+    return week, mask, length
+
+
+def _find_block(f, start):
+    """
+    Returns the offset of the next valid block header at or after start, or None.
+    """
+    f.seek(start)
+    data = f.read()
+    found = data.find(BLOCK_MAGIC)
+    while found >= 0:
+        if _parse_header(data[found:found + BLOCK_HEADER.size]) is not None:
+            return start + found
+        found = data.find(BLOCK_MAGIC, found + 1)
+    return None
+
+
+class WeekArchive:
+    """
+    Append-only file of sealed weeks. A week sealed again later supersedes its older block.
+    Nothing is read at construction; the header index is built on the first cold lookup.
+    The lock makes it safe to prefetch weeks from a background thread.
+    """
+
+    def __init__(self, path, cache_size=ARCHIVE_CACHE_WEEKS):
+        self.path = path
+        self.cache_size = cache_size
+        self.index = {}  # Week start -> (payload offset, payload length, day mask)
+        self.scanned_to = 0
+        self.file_id = None  # (device, inode) of the indexed file; clear() removes it
+        self.cache = OrderedDict()
+        self.lock = threading.RLock()
+
+    def refresh(self):
+        """
+        Indexes any blocks appended since the last scan, reading headers only.
+        If another instance cleared the archive, the index is rebuilt from the new file.
+        Damaged bytes are skipped up to the next block header. A truncated or damaged tail
+        stays beyond scanned_to, where the next seal overwrites it.
+        """
+        with self.lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                stat = None
+            file_id = (stat.st_dev, stat.st_ino) if stat else None
+            if file_id != self.file_id or (stat and stat.st_size < self.scanned_to):
+                self._forget()
+                self.file_id = file_id
+            if stat is None or stat.st_size == self.scanned_to:
+                return
+        with self.lock, open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            position = self.scanned_to
+            while position + BLOCK_HEADER.size <= size:
+                f.seek(position)
+                block = _parse_header(f.read(BLOCK_HEADER.size))
+                if block is not None and position + BLOCK_HEADER.size + block[2] <= size:
+                    week, mask, length = block
+                    self.index[week] = (position + BLOCK_HEADER.size, length, mask)
+                    self.cache.pop(week, None)
+                    position = self.scanned_to = position + BLOCK_HEADER.size + length
+                    continue
+                next_block = _find_block(f, position + 1)
+                if next_block is None:
+                    break
+                print(f"Warning: skipped {next_block - position} damaged bytes in {self.path}.")
+                position = next_block
+
+    def _forget(self):
+        self.index.clear()
+        self.cache.clear()
+        self.scanned_to = 0
+
+    def clear(self):
+        """
+        Deletes every archived week, e.g. when the tracker is reset. Call with the tracker's file lock held.
+        """
+        with self.lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._forget()
+            self.file_id = None
+
+    def weeks(self):
+        """
+        Returns the archived week starts in chronological order.
+        """
+        self.refresh()
+        return sorted(self.index)
+
+    def has_week(self, week):
+        """
+        Returns True if the week has been sealed into the archive.
+        """
+        if week not in self.index:
+            self.refresh()
+        return week in self.index
+
+    def days_in(self, week):
+        """
+        Returns the dates present in an archived week without decompressing it.
+        """
+        mask = self.index.get(week, (0, 0, 0))[2]  # A week found damaged meanwhile has no days
+        return [day for i, day in enumerate(_week_days(week)) if mask & (1 << i)]
+
+    def read_week(self, week, cache=True):
+        """
+        Returns {date: tuple of slots} for an archived week, or None if it is not archived.
+        Pass cache=False for one-off scans that should not evict the working set.
+        """
+        with self.lock:
+            if week in self.cache:
+                self.cache.move_to_end(week)
+                return self.cache[week]
+            if not self.has_week(week):
+                return None
+            offset, length, _ = self.index[week]
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                raw = f.read(length)
+            try:
+                payload = json.loads(zlib.decompress(raw))
+                days = {day: tuple(slots) for day, slots in zip(_week_days(week), payload) if slots is not None}
+            except (zlib.error, ValueError, TypeError) as e:
+                # Keep the app usable: the damaged week is left out until it is sealed again
+                print(f"Warning: archived week {week} in {self.path} is corrupted and was skipped ({e}).")
+                del self.index[week]
+                return None
+            if cache:
+                self.cache[week] = days
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+            return days
+
+    def seal(self, week, days):
+        """
+        Appends an immutable compressed block holding the given days of a week.
+        """
+        with self.lock:
+            self._append(week, days)
+
+    def _append(self, week, days):
+        self.refresh()
+        slots_by_day = [days.get(day) for day in _week_days(week)]
+        mask = sum(1 << i for i, slots in enumerate(slots_by_day) if slots is not None)
+        payload = zlib.compress(json.dumps(slots_by_day, separators=(",", ":")).encode("utf-8"))
+        with open(self.path, "ab") as f:
+            if self.file_id is None:
+                stat = os.fstat(f.fileno())
+                self.file_id = (stat.st_dev, stat.st_ino)
+            if f.tell() > self.scanned_to:
+                f.truncate(self.scanned_to)  # Drop a truncated or damaged tail before appending
+                f.seek(self.scanned_to)
+            f.write(BLOCK_HEADER.pack(BLOCK_MAGIC, week.encode("ascii"), mask, len(payload)) + payload)
+            f.flush()
+            os.fsync(f.fileno())
+        self.index[week] = (self.scanned_to + BLOCK_HEADER.size, len(payload), mask)
+        self.scanned_to += BLOCK_HEADER.size + len(payload)
+        self.cache.pop(week, None)
+
+
+class TieredTrackerData(MutableMapping):
+    """
+    Mapping of date -> slots that serves the hot dict first and falls back to the archive.
+    Archived days are returned as tuples; use thaw() to get a writable list.
+    Deleting an archived day hides it until its week is sealed again without it.
+    """
+
+    def __init__(self, hot, archive):
+        self.hot = hot
+        self.archive = archive
+        self.deleted = set()  # Archived days deleted since their week was last sealed
+
+    def _archived_week(self, date):
+        week = week_start_of(date)
+        return week, (self.archive.read_week(week) if self.archive is not None else None)
+
+    def __getitem__(self, date):
+        if date in self.hot:
+            return self.hot[date]
+        if date in self.deleted:
+            raise KeyError(date)
+        days = self._archived_week(date)[1]
+        if days is None or date not in days:
+            raise KeyError(date)
+        return days[date]
+
+    def __setitem__(self, date, slots):
+        if date not in self.hot:
+            self.thaw(date)  # Keep the rest of an archived week together when it is sealed again
+        self.deleted.discard(date)
+        self.hot[date] = slots
+
+    def __delitem__(self, date):
+        if date not in self:
+            raise KeyError(date)
+        self.hot.pop(date, None)
+        if self._in_archive(date):
+            self.deleted.add(date)
+
+    def _in_archive(self, date):
+        if self.archive is None:
+            return False
+        week = week_start_of(date)
+        return self.archive.has_week(week) and date in self.archive.days_in(week)
+
+    def __contains__(self, date):
+        return date in self.hot or (date not in self.deleted and self._in_archive(date))
+
+    def _archived_only(self):
+        if self.archive is None:
+            return
+        for week in self.archive.weeks():
+            for day in self.archive.days_in(week):
+                if day not in self.hot and day not in self.deleted:
+                    yield day
+
+    def __iter__(self):
+        yield from self._archived_only()
+        yield from list(self.hot)
+
+    def scan(self, start=None, end=None):
+        """
+        Yields every (date, slots) pair in date order, one archived week in memory at a time
+        and without filling the week cache. With start and/or end ("YYYY-MM-DD"), only those
+        days are yielded and only the archived weeks overlapping them are read.
+        """
+        def wanted(day):
+            return (start is None or day >= start) and (end is None or day <= end)
+
+        hot = sorted((day, slots) for day, slots in list(self.hot.items()) if wanted(day))
+        yield from heapq.merge(self._scan_archive(start, end, wanted), hot, key=itemgetter(0))
+
+    def _scan_archive(self, start, end, wanted):
+        if self.archive is None:
+            return
+        first_week = week_start_of(start) if start else None
+        for week in self.archive.weeks():
+            if (first_week is not None and week < first_week) or (end is not None and week > end):
+                continue
+            for day, slots in (self.archive.read_week(week, cache=False) or {}).items():
+                if day not in self.hot and day not in self.deleted and wanted(day):
+                    yield day, slots
+
+    def __len__(self):
+        return len(self.hot) + sum(1 for _ in self._archived_only())
+
+    def clear(self):
+        """
+        Deletes every day in one pass; archived weeks are emptied when they are sealed again.
+        """
+        self.hot.clear()
+        self.deleted.update(self._archived_only())
+
+    def __repr__(self):
+        return repr(self.hot)
+
+    def month(self, year, month):
+        """
+        Pages in the archived weeks overlapping a month and returns that month's {date: slots}.
+        """
+        prefix = f"{year:04d}-{month:02d}"
+        page = {}
+        if self.archive is not None:
+            for week in month_week_starts(year, month):
+                for day, slots in (self.archive.read_week(week) or {}).items():
+                    if day.startswith(prefix) and day not in self.deleted:
+                        page[day] = slots
+        page.update((day, slots) for day, slots in list(self.hot.items()) if day.startswith(prefix))
+        return page
+
+    def thaw(self, date):
+        """
+        Moves the archived week containing date into the hot tier and returns its slots list,
+        or None if the date is not stored anywhere.
+        """
+        if date in self.hot:
+            return self.hot[date]
+        if date in self.deleted:
+            return None
+        days = self._archived_week(date)[1]
+        if not days:
+            return None
+        for day, slots in days.items():
+            if day not in self.deleted:
+                self.hot.setdefault(day, list(slots))
+        return self.hot.get(date)
+
+    def seal_closed_weeks(self, current_week_start):
+        """
+        Seals every hot week that started before current_week_start into the archive,
+        and seals again the archived weeks that had days deleted, without those days.
+        """
+        if self.archive is None:
+            return []
+        closed = {}
+        for day in self.hot:
+            week = week_start_of(day)
+            if week < current_week_start:
+                closed.setdefault(week, {})[day] = self.hot[day]
+        for day in self.deleted:
+            week = week_start_of(day)
+            if week < current_week_start:
+                closed.setdefault(week, {})
+        for week, days in sorted(closed.items()):
+            # Hot days may only cover part of an archived week (e.g. after a log replay)
+            archived = self.archive.read_week(week, cache=False) or {}
+            kept = {day: slots for day, slots in {**archived, **days}.items() if day not in self.deleted}
+            self.archive.seal(week, kept)
+            for day in days:
+                del self.hot[day]
+        self.deleted = {day for day in self.deleted if week_start_of(day) not in closed}
+        return sorted(closed)
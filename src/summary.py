@@ -0,0 +1,166 @@
+"""
+Module for the virtualized progress summary window.
+Rows are computed lazily from the date range, and only the visible ones become Treeview items.
+"""
+
+from array import array
+from datetime import timedelta
+import tkinter as tk
+from tkinter import ttk
+
+VISIBLE_ROWS = 15
+STATUS_NAMES = {"completed": "Completed", "incomplete": "Partial", "missed": "Missed", None: "No data"}
+FILTERS = ["All", "Completed", "Partial", "Missed", "No data"]
+
+
+class RangeRows:
+    """
+    Lazy row source for every date in [start_date, end_date].
+    lookup(date_str) returns a DayAggregate or None; it is only called for rows that are read.
+    """
+
+    def __init__(self, start_date, end_date, lookup):
+        self.start_date = start_date
+        self.days = max(0, (end_date - start_date).days + 1)
+        self.lookup = lookup
+        self.order = range(self.days)  # Row position -> day offset; identity until sorted or filtered
+
+    def __len__(self):
+        return len(self.order)
+
+    def _day(self, offset):
+        date_str = (self.start_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+        return date_str, self.lookup(date_str)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self.row(position)
+
+    def row(self, position):
+        """
+        Returns (date, progress text, status text) for the row at position.
+        """
+        date_str, aggregate = self._day(self.order[position])
+        if aggregate is None:
+            return date_str, "No data", STATUS_NAMES[None]
+        return date_str, f"{aggregate.completed}/{aggregate.total}", STATUS_NAMES[aggregate.mark]
+
+    def _scan(self):
+        """
+        Streams every day once, returning compact (completed count, status) columns.
+        A completed count of -1 means no data.
+        """
+        counts = array("h", bytes(2 * self.days))
+        statuses = bytearray(self.days)
+        status_codes = {name: code for code, name in enumerate(FILTERS)}
+        for offset in range(self.days):
+            aggregate = self._day(offset)[1]
+            if aggregate is None:
+                counts[offset] = -1
+                statuses[offset] = status_codes["No data"]
+            else:
+                counts[offset] = aggregate.completed
+                statuses[offset] = status_codes[STATUS_NAMES[aggregate.mark]]
+        return counts, statuses
+
+    def arrange(self, sort_by="date", descending=False, status_filter="All"):
+        """
+        Reorders and filters the rows. Sorting by date with no filter needs no scan.
+        """
+        if sort_by == "date" and status_filter == "All":
+            self.order = range(self.days - 1, -1, -1) if descending else range(self.days)
+            return
+        counts, statuses = self._scan()
+        wanted = FILTERS.index(status_filter)
+        offsets = [offset for offset in range(self.days) if not wanted or statuses[offset] == wanted]
+        if sort_by == "progress":
+            offsets.sort(key=counts.__getitem__, reverse=descending)
+        elif descending:
+            offsets.reverse()
+        self.order = array("I", offsets)
+
+
+class VirtualSummary:
+    """
+    Treeview that keeps a fixed number of items and refills them as the user scrolls.
+    """
+
+    def __init__(self, parent, rows):
+        self.rows = rows
+        self.first = 0
+        self.sort_by = "date"
+        self.descending = False
+
+        controls = ttk.Frame(parent)
+        controls.pack(fill="x", padx=10)
+        ttk.Label(controls, text="Show:").pack(side="left")
+        self.filter_var = tk.StringVar(value="All")
+        filter_box = ttk.Combobox(controls, textvariable=self.filter_var, values=FILTERS, state="readonly", width=10)
+        filter_box.pack(side="left", padx=5)
+        filter_box.bind("<<ComboboxSelected>>", lambda event: self.rearrange())
+        self.count_label = ttk.Label(controls, text="")
+        self.count_label.pack(side="right")
+
+        body = ttk.Frame(parent)
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+        self.tree = ttk.Treeview(body, columns=("date", "progress", "status"), show="headings", height=VISIBLE_ROWS)
+        for column, heading in (("date", "Date"), ("progress", "Progress"), ("status", "Status")):
+            self.tree.heading(column, text=heading, command=lambda c=column: self.sort(c))
+            self.tree.column(column, width=110, anchor="w")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.items = [self.tree.insert("", "end", values=("", "", "")) for _ in range(VISIBLE_ROWS)]
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll_to(self.first - event.delta // 120))
+        self.tree.bind("<Button-4>", lambda event: self.scroll_to(self.first - 1))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_to(self.first + 1))
+        self.refresh()
+
+    def sort(self, column):
+        """
+        Sorts by the clicked column, toggling direction on repeated clicks.
+        """
+        sort_by = "progress" if column == "progress" else "date"
+        self.descending = not self.descending if sort_by == self.sort_by else False
+        self.sort_by = sort_by
+        self.rearrange()
+
+    def rearrange(self):
+        """
+        Applies the current sort and filter and scrolls back to the top.
+        """
+        self.rows.arrange(self.sort_by, self.descending, self.filter_var.get())
+        self.first = 0
+        self.refresh()
+
+    def on_scroll(self, action, value, unit=None):
+        """
+        Handles scrollbar drags ("moveto") and clicks ("scroll").
+        """
+        if action == "moveto":
+            self.scroll_to(int(float(value) * len(self.rows)))
+        elif action == "scroll":
+            step = VISIBLE_ROWS if unit == "pages" else 1
+            self.scroll_to(self.first + int(value) * step)
+
+    def scroll_to(self, first):
+        """
+        Moves the visible window so that it starts at row first.
+        """
+        self.first = max(0, min(first, len(self.rows) - VISIBLE_ROWS))
+        self.refresh()
+
+    def refresh(self):
+        """
+        Refills the fixed set of Treeview items with the rows in the visible window.
+        """
+        total = len(self.rows)
+        for index, item in enumerate(self.items):
+            position = self.first + index
+            self.tree.item(item, values=self.rows.row(position) if position < total else ("", "", ""))
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + VISIBLE_ROWS) / total))
+        else:
+            self.scrollbar.set(0, 1)
+        self.count_label.config(text=f"{total} days")
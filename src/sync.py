@@ -0,0 +1,182 @@
+"""
+Module for keeping several running copies of the app in sync on one tracker file.
+
+FileLock serializes commits between processes, content digests are the optimistic
+version check, and TrackerWatcher reports external changes through inotify on Linux or by
+polling elsewhere.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+POLL_INTERVAL = 1.0  # Seconds between checks when inotify is unavailable
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+class FileLock:
+    """
+    Advisory inter-process lock held on a separate lock file for the duration of a with block.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = None
+
+    def __enter__(self):
+        self.handle = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+        else:
+            self.handle.seek(0)
+            msvcrt.locking(self.handle.fileno(), msvcrt.LK_LOCK, 1)  # Retries for up to 10 seconds
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+            else:
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self.handle.close()
+            self.handle = None
+
+
+def content_digest(raw):
+    """
+    Returns the version token for a file's bytes.
+    """
+    return hashlib.sha256(raw).hexdigest()
+
+
+def file_digest(path):
+    """
+    Returns the version token of a file, or None if it does not exist.
+    """
+    try:
+        with open(path, "rb") as f:
+            return content_digest(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class TrackerWatcher:
+    """
+    Calls on_change from a background thread whenever the watched file is replaced or rewritten.
+    Uses inotify on the file's directory (os.replace swaps the inode) and falls back to polling.
+    """
+
+    def __init__(self, path, on_change, poll_interval=POLL_INTERVAL, use_inotify=True):
+        self.path = os.path.abspath(path)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.stopped = threading.Event()
+        self.thread = None
+        self.mode = None
+        self.last_stat = None
+        self.wake_fd = None  # Write end of the pipe that interrupts the inotify select on stop()
+
+    def start(self):
+        """
+        Starts watching on a daemon thread.
+        """
+        inotify_fd = self._open_inotify() if self.use_inotify else None
+        self.last_stat = self._stat()  # Taken before returning so no change after start() is missed
+        self.mode = "inotify" if inotify_fd is not None else "polling"
+        if inotify_fd is not None:
+            wake_read, self.wake_fd = os.pipe()
+            self.thread = threading.Thread(target=self._watch_inotify, args=(inotify_fd, wake_read), daemon=True)
+        else:
+            self.thread = threading.Thread(target=self._watch_polling, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops watching and waits for the thread to exit, which it does right away.
+        """
+        self.stopped.set()
+        if self.wake_fd is not None:
+            os.write(self.wake_fd, b"\0")
+            os.close(self.wake_fd)
+            self.wake_fd = None
+        if self.thread:
+            self.thread.join()
+
+    def _open_inotify(self):
+        libc = _load_inotify()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(IN_CLOEXEC)
+        if fd < 0:
+            return None
+        directory = os.path.dirname(self.path).encode()
+        if libc.inotify_add_watch(fd, directory, IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _watch_inotify(self, fd, wake_fd):
+        name = os.path.basename(self.path).encode()
+        try:
+            while not self.stopped.is_set():
+                readable, _, _ = select.select([fd, wake_fd], [], [], self.poll_interval)
+                if fd not in readable:
+                    continue
+                buffer = os.read(fd, 4096)
+                changed, offset = False, 0
+                while offset < len(buffer):
+                    _, _, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+                    offset += INOTIFY_EVENT.size
+                    changed |= buffer[offset:offset + length].rstrip(b"\0") == name
+                    offset += length
+                if changed:
+                    self.on_change()
+        finally:
+            os.close(fd)
+            os.close(wake_fd)
+
+    def _watch_polling(self):
+        while not self.stopped.wait(self.poll_interval):
+            current = self._stat()
+            if current != self.last_stat:
+                self.last_stat = current
+                self.on_change()
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            return None
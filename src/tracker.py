@@ -4,33 +4,138 @@ Module for tracking squats progress.
 
 import os
 import json
+import threading
 from datetime import datetime, timedelta
 from shutil import copyfile
+from src.aggregates import AggregateCache
+from src.analytics import StreakAnalytics
+from src.clock import SYSTEM_CLOCK
+from src.details import DetailStore, check_details
+from src.events import DataReplaced, DayAdded, DaysReloaded, EventBus, SlotChanged
+from src.history import rebuild_tracker_data
+from src.latency import LATENCY_FILE, LatencyStore
+from src.storage import TieredTrackerData, WeekArchive, adjacent_months, month_week_starts, week_start_of
+from src.sync import FileLock, content_digest, file_digest
+from src.viewmodel import slot_time
 
 # Constants
 TRACKER_FILE = "squats_tracker.json"
 BACKUP_FILE = "squats_tracker_backup.json"  # Backup file for robustness
 LOG_FILE = "squats_log.txt"
+ARCHIVE_FILE = "squats_archive.dat"  # Sealed past weeks, see src/storage.py
+LOCK_FILE = f"{TRACKER_FILE}.lock"  # Serializes commits between running instances
+DETAILS_FILE = "squats_details.dat"  # Reps, durations and completion times, see src/details.py
 time_slots = [
     "8:00 AM", "8:45 AM", "9:30 AM", "10:15 AM", "11:00 AM", "11:45 AM",
     "12:30 PM", "1:15 PM", "2:00 PM", "2:45 PM", "3:30 PM", "4:15 PM", "5:00 PM"
 ]
 
+
+def profile_path(profile_dir, file_name):
+    """
+    Returns the path of one of a profile's files. Without a profile directory the files
+    live in the working directory, as they always have.
+    """
+    return os.path.join(profile_dir, file_name) if profile_dir else file_name
+
+
 class Tracker:
     """
     Class for managing squats progress tracking.
+    All files of one person live in profile_dir, which is created if needed.
     """
 
-    def __init__(self):
-        self.tracker_data = {}
+    def __init__(self, clock=None, profile_dir=None):
+        self.clock = clock or SYSTEM_CLOCK  # Where "now" comes from; a VirtualClock replays days instantly
+        self.profile_dir = profile_dir
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+        self.tracker_file = profile_path(profile_dir, TRACKER_FILE)
+        self.backup_file = profile_path(profile_dir, BACKUP_FILE)
+        self.log_file = profile_path(profile_dir, LOG_FILE)
+        self.archive_file = profile_path(profile_dir, ARCHIVE_FILE)
+        self.lock_file = profile_path(profile_dir, LOCK_FILE)
+        self.archive = WeekArchive(self.archive_file)
+        self._tracker_data = TieredTrackerData({}, self.archive)
+        self.details = DetailStore(profile_path(profile_dir, DETAILS_FILE), len(time_slots))
+        self.latency = LatencyStore(profile_path(profile_dir, LATENCY_FILE))
+        self.revision = 0  # Bumped on every change, so background work can detect it went stale
+        self.dirty_days = set()  # Days replaced here as a whole since the last save; they win over external edits
+        self.dirty_slots = {}  # Date -> slot indexes changed here since the last save; they win over external edits
+        self.disk_digest = None  # Digest of the tracker file as last read or written by this instance
+        self.events = EventBus()
+        self.aggregates = AggregateCache(self)
+        self.analytics = StreakAnalytics(self, len(time_slots))
+        # Derived state follows the data through the bus. The lambdas look the subscribers up
+        # on every event, so the UI can swap in analytics rebuilt on a background thread.
+        self.events.subscribe(SlotChanged, lambda event: self.aggregates.invalidate_day(event.date))
+        self.events.subscribe(SlotChanged, lambda event: self.analytics.slot_changed(*event))
+        self.events.subscribe(DayAdded, lambda event: self.aggregates.invalidate_day(event.date))
+        self.events.subscribe(DayAdded, lambda event: self.analytics.day_added(event.date))
+        self.events.subscribe(DaysReloaded, self._invalidate_days)
+        self.events.subscribe(DataReplaced, lambda event: (self.aggregates.clear(), self.analytics.invalidate()))
         self.load_tracker()
 
+    def _invalidate_days(self, event):
+        for date in event.dates:
+            self.aggregates.invalidate_day(date)
+        self.analytics.invalidate()
+
+    def has_unsaved_changes(self):
+        """
+        Returns True if slots, details or latency samples changed since the last save.
+        """
+        return bool(self.dirty_days or self.dirty_slots or self.details.dirty or self.latency.delta_slots)
+
+    def publish(self, event):
+        """
+        Bumps the revision and notifies the subscribers of a change to the tracker data.
+        """
+        self.revision += 1
+        self.events.publish(event)
+
+    @property
+    def tracker_data(self):
+        """
+        The per-day slot completion lists, keyed by "YYYY-MM-DD".
+        Only the current week is held in memory; sealed weeks are read from the archive.
+        """
+        return self._tracker_data
+
+    @tracker_data.setter
+    def tracker_data(self, value):
+        # Replacing the data wholesale is a bulk import: every derived statistic is stale
+        if not isinstance(value, TieredTrackerData):
+            value = TieredTrackerData(value, self.archive)
+        self._tracker_data = value
+        self.dirty_days = set(value.hot)
+        self.publish(DataReplaced())
+
+    def load_month(self, year, month):
+        """
+        Returns {date: slots} for a month, paging its archived weeks in on demand.
+        """
+        return self.tracker_data.month(year, month)
+
+    def prefetch_months(self, year, month):
+        """
+        Pages in the archived weeks of the months around the given one on a background thread.
+        """
+        def prefetch():
+            for adjacent_year, adjacent_month in adjacent_months(year, month):
+                for week in month_week_starts(adjacent_year, adjacent_month):
+                    self.archive.read_week(week)
+
+        thread = threading.Thread(target=prefetch, daemon=True)
+        thread.start()
+        return thread
+
     def initialize_tracker(self, start_date=None):
         """
         Initializes the tracker data for the current week or a given start_date.
         """
         if start_date is None:
-            today = datetime.now().date()
+            today = self.clock.today()
             start_date = today - timedelta(days=today.weekday())
         else:
             start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -47,8 +152,8 @@ class Tracker:
         Logs a message to the log file with a timestamp.
         """
         try:
-            with open(LOG_FILE, "a", encoding="utf-8") as log:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            with open(self.log_file, "a", encoding="utf-8") as log:
+                timestamp = self.clock.now().strftime('%Y-%m-%d %H:%M:%S')
                 log.write(f"{timestamp}: {message}\n")
         except (OSError, IOError) as e:
             print(f"Error writing to log file: {e}")
@@ -66,30 +171,57 @@ class Tracker:
             print(f"Error: Slot index {slot_index} is out of range.")
             return
 
-        self.tracker_data[date][slot_index] = True  # Mark the slot as completed
+        slots = self.tracker_data.thaw(date)
+        previous = slots[slot_index]
+        slots[slot_index] = True  # Mark the slot as completed
+        now = self.clock.now()
+        self.details.set_slot(date, slot_index, completed_at=now.timestamp())
+        if not previous:
+            self._record_latency(date, slot_index, now)
+        self.dirty_slots.setdefault(date, set()).add(slot_index)
+        self.publish(SlotChanged(date, slot_index, previous, True))
         self.log_message(f"Progress updated for {date}, slot {slot_index}. Current tracker data: {self.tracker_data[date]}")
         self.save_tracker()
 
-    def mark_as_completed(self, date, slot_index, completed=True):
+    def mark_as_completed(self, date, slot_index, completed=True, reps=0, duration=0):
         """
         Marks a specific time slot as completed or not completed for the given date.
+        A completed slot also records its rep count, set duration in seconds and completion time.
         Ensures the tracker data is updated and saved reliably.
         """
         # Debug log: State of tracker_data before update
         self.log_message(f"Before update: tracker_data[{date}] = {self.tracker_data.get(date, 'Not Found')}")
 
+        # Validate the slot index and details before anything is changed
+        if not (0 <= slot_index < len(time_slots)):
+            self.log_message(f"Error: Slot index {slot_index} is out of range.")
+            raise ValueError(f"Slot index {slot_index} is out of range.")
+        if completed:
+            try:
+                check_details(reps, duration)
+            except ValueError as e:
+                self.log_message(f"Error: {e}")
+                raise
+
         # Ensure the date exists in tracker_data
         if date not in self.tracker_data:
             self.tracker_data[date] = [False] * len(time_slots)
+            self.publish(DayAdded(date))
             self.log_message(f"Date {date} not found in tracker data. Initialized with default values.")
 
-        # Validate the slot index
-        if not (0 <= slot_index < len(time_slots)):
-            self.log_message(f"Error: Slot index {slot_index} is out of range.")
-            raise ValueError(f"Slot index {slot_index} is out of range.")
-
         # Update the completion status
-        self.tracker_data[date][slot_index] = completed
+        slots = self.tracker_data.thaw(date)
+        previous = slots[slot_index]
+        if completed:
+            now = self.clock.now()
+            self.details.set_slot(date, slot_index, reps, duration, now.timestamp())
+            if not previous:
+                self._record_latency(date, slot_index, now)
+        else:
+            self.details.clear_slot(date, slot_index)
+        slots[slot_index] = completed
+        self.dirty_slots.setdefault(date, set()).add(slot_index)
+        self.publish(SlotChanged(date, slot_index, previous, completed))
         action = "completed" if completed else "not completed"
         self.log_message(f"User marked slot {slot_index} on {date} as {action}. Current tracker data: {self.tracker_data[date]}")
 
@@ -99,21 +231,61 @@ class Tracker:
         # Save the updated tracker data
         self.save_tracker()
 
+    def _slot_start(self, date, slot_index):
+        hour, minute = slot_time(time_slots[slot_index])
+        return datetime.strptime(date, "%Y-%m-%d").replace(hour=hour, minute=minute)
+
+    def reminder_fired(self, fired_at=None):
+        """
+        Records that a reminder was shown. It counts as the reminder of every slot of today that
+        has started and is still open, unless an earlier reminder already covered that slot.
+        """
+        fired_at = fired_at or self.clock.now()
+        date = fired_at.strftime("%Y-%m-%d")
+        slots = self.tracker_data.get(date) or [False] * len(time_slots)
+        for slot_index, completed in enumerate(slots):
+            if not completed and self._slot_start(date, slot_index) <= fired_at:
+                self.latency.reminder_fired(date, slot_index, fired_at.timestamp())
+
+    def _record_latency(self, date, slot_index, now):
+        # Only same-day completions measure responsiveness; back-filled days are skipped
+        if now.strftime("%Y-%m-%d") != date:
+            return
+        self.latency.record_completion(
+            date, week_start_of(date), slot_index, self._slot_start(date, slot_index).timestamp(), now.timestamp()
+        )
+
     def save_tracker(self):
         """
         Saves the tracker data to a JSON file for persistence.
+        Closed weeks are sealed into the archive first, so the JSON file only holds the hot tier.
         Creates a backup before overwriting the main file.
+        The commit holds the inter-process lock, and days another instance saved since our last
+        read are merged in first so its changes are not overwritten.
         """
         try:
-            if os.path.exists(TRACKER_FILE):
-                copyfile(TRACKER_FILE, BACKUP_FILE)
+            with FileLock(self.lock_file):
+                self._merge_disk_changes()
+                today = self.clock.now().strftime("%Y-%m-%d")
+                sealed = self.tracker_data.seal_closed_weeks(week_start_of(today))
+                if sealed:
+                    self.log_message(f"Sealed weeks into {self.archive_file}: {', '.join(sealed)}")
 
-            temp_file = f"{TRACKER_FILE}.tmp"
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(self.tracker_data, f, indent=4)
-            os.replace(temp_file, TRACKER_FILE)
+                if os.path.exists(self.tracker_file):
+                    copyfile(self.tracker_file, self.backup_file)
+
+                temp_file = f"{self.tracker_file}.tmp"
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(self.tracker_data.hot, f, indent=4)
+                digest = file_digest(temp_file)
+                os.replace(temp_file, self.tracker_file)
+                self.disk_digest = digest
+                self.dirty_days.clear()
+                self.dirty_slots.clear()
+                self.details.flush()
+                self.latency.flush()
         except PermissionError:
-            self.log_message(f"Permission denied when saving to {TRACKER_FILE}.")
+            self.log_message(f"Permission denied when saving to {self.tracker_file}.")
         except (OSError, IOError) as e:
             self.log_message(f"Error saving tracker data: {e}")
 
@@ -123,13 +295,17 @@ class Tracker:
         Falls back to the backup file if the main file is corrupted.
         """
         try:
-            if os.path.exists(TRACKER_FILE):
-                with open(TRACKER_FILE, "r", encoding="utf-8") as f:
-                    self.tracker_data = json.load(f)
+            if os.path.exists(self.tracker_file):
+                with open(self.tracker_file, "rb") as f:
+                    raw = f.read()
+                self.tracker_data = json.loads(raw)
+                self.disk_digest = content_digest(raw)
+                self.dirty_days.clear()
+                self.dirty_slots.clear()
                 self.log_message(f"Tracker data loaded from file: {self.tracker_data}")
-            elif os.path.exists(BACKUP_FILE):
+            elif os.path.exists(self.backup_file):
                 self.log_message("Main tracker file not found. Attempting to load from backup.")
-                with open(BACKUP_FILE, "r", encoding="utf-8") as f:
+                with open(self.backup_file, "r", encoding="utf-8") as f:
                     self.tracker_data = json.load(f)
                 self.log_message(f"Tracker data loaded from backup: {self.tracker_data}")
             else:
@@ -138,29 +314,124 @@ class Tracker:
                 self.save_tracker()
         except json.JSONDecodeError:
             self.log_message("Error: Tracker file is corrupted. Attempting to load from backup.")
-            if os.path.exists(BACKUP_FILE):
-                with open(BACKUP_FILE, "r", encoding="utf-8") as f:
-                    self.tracker_data = json.load(f)
-                self.log_message(f"Tracker data loaded from backup: {self.tracker_data}")
-            else:
-                self.log_message("Backup file not found. Reinitializing tracker data.")
+            try:
+                if os.path.exists(self.backup_file):
+                    with open(self.backup_file, "r", encoding="utf-8") as f:
+                        self.tracker_data = json.load(f)
+                    self.log_message(f"Tracker data loaded from backup: {self.tracker_data}")
+                    return
+                self.log_message("Backup file not found. Attempting to rebuild from log.")
+            except json.JSONDecodeError:
+                self.log_message("Error: Backup file is corrupted. Attempting to rebuild from log.")
+            if not self.rebuild_from_log():
+                self.log_message("Log replay found no data. Reinitializing tracker data.")
                 self.initialize_tracker()
                 self.save_tracker()
         except (OSError, IOError) as e:
             self.log_message(f"Error loading tracker data: {e}")
             self.initialize_tracker()  # Fallback to reinitialize tracker data
 
+    def reload_external_changes(self):
+        """
+        Merges the days another instance changed in the tracker file into memory.
+        Unsaved local edits are kept. Returns the changed dates, for the UI to repaint.
+        """
+        try:
+            with FileLock(self.lock_file):
+                return self._merge_disk_changes()
+        except (OSError, IOError) as e:
+            self.log_message(f"Error reloading tracker data: {e}")
+            return []
+
+    def _merge_disk_changes(self):
+        # Optimistic check: nothing to merge if the file is still the version we last read or wrote
+        try:
+            with open(self.tracker_file, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return []
+        digest = content_digest(raw)
+        if digest == self.disk_digest:
+            return []
+        try:
+            disk_data = json.loads(raw)
+        except json.JSONDecodeError:
+            self.log_message("Error: Tracker file changed on disk but is not valid JSON. Keeping local data.")
+            return []
+
+        self.archive.refresh()  # Weeks the other instance sealed supersede our cached copies
+        changed = [
+            day for day in self.tracker_data.hot
+            if day not in disk_data and day not in self.dirty_days and day not in self.dirty_slots
+        ]
+        for date in changed:
+            del self.tracker_data.hot[date]  # Sealed or dropped by the other instance
+        if changed:
+            self.publish(DaysReloaded(list(changed)))
+        for date, slots in disk_data.items():
+            if date in self.dirty_days:
+                continue
+            current = self.tracker_data.get(date)
+            slots = list(slots)
+            if current is not None and len(current) == len(slots):
+                for slot_index in self.dirty_slots.get(date, ()):
+                    slots[slot_index] = current[slot_index]  # Slots changed here win, the rest follow the disk
+            if current is not None and list(current) == slots:
+                continue
+            self.tracker_data[date] = slots
+            self._publish_external_day(date, current, slots)
+            changed.append(date)
+
+        if changed:
+            self.log_message(f"Merged external changes for: {', '.join(sorted(changed))}")
+        self.disk_digest = digest
+        return sorted(changed)
+
+    def _publish_external_day(self, date, previous, slots):
+        if previous is None:
+            self.publish(DayAdded(date))
+            previous = [False] * len(slots)
+        if len(previous) != len(slots):
+            self.publish(DaysReloaded([date]))
+            return
+        for slot_index, (old, new) in enumerate(zip(previous, slots)):
+            if old != new:
+                self.publish(SlotChanged(date, slot_index, old, new))
+
+    def rebuild_from_log(self):
+        """
+        Rebuilds the tracker data by replaying the log file and its rotated archives.
+        Returns True if data was recovered and a verified snapshot was written.
+        """
+        try:
+            tracker_data = rebuild_tracker_data(self.log_file, self.tracker_file, len(time_slots))
+        except (OSError, IOError, ValueError) as e:
+            self.log_message(f"Error rebuilding tracker data from log: {e}")
+            return False
+        if not tracker_data:
+            return False
+        self.tracker_data = tracker_data
+        self.log_message(f"Tracker data rebuilt from log: {self.tracker_data}")
+        return True
+
     def reset_weekly_data(self, start_date=None):
         """
         Resets the tracker data for a new week starting from the given start_date.
         If no start_date is provided, it defaults to the current week.
+        Sealed weeks are history too, so the archive is emptied as well.
         """
         try:
             if start_date is None:
-                start_date = datetime.now().date() - timedelta(days=datetime.now().date().weekday())
+                today = self.clock.today()
+                start_date = today - timedelta(days=today.weekday())
             else:
                 start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
 
+            try:
+                with FileLock(self.lock_file):
+                    self.archive.clear()
+            except OSError as e:
+                self.log_message(f"Error clearing the archive {self.archive_file}: {e}")
             self.tracker_data = {
                 (start_date + timedelta(days=i)).strftime("%Y-%m-%d"): [False] * len(time_slots)
                 for i in range(7)
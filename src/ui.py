@@ -8,9 +8,23 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from tkcalendar import Calendar
 from src.tracker import Tracker, time_slots
+from src.analytics import StreakAnalytics
+from src.clock import SYSTEM_CLOCK
+from src.events import EVENT_TYPES, DataReplaced, DayAdded, DaysReloaded, SlotChanged
+from src.heatmap import show_year_heatmap
+from src.storage import month_week_starts
+from src.summary import RangeRows, VirtualSummary
+from src.sync import TrackerWatcher
+from src.utils import StartupTrace, log_message
+from src.viewmodel import (
+    MARK_COLORS, current_slot_index, month_marks, period_view, progress_view, slot_states,
+    streak_label_text, summarize_day,
+)
 import os
 import json  # Add for data persistence
-from src.reminders import show_congratulatory_message  # Import the function
+from src.reminders import install_notification_manager, show_congratulatory_message
+from src.reminders import use_clock as use_reminder_clock
+from src.reminders import schedule_next_reminder as schedule_reminder
 
 # Initialize global variables
 ROOT = None
@@ -19,66 +33,98 @@ STATUS_LABEL = None
 TIME_SLOTS_FRAME = None
 CALENDAR = None
 
-# Create a global instance of Tracker
+# Create a global instance of Tracker. The startup trace begins first, so it includes the load.
+STARTUP_TRACE = StartupTrace()
 tracker = Tracker()
+STARTUP_TRACE.mark("tracker_loaded")
 
 PROGRESS_LABEL = None
 CURRENT_TIME_LABEL = None
+STREAK_LABEL = None
+WATCHER = None
+CLOCK = SYSTEM_CLOCK
+PROFILES = None  # ProfileManager when the app serves several people
+PROFILE_VAR = None
+SLOT_BUTTONS = []  # The slot buttons, reused for every date shown
+SLOT_BUTTONS_DATE = None
+PENDING_REPAINT = {}  # Date -> changed slot indexes, or None when the whole day changed
+FULL_REPAINT = False
+REPAINT_SCHEDULED = False
 
 
-def update_calendar(date, progress_label, status_label, progress_bar, root=None):
+def use_clock(clock):
     """
-    Update the calendar UI with the progress for the given date.
+    Makes the UI, its tracker and the reminder scheduler read the time from clock.
     """
-    if date not in tracker.tracker_data:
-        def no_data_ui_update():
-            progress_label.config(text="No data available for this date.")
-            progress_bar.config(value=0)
-            status_label.config(text="No progress yet.", foreground="#333")
-        if root:
-            root.after(0, no_data_ui_update)
-        else:
-            no_data_ui_update()
+    global CLOCK
+    CLOCK = clock
+    tracker.clock = clock
+    if PROFILES:
+        PROFILES.use_clock(clock)
+    use_reminder_clock(clock)
+
+
+def bind_tracker(new_tracker):
+    """
+    Points the open window at another tracker, e.g. another profile's, without rebuilding it.
+    Change events of the previous tracker no longer repaint, and the file watcher follows
+    the new tracker's file. Everything shown is repainted from the new tracker.
+    """
+    global tracker
+    if new_tracker is tracker:
         return
+    for event_type in EVENT_TYPES:
+        tracker.events.unsubscribe(event_type, on_tracker_event)
+        new_tracker.events.subscribe(event_type, on_tracker_event)
+    PENDING_REPAINT.clear()  # Queued days belong to the previous tracker
+    tracker = new_tracker
+    tracker.clock = CLOCK
+    if WATCHER:
+        WATCHER.stop()
+        start_watcher()
+    on_tracker_event(DataReplaced())
 
-    completed_count = sum(1 for completed in tracker.tracker_data[date] if completed)
-    progress_text = f"Progress: {completed_count}/{len(time_slots)}"
-    status_text = (
-        "Way to go! You completed your squats for today!"
-        if completed_count == len(time_slots)
-        else "Keep going!"
-    )
-    status_color = "#006600" if completed_count == len(time_slots) else "#333"
 
-    progress_percentage = (completed_count / len(time_slots)) * 100
+def switch_profile(name):
+    """
+    Shows another profile, loading it unless it is among the recently used ones.
+    """
+    if not PROFILES:
+        print("Warning: switch_profile called without a profile manager.")
+        return
+    try:
+        bind_tracker(PROFILES.get(name))
+    except ValueError as e:
+        messagebox.showerror("Invalid Profile", str(e))
+        return
+    log_message(f"Switched to profile '{name.strip()}'.", clock=CLOCK)
+    if PROFILE_VAR:
+        PROFILE_VAR.set(name.strip())
+
+
+def update_calendar(date, progress_label, status_label, progress_bar, root=None, color_calendar=True):
+    """
+    Update the calendar UI with the progress for the given date.
+    Pass color_calendar=False to only update the progress widgets.
+    """
+    view = progress_view(tracker.aggregates.day(date))
 
     def update_ui():
-        progress_label.config(text=progress_text)
-        status_label.config(text=status_text, foreground=status_color)
-        progress_bar.config(value=progress_percentage)
+        progress_label.config(text=view.progress_text)
+        status_label.config(text=view.status_text, foreground=view.status_color)
+        progress_bar.config(value=view.percentage)
+        if view.mark is None:
+            return
 
-        # Update calendar colors for previous days
-        for day, slots in tracker.tracker_data.items():
-            if root:
-                root.after(0, lambda d=day, s=slots: _update_calendar_event(d, s, root))
-            else:
-                _update_calendar_event(day, slots, root)
+        # Update calendar colors for the displayed month only; other months are paged in on navigation
+        if color_calendar:
+            month, year = CALENDAR.get_displayed_month() if CALENDAR else (int(date[5:7]), int(date[:4]))
+            color_month(year, month, root)
 
         # Highlight the current time slot with a blue hourglass
-        today = datetime.now().strftime("%Y-%m-%d")
-        if date == today:
-            current_time = datetime.now()
-            for index, slot in enumerate(time_slots):
-                slot_time = datetime.strptime(slot, "%I:%M %p")
-                if slot_time.hour == current_time.hour and slot_time.minute == current_time.minute:
-                    def highlight_current_slot():
-                        if root:
-                            root.after(0, lambda: CALENDAR.calevent_create(current_time, "", "current"))
-                            root.after(0, lambda: CALENDAR.tag_config("current", background="blue", foreground="white"))
-                        else:
-                            CALENDAR.calevent_create(current_time, "", "current")
-                            CALENDAR.tag_config("current", background="blue", foreground="white")
-                    highlight_current_slot()
+        current_time = CLOCK.now()
+        if date == current_time.strftime("%Y-%m-%d") and current_slot_index(current_time, time_slots) is not None:
+            _update_calendar_event(date, "current", root)
 
     if root:
         root.after(0, update_ui)  # Schedule UI updates on the main thread
@@ -86,24 +132,20 @@ def update_calendar(date, progress_label, status_label, progress_bar, root=None)
         update_ui()
 
 
-def _update_calendar_event(day, slots, root=None):
+def _update_calendar_event(day, mark, root=None):
     """
     Helper function to update calendar events for a specific day.
+    The mark is the cached day aggregate's "completed", "incomplete" or "missed" tag.
     """
     def update_event():
         if not CALENDAR:
             print(f"Warning: CALENDAR is not initialized. Skipping update for {day}.")
             return
 
-        if all(slots):
-            CALENDAR.calevent_create(datetime.strptime(day, "%Y-%m-%d"), "", "completed")
-            CALENDAR.tag_config("completed", background="green", foreground="white")
-        elif any(slots):
-            CALENDAR.calevent_create(datetime.strptime(day, "%Y-%m-%d"), "", "incomplete")
-            CALENDAR.tag_config("incomplete", background="red", foreground="white")
-        else:
-            CALENDAR.calevent_create(datetime.strptime(day, "%Y-%m-%d"), "", "missed")
-            CALENDAR.tag_config("missed", background="red", foreground="white")
+        day_date = datetime.strptime(day, "%Y-%m-%d").date()
+        CALENDAR.calevent_remove(date=day_date)  # Replace the day's mark instead of stacking events
+        CALENDAR.calevent_create(day_date, "", mark)
+        CALENDAR.tag_config(mark, background=MARK_COLORS[mark], foreground="white")
 
     if threading.current_thread() != threading.main_thread():
         if root:
@@ -114,11 +156,39 @@ def _update_calendar_event(day, slots, root=None):
         update_event()
 
 
+def color_month(year, month, root=None):
+    """
+    Colors the calendar days of one month from their cached aggregates.
+    Events of previously displayed months are dropped, so they do not pile up over a long run.
+    """
+    marks = month_marks(tracker, year, month)
+
+    def paint():
+        if CALENDAR:
+            CALENDAR.calevent_remove("all")
+        for day, mark in marks:
+            _update_calendar_event(day, mark, root)
+
+    if root:
+        root.after(0, paint)
+    else:
+        paint()
+
+
+def on_month_changed(event):
+    """
+    Pages in and colors the month the calendar navigated to, then prefetches its neighbours.
+    """
+    month, year = CALENDAR.get_displayed_month()
+    color_month(year, month, ROOT)
+    tracker.prefetch_months(year, month)
+
+
 def update_current_time():
     """
     Updates the current time label every second.
     """
-    now = datetime.now().strftime("%I:%M:%S %p")
+    now = CLOCK.now().strftime("%I:%M:%S %p")
     if CURRENT_TIME_LABEL:
         CURRENT_TIME_LABEL.config(text=f"Current Time: {now}")
     if ROOT:
@@ -136,71 +206,78 @@ def update_time_slots_list(date, mock_style=None, mock_time_slots_frame=None):
         ROOT.after(0, lambda: update_time_slots_list(date, mock_style, mock_time_slots_frame))
         return
 
-    if date not in tracker.tracker_data:
-        print(f"Warning: No data found for date {date}.")
-        return
-
-    current_time = datetime.now()
-    current_hour = current_time.hour
-    current_minute = current_time.minute
+    slots = tracker.tracker_data.get(date)
+    if slots is None:
+        slots = [False] * len(time_slots)  # A day the app has not stored yet, e.g. after midnight
 
     style = mock_style or ttk.Style()  # Use mock style if provided
     style.configure("Completed.TButton", foreground="#006600")
     style.configure("Missed.TButton", foreground="#990000")
     style.configure("Current.TButton", foreground="#3333FF", font=("Helvetica", 10, "bold"))
 
+    global SLOT_BUTTONS_DATE
     frame = mock_time_slots_frame or TIME_SLOTS_FRAME  # Use mock frame if provided
+    states = slot_states(date, slots, CLOCK.now(), time_slots)
+    if frame is TIME_SLOTS_FRAME and len(SLOT_BUTTONS) == len(states):
+        # Reuse the buttons; only their text, style and target date change
+        for state in states:
+            SLOT_BUTTONS[state.index].config(
+                text=state.label,
+                command=lambda idx=state.index: mark_squat_as_completed(date, idx),
+                style=state.style,
+            )
+        SLOT_BUTTONS_DATE = date
+        return
+
     for widget in frame.winfo_children():
         widget.destroy()
 
-    today = datetime.now().strftime("%Y-%m-%d")  # Get today's date as a string
-
-    for index, slot_completed in enumerate(tracker.tracker_data[date]):
-        slot = time_slots[index]
-        slot_time = datetime.strptime(slot, "%I:%M %p")
-        slot_hour = slot_time.hour
-        slot_minute = slot_time.minute
-
-        if slot_completed:
-            status = "✔"
-            button_style = "Completed.TButton"
-        elif date < today:  # For previous days, mark all missed slots
-            status = "✗"
-            button_style = "Missed.TButton"
-        elif date == today:  # For today, check the current time
-            if (slot_hour < current_hour) or (slot_hour == current_hour and slot_minute < current_minute):
-                status = "✗"
-                button_style = "Missed.TButton"
-            elif slot_hour == current_hour and slot_minute == current_minute:
-                button_style = "Current.TButton"
-                status = "⏳"
-            else:
-                status = ""
-                button_style = "TButton"
-        else:  # For future dates
-            status = ""
-            button_style = "TButton"
-
+    buttons = []
+    for state in states:
         button = ttk.Button(
             frame,
-            text=f"{slot} {status}",
-            command=lambda idx=index: mark_squat_as_completed(date, idx),
-            style=button_style
+            text=state.label,
+            command=lambda idx=state.index: mark_squat_as_completed(date, idx),
+            style=state.style
         )
         button.pack(fill="x", pady=2, padx=5)
+        buttons.append(button)
+    if frame is TIME_SLOTS_FRAME:
+        SLOT_BUTTONS[:] = buttons
+        SLOT_BUTTONS_DATE = date
+
+
+def _refresh_slot_buttons(date, slot_indexes):
+    """
+    Restyles only the slot buttons that changed, or rebuilds the list if another date is shown.
+    """
+    if slot_indexes is None or SLOT_BUTTONS_DATE != date or len(SLOT_BUTTONS) != len(time_slots):
+        update_time_slots_list(date)
+        return
+    states = slot_states(date, tracker.tracker_data[date], CLOCK.now(), time_slots)
+    for index in slot_indexes:
+        SLOT_BUTTONS[index].config(text=states[index].label, style=states[index].style)
 
 
 def mark_squat_as_completed(date, slot_index):
     """
     Toggles the completion status of a squat for the given date and time slot.
     """
-    tracker.tracker_data[date][slot_index] = not tracker.tracker_data[date][slot_index]
-    update_time_slots_list(date)
-    update_calendar(date, PROGRESS_LABEL, STATUS_LABEL, PROGRESS_BAR, ROOT)
+    completed = tracker.tracker_data.get(date, [False] * len(time_slots))[slot_index]
+    tracker.mark_as_completed(date, slot_index, not completed)  # The change event queues the repaint
+    status = "completed" if tracker.tracker_data[date][slot_index] else "not completed"
+    print(f"Time slot {time_slots[slot_index]} marked as {status}.")
+    ROOT.after_idle(lambda: _celebrate(date, slot_index))  # Runs after the repaint, so it is not overwritten
 
+
+def _celebrate(date, slot_index):
+    """
+    Shows the congratulatory banner for a completed day, or briefly for a completed slot.
+    """
     # Check if all squats for the day are completed
     if all(tracker.tracker_data[date]):
-        show_congratulatory_message(STATUS_LABEL)  # Update banner with congratulatory message
+        # Update banner with congratulatory message
+        show_congratulatory_message(STATUS_LABEL, streak=tracker.analytics.current_streak(CLOCK.today()))
     else:
         # Briefly show a congratulatory message for the individual time slot
         if tracker.tracker_data[date][slot_index]:  # If the slot was marked as completed
@@ -208,8 +285,86 @@ def mark_squat_as_completed(date, slot_index):
             STATUS_LABEL.config(text="Great job! Keep going!", foreground="#006600")
             ROOT.after(2000, lambda: STATUS_LABEL.config(text=original_text, foreground="#333"))  # Revert after 2 seconds
 
-    status = "completed" if tracker.tracker_data[date][slot_index] else "not completed"
-    print(f"Time slot {time_slots[slot_index]} marked as {status}.")
+
+def update_streak_label():
+    """
+    Shows the current and longest streak from the tracker's analytics.
+    """
+    if STREAK_LABEL:
+        STREAK_LABEL.config(text=streak_label_text(tracker.analytics, CLOCK.today()))
+
+
+def on_tracker_event(event):
+    """
+    Queues a repaint of the days a tracker change touched. All changes made before the
+    event loop goes idle share one repaint.
+    """
+    global FULL_REPAINT, REPAINT_SCHEDULED
+    if isinstance(event, SlotChanged):
+        indexes = PENDING_REPAINT.setdefault(event.date, set())
+        if indexes is not None:
+            indexes.add(event.slot_index)
+    elif isinstance(event, DayAdded):
+        PENDING_REPAINT[event.date] = None
+    elif isinstance(event, DaysReloaded):
+        PENDING_REPAINT.update(dict.fromkeys(event.dates))
+    elif isinstance(event, DataReplaced):
+        FULL_REPAINT = True
+    if ROOT and not REPAINT_SCHEDULED:
+        REPAINT_SCHEDULED = True
+        ROOT.after_idle(flush_repaint)
+
+
+def flush_repaint():
+    """
+    Repaints the queued days: their calendar marks, and the progress widgets and changed
+    slot buttons if the selected day is among them.
+    """
+    global FULL_REPAINT, REPAINT_SCHEDULED
+    pending, full = dict(PENDING_REPAINT), FULL_REPAINT
+    PENDING_REPAINT.clear()
+    FULL_REPAINT = REPAINT_SCHEDULED = False
+    if not CALENDAR:
+        return
+    month, year = CALENDAR.get_displayed_month()
+    selected = CALENDAR.selection_get()
+    selected = selected.strftime("%Y-%m-%d") if selected else None
+    if full:
+        color_month(year, month)
+        pending[selected] = None
+    else:
+        prefix = f"{year:04d}-{month:02d}"
+        for day in pending:
+            aggregate = tracker.aggregates.day(day)
+            if day.startswith(prefix) and aggregate is not None:
+                _update_calendar_event(day, aggregate.mark)
+    if selected in pending:
+        update_calendar(selected, PROGRESS_LABEL, STATUS_LABEL, PROGRESS_BAR, color_calendar=False)
+        _refresh_slot_buttons(selected, pending[selected])
+    update_streak_label()
+
+
+def on_external_change():
+    """
+    Merges days another instance saved; the change events repaint only those days.
+    """
+    tracker.reload_external_changes()
+
+
+def on_reminder_shown(fired_at):
+    """
+    Counts a shown reminder as the reminder of the slots that are open right now.
+    """
+    tracker.reminder_fired(fired_at)
+
+
+def start_watcher():
+    """
+    Watches the tracker file for saves by other instances and merges them on the main thread.
+    """
+    global WATCHER
+    WATCHER = TrackerWatcher(tracker.tracker_file, lambda: ROOT.after(0, on_external_change)).start()
+    log_message(f"Watching {tracker.tracker_file} for external changes ({WATCHER.mode}).", clock=CLOCK)
 
 
 def on_date_selected(event):
@@ -227,7 +382,7 @@ def change_calendar_view(*args):
     """
     view_mode = VIEW_MODE.get()
     selected_date = CALENDAR.selection_get()
-    today = datetime.now()
+    today = CLOCK.now()
 
     if view_mode == "day":
         # Show progress for the selected day
@@ -237,29 +392,45 @@ def change_calendar_view(*args):
     elif view_mode == "week":
         # Calculate the start and end of the week
         start_of_week = selected_date - timedelta(days=selected_date.weekday())
-        end_of_week = start_of_week + timedelta(days=6)
+        update_period_progress("Week", tracker.aggregates.week(start_of_week.strftime("%Y-%m-%d")))
         for current_date in (start_of_week + timedelta(days=i) for i in range(7)):
-            update_calendar(current_date.strftime("%Y-%m-%d"), PROGRESS_LABEL, STATUS_LABEL, PROGRESS_BAR, ROOT)
+            _update_period_day(current_date.strftime("%Y-%m-%d"))
 
     elif view_mode == "month":
-        # Keep the existing behavior for month view
         start_of_month = selected_date.replace(day=1)
         next_month = (start_of_month + timedelta(days=31)).replace(day=1)
         end_of_month = next_month - timedelta(days=1)
+        update_period_progress("Month", tracker.aggregates.month(start_of_month.strftime("%Y-%m-%d")))
         for current_date in (start_of_month + timedelta(days=i) for i in range((end_of_month - start_of_month).days + 1)):
-            update_calendar(current_date.strftime("%Y-%m-%d"), PROGRESS_LABEL, STATUS_LABEL, PROGRESS_BAR, ROOT)
+            _update_period_day(current_date.strftime("%Y-%m-%d"))
 
     elif view_mode == "year":
-        # Keep the existing behavior for year view
-        start_of_year = selected_date.replace(month=1, day=1)
-        end_of_year = selected_date.replace(month=12, day=31)
-        for current_date in (start_of_year + timedelta(days=i) for i in range((end_of_year - start_of_year).days + 1)):
-            update_calendar(current_date.strftime("%Y-%m-%d"), PROGRESS_LABEL, STATUS_LABEL, PROGRESS_BAR, ROOT)
+        # The month calendar cannot show a year, so paint it as a heatmap in its own window
+        show_year_heatmap(ROOT, selected_date.year, tracker.tracker_data, time_slots)
 
     else:
         print(f"Error: Unknown view mode {view_mode}")
 
 
+def update_period_progress(title, aggregate):
+    """
+    Shows a cached week or month aggregate in the progress widgets.
+    """
+    view = period_view(title, aggregate)
+    PROGRESS_LABEL.config(text=view.progress_text)
+    PROGRESS_BAR.config(value=view.percentage)
+    STATUS_LABEL.config(text=view.status_text, foreground=view.status_color)
+
+
+def _update_period_day(date):
+    """
+    Colors a single day of a week or month view from its cached aggregate.
+    """
+    aggregate = tracker.aggregates.day(date)
+    if aggregate is not None:
+        _update_calendar_event(date, aggregate.mark, ROOT)
+
+
 def calculate_progress_for_range(start_date, end_date):
     """
     Calculates progress for a range of dates.
@@ -268,30 +439,48 @@ def calculate_progress_for_range(start_date, end_date):
     current_date = start_date
     while current_date <= end_date:
         date_str = current_date.strftime("%Y-%m-%d")
-        if date_str in tracker.tracker_data:
-            completed_count = sum(1 for completed in tracker.tracker_data[date_str] if completed)
-            progress[date_str] = f"{completed_count}/{len(time_slots)}"
+        aggregate = tracker.aggregates.day(date_str)
+        if aggregate is not None:
+            progress[date_str] = f"{aggregate.completed}/{aggregate.total}"
         else:
             progress[date_str] = "No data"
         current_date += timedelta(days=1)
     return progress
 
 
-def display_progress_summary(progress, title, date_range):
+def _summary_lookup(date_str):
+    """
+    Computes a day aggregate for the summary window without filling the shared cache.
+    """
+    slots = tracker.tracker_data.get(date_str)
+    return None if slots is None else summarize_day(slots)
+
+
+def display_progress_summary(rows, title, date_range):
     """
     Displays a summary of progress for a given range.
+    Only the visible rows of the RangeRows source are computed and turned into items.
     """
     summary_window = tk.Toplevel(ROOT)
     summary_window.title(title)
-    summary_window.geometry("400x300")
+    summary_window.geometry("400x420")
     summary_window.configure(bg="#f0f8ff")
 
     title_label = ttk.Label(summary_window, text=f"{title}: {date_range}", font=("Helvetica", 14, "bold"))
     title_label.pack(pady=10)
 
-    for date, progress_text in progress.items():
-        progress_label = ttk.Label(summary_window, text=f"{date}: {progress_text}", font=("Helvetica", 12))
-        progress_label.pack(anchor="w", padx=10, pady=2)
+    return VirtualSummary(summary_window, rows)
+
+
+def show_progress_summary():
+    """
+    Opens the summary window for everything from the first tracked day until today.
+    """
+    today = CLOCK.today()
+    start_date = datetime.strptime(min(tracker.tracker_data, default=today.strftime("%Y-%m-%d")), "%Y-%m-%d").date()
+    end_date = max(today, start_date)
+    rows = RangeRows(start_date, end_date, _summary_lookup)
+    display_progress_summary(rows, "Progress Summary", f"{start_date} to {end_date}")
 
 
 def save_progress():
@@ -299,7 +488,7 @@ def save_progress():
     Save the tracker data to a file.
     """
     with open("progress_data.json", "w") as file:
-        json.dump(tracker.tracker_data, file)
+        json.dump(tracker.tracker_data.hot, file)
     print("Progress saved.")
 
 
@@ -341,6 +530,11 @@ def safe_exit():
     """
     try:
         save_progress()
+        if PROFILES:
+            for name in PROFILES.flush_all():
+                print(f"Error: unsaved changes of profile '{name}' could not be written.")
+        if WATCHER:
+            WATCHER.stop()
     except Exception as e:
         print(f"Error saving progress: {e}")
     finally:
@@ -348,11 +542,61 @@ def safe_exit():
             ROOT.destroy()
 
 
-def build_main_screen():
+def _hydrate(on_ready):
     """
-    Builds the main screen for the squats tracker application.
+    Background stage of startup: indexes the archive, pages in the displayed months and
+    rebuilds the streak analytics, then hands the results to the main thread.
+    Startup is finished even if this fails, so the calendar, watcher and reminders still start.
+    """
+    hydrated = tracker  # The profile may be switched before this finishes
+    revision = hydrated.revision
+    try:
+        now = CLOCK.now()
+        hydrated.archive.refresh()
+        for week in month_week_starts(now.year, now.month):
+            hydrated.archive.read_week(week)
+        analytics = StreakAnalytics(hydrated, len(time_slots))
+        analytics.rebuild()
+    except Exception as e:
+        print(f"Error loading history in the background: {e}")
+        log_message(f"Error loading history in the background: {e}", clock=CLOCK)
+        analytics = None  # The lazy rebuild takes over
+    ROOT.after(0, lambda: _finish_startup(hydrated, analytics, revision, on_ready))
+
+
+def _finish_startup(hydrated, analytics, revision, on_ready):
     """
-    global ROOT, CURRENT_TIME_LABEL, PROGRESS_BAR, PROGRESS_LABEL, STATUS_LABEL, TIME_SLOTS_FRAME, CALENDAR, VIEW_MODE
+    Main-thread end of startup: colors the calendar, shows streaks and starts reminders.
+    The analytics are only installed on the tracker they were built from, if it is still shown.
+    """
+    if analytics is not None and tracker is hydrated and tracker.revision == revision:
+        tracker.analytics = analytics  # Otherwise the data changed meanwhile and the lazy rebuild takes over
+    month, year = CALENDAR.get_displayed_month()
+    color_month(year, month)
+    update_streak_label()
+    tracker.prefetch_months(year, month)
+    start_watcher()
+    if on_ready:
+        on_ready()
+    STARTUP_TRACE.mark("interactive")
+    log_message(STARTUP_TRACE.report(), clock=CLOCK)
+
+
+def build_main_screen(on_ready=None, trace=None, profiles=None, profile=None):
+    """
+    Builds the main screen for the squats tracker application.
+    The window and today's slots are painted first from the current week alone; the rest of
+    the history is hydrated on a background thread, after which on_ready is called.
+    With a ProfileManager, the window shows the given profile and offers switching between them.
+    """
+    global ROOT, CURRENT_TIME_LABEL, PROGRESS_BAR, PROGRESS_LABEL, STATUS_LABEL, STREAK_LABEL, TIME_SLOTS_FRAME, CALENDAR, VIEW_MODE
+    global STARTUP_TRACE, PROFILES, PROFILE_VAR, tracker
+    STARTUP_TRACE = trace or STARTUP_TRACE
+    if profiles:
+        PROFILES = profiles
+        profile = profile or (profiles.names() or ["default"])[0]
+        tracker = profiles.get(profile)
+        tracker.clock = CLOCK
     ROOT = tk.Tk()
     ROOT.title("Squats Tracker")
     ROOT.configure(bg="#f0f8ff")  # Light blue background for a fun and approachable look
@@ -363,6 +607,9 @@ def build_main_screen():
         ROOT.iconbitmap(icon_path)
     else:
         print(f"Warning: Icon file '{icon_path}' not found. Skipping icon setup.")
+    install_notification_manager(ROOT, on_reminder=on_reminder_shown)
+    for event_type in EVENT_TYPES:
+        tracker.events.subscribe(event_type, on_tracker_event)
 
     # Initialize VIEW_MODE after ROOT is created
     VIEW_MODE = tk.StringVar(value="day")  # Default calendar view mode
@@ -375,11 +622,24 @@ def build_main_screen():
     view_menu = ttk.OptionMenu(ROOT, VIEW_MODE, "day", "day", "week", "month", "year", command=change_calendar_view)
     view_menu.pack(pady=5)
 
+    if PROFILES:
+        # Typing a new name and pressing Enter creates that profile
+        PROFILE_VAR = tk.StringVar(value=profile)
+        profile_box = ttk.Combobox(ROOT, textvariable=PROFILE_VAR, values=PROFILES.names())
+        profile_box.pack(pady=5)
+        profile_box.bind("<<ComboboxSelected>>", lambda event: switch_profile(PROFILE_VAR.get()))
+        profile_box.bind("<Return>", lambda event: switch_profile(PROFILE_VAR.get()))
+        profile_box.bind("<Button-1>", lambda event: profile_box.config(values=PROFILES.names()))
+
+    summary_button = ttk.Button(ROOT, text="Progress Summary", command=show_progress_summary)
+    summary_button.pack(pady=5)
+
     calendar_frame = ttk.Frame(ROOT)
     calendar_frame.pack(pady=10)
     CALENDAR = Calendar(calendar_frame, selectmode="day", date_pattern="yyyy-mm-dd")
     CALENDAR.pack()
     CALENDAR.bind("<<CalendarSelected>>", on_date_selected)
+    CALENDAR.bind("<<CalendarMonthChanged>>", on_month_changed)
 
     CURRENT_TIME_LABEL = ttk.Label(
         ROOT, text="Current Time: ", font=("Helvetica", 12), foreground="#333"
@@ -398,15 +658,21 @@ def build_main_screen():
     )
     STATUS_LABEL.pack(pady=10)
 
+    STREAK_LABEL = ttk.Label(ROOT, text="Streak: 0 days", font=("Helvetica", 11), foreground="#333")
+    STREAK_LABEL.pack(pady=5)
+
     TIME_SLOTS_FRAME = ttk.Frame(ROOT)
     TIME_SLOTS_FRAME.pack(fill="x", pady=10)
 
-    # Pass required arguments to update_calendar
-    today = datetime.now().strftime("%Y-%m-%d")
-    update_calendar(today, PROGRESS_LABEL, STATUS_LABEL, PROGRESS_BAR, ROOT)
+    # Paint today's progress and slots from the hot tier before touching the history
+    today = CLOCK.now().strftime("%Y-%m-%d")
+    update_calendar(today, PROGRESS_LABEL, STATUS_LABEL, PROGRESS_BAR, color_calendar=False)
     update_time_slots_list(today)
     update_current_time()
-    load_progress()  # Load progress on startup
+    ROOT.update_idletasks()
+    STARTUP_TRACE.mark("first_paint")
+
+    threading.Thread(target=_hydrate, args=(on_ready,), daemon=True).start()
     ROOT.protocol("WM_DELETE_WINDOW", safe_exit)  # Use safe_exit for graceful shutdown
     VIEW_MODE.trace_add("write", change_calendar_view)  # Trigger view change on dropdown selection
     return ROOT
@@ -417,8 +683,7 @@ def schedule_next_reminder(delay_minutes, mock_status_label=None):
     Schedules the next reminder after a specified delay in minutes.
     """
     print(f"Debug: Scheduling next reminder in {delay_minutes} minutes.")
-    # Add logic to schedule the reminder (e.g., using a timer or external service)
-    threading.Timer(delay_minutes * 60, lambda: print("Reminder triggered!")).start()
+    schedule_reminder(delay_minutes * 60)
 
     # Update the status label if provided
     if mock_status_label:
@@ -3,15 +3,16 @@ Utility functions for the squats app.
 """
 
 import time
+from src.clock import SYSTEM_CLOCK
 
 LOG_FILE = "squats_log.txt"
 
-def log_message(message):
+def log_message(message, clock=SYSTEM_CLOCK):
     """
-    Logs a message to the log file with a timestamp.
+    Logs a message to the log file with a timestamp read from clock.
     """
     with open(LOG_FILE, "a", encoding="utf-8") as log:
-        log.write(f"{time.ctime()}: {message}\n")
+        log.write(f"{clock.now().ctime()}: {message}\n")
 
 def read_file(file_path):
     """
@@ -19,3 +20,26 @@ def read_file(file_path):
     """
     with open(file_path, "r", encoding="utf-8") as file:
         return file.read()
+
+
+class StartupTrace:
+    """
+    Records named milestones during startup, in milliseconds since the trace began.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.marks = {}
+
+    def mark(self, name):
+        """
+        Records the elapsed time for a milestone such as "first_paint" or "interactive".
+        """
+        self.marks[name] = (time.perf_counter() - self.started) * 1000
+        return self.marks[name]
+
+    def report(self):
+        """
+        Formats the recorded milestones for the log.
+        """
+        return "Startup trace: " + ", ".join(f"{name} {elapsed:.1f} ms" for name, elapsed in self.marks.items())
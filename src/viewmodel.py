@@ -0,0 +1,126 @@
+"""
+Headless view-model for the squats app.
+
+Everything the main window shows (slot button states, progress and status text,
+calendar marks, streak text) is computed here as plain data from the tracker,
+so the Tk code in src/ui.py only has to render it.
+"""
+
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+from src.analytics import streak_text
+
+DayAggregate = namedtuple(
+    "DayAggregate",
+    ["completed", "total", "percentage", "progress_text", "status_text", "status_color", "mark"],
+)
+SlotState = namedtuple("SlotState", ["index", "label", "status", "style"])
+PeriodView = namedtuple("PeriodView", ["progress_text", "percentage", "status_text", "status_color"])
+
+NO_DATA = DayAggregate(0, 0, 0, "No data available for this date.", "No progress yet.", "#333", None)
+MARK_COLORS = {"completed": "green", "incomplete": "red", "missed": "red", "current": "blue"}
+
+
+def summarize_day(slots):
+    """
+    Computes the display aggregate for a single day's slot list.
+    """
+    total = len(slots)
+    completed = sum(1 for slot in slots if slot)
+    all_done = total > 0 and completed == total
+    if all_done:
+        mark = "completed"
+    elif completed:
+        mark = "incomplete"
+    else:
+        mark = "missed"
+    return DayAggregate(
+        completed=completed,
+        total=total,
+        percentage=(completed / total) * 100 if total else 0,
+        progress_text=f"Progress: {completed}/{total}",
+        status_text="Way to go! You completed your squats for today!" if all_done else "Keep going!",
+        status_color="#006600" if all_done else "#333",
+        mark=mark,
+    )
+
+
+def progress_view(aggregate):
+    """
+    Returns what the progress widgets show for a day aggregate, or NO_DATA for None.
+    """
+    return NO_DATA if aggregate is None else aggregate
+
+
+@lru_cache(maxsize=None)
+def slot_time(slot):
+    """
+    Returns (hour, minute) for a slot label such as "8:45 AM".
+    """
+    parsed = datetime.strptime(slot, "%I:%M %p")
+    return parsed.hour, parsed.minute
+
+
+def current_slot_index(now, time_slots):
+    """
+    Returns the index of the slot that starts at the current minute, or None.
+    """
+    for index, slot in enumerate(time_slots):
+        if slot_time(slot) == (now.hour, now.minute):
+            return index
+    return None
+
+
+def slot_states(date, slots, now, time_slots):
+    """
+    Returns the label, status symbol and button style of every slot on date as seen at now.
+    Past days show open slots as missed; today does so only for slots that have started.
+    """
+    today = now.strftime("%Y-%m-%d")
+    current = (now.hour, now.minute)
+    states = []
+    for index, slot_completed in enumerate(slots):
+        slot = time_slots[index]
+        if slot_completed:
+            status, style = "✔", "Completed.TButton"
+        elif date < today:
+            status, style = "✗", "Missed.TButton"
+        elif date == today and slot_time(slot) < current:
+            status, style = "✗", "Missed.TButton"
+        elif date == today and slot_time(slot) == current:
+            status, style = "⏳", "Current.TButton"
+        else:
+            status, style = "", "TButton"
+        states.append(SlotState(index, f"{slot} {status}", status, style))
+    return states
+
+
+def month_marks(tracker, year, month):
+    """
+    Returns (date, mark) for every day of a month that has data.
+    """
+    return [(day, tracker.aggregates.day(day).mark) for day in tracker.load_month(year, month)]
+
+
+def period_view(title, aggregate):
+    """
+    Returns what the progress widgets show for a week or month aggregate.
+    """
+    return PeriodView(
+        progress_text=f"{title} Progress: {aggregate.completed}/{aggregate.total}",
+        percentage=aggregate.percentage,
+        status_text=f"{aggregate.days_completed}/{aggregate.days_tracked} days completed",
+        status_color="#333",
+    )
+
+
+def streak_label_text(analytics, today=None):
+    """
+    Returns the streak line shown under the status banner.
+    """
+    text = streak_text(analytics, today)
+    best_weekday = analytics.best_weekday()
+    if best_weekday:
+        text += f" | Best day: {best_weekday}"
+    return text
@@ -0,0 +1,212 @@
+"""
+Stand-ins for tkinter, ttk, messagebox and tkcalendar used to run the real UI code without
+a display. FakeRoot runs its after() queue on a VirtualClock.
+"""
+
+import itertools
+from datetime import datetime
+from types import SimpleNamespace
+
+
+class FakeWidget:
+    """
+    Stand-in for any Tk widget. Tracks its children and stays live until destroyed, like a Tcl widget.
+    Methods without display-visible state are no-ops.
+    """
+
+    live = set()
+
+    def __init__(self, master=None, *args, **options):
+        self.master = master
+        self.options = dict(options)
+        self.children = []
+        self.visible = True
+        if isinstance(master, FakeWidget):
+            master.children.append(self)
+        FakeWidget.live.add(self)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def config(self, **options):
+        """
+        Stores the given options.
+        """
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key):
+        """
+        Returns a stored option.
+        """
+        return self.options.get(key, "")
+
+    def winfo_children(self):
+        """
+        Returns the live child widgets.
+        """
+        return list(self.children)
+
+    def withdraw(self):
+        """
+        Hides the window.
+        """
+        self.visible = False
+
+    def deiconify(self):
+        """
+        Shows the window.
+        """
+        self.visible = True
+
+    def destroy(self):
+        """
+        Destroys the widget and its children.
+        """
+        for child in list(self.children):
+            child.destroy()
+        if isinstance(self.master, FakeWidget) and self in self.master.children:
+            self.master.children.remove(self)
+        FakeWidget.live.discard(self)
+
+
+class FakeRoot(FakeWidget):
+    """
+    Main window whose after() queue is the virtual clock's. after() may be called from any thread.
+    """
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+
+    def after(self, ms, func=None, *args):
+        """
+        Schedules func after ms virtual milliseconds and returns its handle.
+        """
+        return self.clock.call_later(ms / 1000, func, *args)
+
+    def after_idle(self, func, *args):
+        """
+        Schedules func to run next.
+        """
+        return self.after(0, func, *args)
+
+    def after_cancel(self, handle):
+        """
+        Cancels a scheduled callback.
+        """
+        handle.cancel()
+
+
+class FakeCalendar(FakeWidget):
+    """
+    Stand-in for tkcalendar.Calendar that keeps its events, selection and displayed month.
+    """
+
+    def __init__(self, master=None, *args, **options):
+        super().__init__(master, *args, **options)
+        self.events = {}  # Event id -> (date, text, tag)
+        self.next_id = itertools.count()
+        self.selected = None
+        self.displayed = None  # (month, year)
+
+    def calevent_create(self, date, text, tags):
+        """
+        Adds an event and returns its id.
+        """
+        event_id = next(self.next_id)
+        self.events[event_id] = (date.date() if isinstance(date, datetime) else date, text, tags)
+        return event_id
+
+    def calevent_remove(self, *event_ids, **kw):
+        """
+        Removes events by id, "all", or by date and/or tag like tkcalendar.
+        """
+        if "all" in event_ids:
+            self.events.clear()
+            return
+        date = kw.get("date")
+        date = date.date() if isinstance(date, datetime) else date
+        for event_id, (event_date, _, tag) in list(self.events.items()):
+            if event_id in event_ids or (
+                (event_ids == () and (date is not None or "tag" in kw))
+                and (date is None or event_date == date)
+                and ("tag" not in kw or tag == kw["tag"])
+            ):
+                del self.events[event_id]
+
+    def get_displayed_month(self):
+        """
+        Returns (month, year) of the displayed month.
+        """
+        return self.displayed
+
+    def selection_get(self):
+        """
+        Returns the selected date.
+        """
+        return self.selected
+
+    def selection_set(self, date):
+        """
+        Selects a date and displays its month.
+        """
+        self.selected = date
+        self.displayed = (date.month, date.year)
+
+
+class FakeVariable:
+    """
+    Stand-in for tk.StringVar and tk.IntVar.
+    """
+
+    def __init__(self, master=None, value=None, name=None):
+        self.value = value
+
+    def get(self):
+        """
+        Returns the value.
+        """
+        return self.value
+
+    def set(self, value):
+        """
+        Sets the value.
+        """
+        self.value = value
+
+    def trace_add(self, mode, callback):
+        """
+        Traces are not simulated.
+        """
+
+
+class FakeStyle:
+    """
+    Stand-in for ttk.Style; styles are not widgets and are not tracked.
+    """
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def fake_tk_modules():
+    """
+    Returns stand-ins for the tkinter, tkinter.ttk and tkinter.messagebox modules.
+    """
+    fake_tk = SimpleNamespace(
+        Tk=FakeWidget, Toplevel=FakeWidget, Canvas=FakeWidget, Frame=FakeWidget, Label=FakeWidget,
+        StringVar=FakeVariable, IntVar=FakeVariable,
+    )
+    fake_ttk = SimpleNamespace(
+        Label=FakeWidget, Button=FakeWidget, Frame=FakeWidget, Entry=FakeWidget, Progressbar=FakeWidget,
+        OptionMenu=FakeWidget, Scrollbar=FakeWidget, Treeview=FakeWidget, Combobox=FakeWidget, Style=FakeStyle,
+    )
+    messages = []
+    fake_messagebox = SimpleNamespace(
+        showinfo=lambda *args, **kwargs: messages.append(args),
+        showwarning=lambda *args, **kwargs: messages.append(args),
+        showerror=lambda *args, **kwargs: messages.append(args),
+    )
+    return fake_tk, fake_ttk, fake_messagebox
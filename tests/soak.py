@@ -0,0 +1,208 @@
+"""
+Soak test for the squats app.
+
+Runs the real UI code against a stubbed display for a number of simulated days. The
+Tk event loop is replaced by the after() queue of a VirtualClock, and a scripted user
+marks slots, snoozes reminders and switches views. After every day it samples traced
+memory, live threads, live widgets, calendar events and pending callbacks. It fails if
+any of them keeps growing. With --profiles N the user switches between N kiosk profiles
+before every slot, with room for one less than N in the profile LRU.
+
+Run with: python -m tests.soak --days 14
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import threading
+import tracemalloc
+from collections import namedtuple
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from unittest import mock
+from src.clock import VirtualClock
+from tests.fake_tk import FakeCalendar, FakeRoot, FakeWidget, fake_tk_modules
+
+Sample = namedtuple("Sample", ["day", "memory_bytes", "threads", "widgets", "calendar_events", "pending_callbacks"])
+
+# Allowed net growth per simulated day after warm-up. The history itself adds well under 1 KiB a day.
+GROWTH_LIMITS = {"memory_bytes": 64 * 1024, "threads": 0, "widgets": 0, "pending_callbacks": 0}
+MAX_CALENDAR_EVENTS = 31  # Only the displayed month is colored, one event per day
+DEFAULT_START = datetime(2025, 4, 7, 7, 0)  # A Monday morning
+SNOOZE_CHECK_MINUTES = 15
+
+
+def take_sample(day, clock, calendar, keep_threads):
+    """
+    Samples the resources a long-running instance could leak.
+    Short-lived worker threads are given a moment to finish first.
+    """
+    for thread in threading.enumerate():
+        if thread not in keep_threads and thread is not threading.current_thread():
+            thread.join(timeout=1)
+    gc.collect()
+    return Sample(
+        day=day,
+        memory_bytes=tracemalloc.get_traced_memory()[0],
+        threads=threading.active_count(),
+        widgets=len(FakeWidget.live),
+        calendar_events=len(calendar.events),
+        pending_callbacks=clock.pending(),
+    )
+
+
+def find_leaks(samples, warmup_days=1):
+    """
+    Returns a description of every metric that grew past its limit after the warm-up days.
+    """
+    if len(samples) <= warmup_days + 1:
+        return []
+    baseline, last = samples[warmup_days], samples[-1]
+    days = last.day - baseline.day
+    leaks = []
+    for metric, limit in GROWTH_LIMITS.items():
+        growth = (getattr(last, metric) - getattr(baseline, metric)) / days
+        if growth > limit:
+            leaks.append(f"{metric} grew by {growth:.0f} per day (limit {limit})")
+    worst = max(sample.calendar_events for sample in samples)
+    if worst > MAX_CALENDAR_EVENTS:
+        leaks.append(f"calendar_events reached {worst} (limit {MAX_CALENDAR_EVENTS})")
+    return leaks
+
+
+def format_report(samples, leaks):
+    """
+    Formats the samples and the verdict as a plain-text report.
+    """
+    lines = [f"{'day':>4} {'memory KiB':>11} {'threads':>8} {'widgets':>8} {'cal events':>11} {'callbacks':>10}"]
+    for sample in samples:
+        lines.append(
+            f"{sample.day:>4} {sample.memory_bytes / 1024:>11.1f} {sample.threads:>8} {sample.widgets:>8} "
+            f"{sample.calendar_events:>11} {sample.pending_callbacks:>10}"
+        )
+    lines.append("")
+    lines.extend(f"LEAK: {leak}" for leak in leaks)
+    lines.append("FAILED" if leaks else "OK: all sampled resources stayed bounded")
+    return "\n".join(lines)
+
+
+def _simulate_day(ui, reminders, clock, day_start, profiles=0):
+    """
+    Scripted user for one day: marks most slots when they come up and snoozes every reminder.
+    With profiles, each slot is marked in the next profile in turn.
+    """
+    today = day_start.strftime("%Y-%m-%d")
+    for index, slot in enumerate(ui.time_slots):
+        slot_time = datetime.strptime(f"{today} {slot}", "%Y-%m-%d %I:%M %p")
+        check = day_start
+        while check < slot_time:
+            clock.advance_to(check)
+            manager = reminders.get_notification_manager()
+            if manager and manager.window.visible:
+                manager.snooze()
+            check += timedelta(minutes=SNOOZE_CHECK_MINUTES)
+        clock.advance_to(slot_time)
+        if profiles:
+            ui.switch_profile(f"kiosk{index % profiles}")
+        if (day_start.toordinal() + index) % 5:  # Skip a few slots so some days stay incomplete
+            ui.mark_squat_as_completed(today, index)
+        day_start = slot_time
+
+    for mode in ("week", "month", "day"):
+        ui.VIEW_MODE.set(mode)
+        ui.change_calendar_view()
+
+
+def _select_day(ui, day):
+    previous = ui.CALENDAR.get_displayed_month()
+    ui.CALENDAR.selection_set(day.date())
+    ui.on_date_selected(None)
+    if ui.CALENDAR.get_displayed_month() != previous:
+        ui.on_month_changed(None)
+
+
+def run_soak(days, start=DEFAULT_START, warmup_days=1, work_dir=None, profiles=0):
+    """
+    Runs the soak test for the given number of simulated days and returns (samples, leaks).
+    The app's data files are written to work_dir, or to a temporary directory.
+    With profiles > 1 the app serves that many profiles from a smaller LRU.
+    """
+    with ExitStack() as stack:
+        if work_dir is None:
+            work_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        cwd = os.getcwd()
+        os.chdir(work_dir)  # The tracker keeps its files in the working directory
+        stack.callback(os.chdir, cwd)
+
+        from src import heatmap, reminders, summary, ui  # pylint: disable=import-outside-toplevel
+        from src.profiles import ProfileManager  # pylint: disable=import-outside-toplevel
+
+        clock = VirtualClock(start)
+        ui.use_clock(clock)
+        stack.callback(ui.use_clock, ui.SYSTEM_CLOCK)
+        fake_tk, fake_ttk, fake_messagebox = fake_tk_modules()
+        for module in (ui, reminders, heatmap, summary):
+            stack.enter_context(mock.patch.object(module, "tk", fake_tk))
+            stack.enter_context(mock.patch.object(module, "ttk", fake_ttk))
+        for module in (ui, reminders):
+            stack.enter_context(mock.patch.object(module, "messagebox", fake_messagebox))
+        stack.enter_context(mock.patch.object(ui, "Calendar", FakeCalendar))
+        for name in ("tracker", "PROFILES", "PROFILE_VAR"):
+            stack.enter_context(mock.patch.object(ui, name, getattr(ui, name)))
+        root = FakeRoot(clock)
+        fake_tk.Tk = lambda *args, **kwargs: root
+        FakeWidget.live = {root}
+
+        ui.tracker.reset_weekly_data()
+        tracemalloc.start()
+        stack.callback(tracemalloc.stop)
+
+        ready = threading.Event()
+        manager = ProfileManager(capacity=max(1, profiles - 1), clock=clock) if profiles else None
+        ui.build_main_screen(
+            on_ready=lambda: (reminders.schedule_next_reminder(5), ready.set()),
+            profiles=manager, profile="kiosk0",
+        )
+        stack.callback(lambda: ui.WATCHER and ui.WATCHER.stop())
+        _select_day(ui, start)
+        while not ready.wait(0.01):
+            clock.advance_to(clock.now())
+        keep_threads = {threading.main_thread(), ui.WATCHER.thread}
+
+        samples = []
+        day_start = start
+        for day in range(days):
+            _simulate_day(ui, reminders, clock, day_start, profiles)
+            day_start = day_start.replace(hour=start.hour, minute=start.minute) + timedelta(days=1)
+            clock.advance_to(day_start)
+            _select_day(ui, day_start)
+            samples.append(take_sample(day + 1, clock, ui.CALENDAR, keep_threads))
+        return samples, find_leaks(samples, warmup_days)
+
+
+def main(argv=None):
+    """
+    Command-line entry point: runs the soak test and prints or writes the report.
+    """
+    parser = argparse.ArgumentParser(description="Run the squats app against a stubbed display for simulated days.")
+    parser.add_argument("--days", type=int, default=7, help="number of simulated days (default: 7)")
+    parser.add_argument("--warmup", type=int, default=1, help="days excluded from growth checks (default: 1)")
+    parser.add_argument("--start", default=DEFAULT_START.strftime("%Y-%m-%d"), help="first simulated day, YYYY-MM-DD")
+    parser.add_argument("--report", help="also write the report to this file")
+    parser.add_argument("--profiles", type=int, default=0, help="switch between this many profiles (default: off)")
+    args = parser.parse_args(argv)
+
+    start = datetime.strptime(args.start, "%Y-%m-%d").replace(hour=DEFAULT_START.hour)
+    samples, leaks = run_soak(args.days, start, args.warmup, profiles=args.profiles)
+    report = format_report(samples, leaks)
+    print(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    return 1 if leaks else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
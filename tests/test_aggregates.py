@@ -0,0 +1,48 @@
+import unittest
+from types import SimpleNamespace
+from src.aggregates import AggregateCache, summarize_day
+
+
+class TestAggregateCache(unittest.TestCase):
+    def setUp(self):
+        self.tracker = SimpleNamespace(tracker_data={
+            "2025-03-31": [True, True],
+            "2025-04-01": [True, False],
+            "2025-04-07": [False, False],
+        })
+        self.cache = AggregateCache(self.tracker, max_entries=4)
+
+    def test_summarize_day(self):
+        aggregate = summarize_day([True, False])
+        self.assertEqual(aggregate.progress_text, "Progress: 1/2")
+        self.assertEqual(aggregate.status_text, "Keep going!")
+        self.assertEqual(aggregate.mark, "incomplete")
+        self.assertEqual(summarize_day([True, True]).status_color, "#006600")
+
+    def test_repeated_lookups_hit_the_cache(self):
+        self.cache.week("2025-04-02")
+        misses = self.cache.misses
+        week = self.cache.week("2025-04-02")
+        self.assertEqual(self.cache.misses, misses)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual((week.completed, week.total, week.days_tracked, week.days_completed), (3, 4, 2, 1))
+
+    def test_invalidate_day_only_drops_affected_periods(self):
+        self.cache.month("2025-04-01")
+        self.cache.day("2025-04-07")
+        self.tracker.tracker_data["2025-04-01"][1] = True
+        self.cache.invalidate_day("2025-04-01")
+
+        self.assertIn(("day", "2025-04-07"), self.cache.entries)
+        self.assertNotIn(("month", "2025-04"), self.cache.entries)
+        self.assertEqual(self.cache.month("2025-04-01").days_completed, 1)
+        self.assertEqual(self.cache.day("2025-04-01").mark, "completed")
+
+    def test_cache_is_size_bounded(self):
+        self.cache.month("2025-04-01")
+        self.assertLessEqual(self.cache.stats()["size"], 4)
+        self.assertIsNone(self.cache.day("2025-05-01"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from datetime import date, datetime
+from types import SimpleNamespace
+from src.analytics import StreakAnalytics, streak_text
+from src.clock import VirtualClock
+
+
+class TestStreakAnalytics(unittest.TestCase):
+    def setUp(self):
+        # 2025-03-31 is a Monday
+        self.tracker = SimpleNamespace(tracker_data={
+            "2025-03-31": [True, True],
+            "2025-04-01": [True, True],
+            "2025-04-02": [True, False],
+            "2025-04-03": [True, True],
+        })
+        self.analytics = StreakAnalytics(self.tracker, 2)
+        self.analytics.rebuild()
+        self.today = date(2025, 4, 3)
+
+    def _set(self, day, slot_index, completed):
+        old = self.tracker.tracker_data[day][slot_index]
+        self.tracker.tracker_data[day][slot_index] = completed
+        self.analytics.slot_changed(day, slot_index, old, completed)
+
+    def test_rebuild_is_deferred_until_read(self):
+        analytics = StreakAnalytics(self.tracker, 2)
+        self.assertTrue(analytics.stale)
+        analytics.slot_changed("2025-04-02", 1, False, True)
+        self.assertEqual(analytics.longest_streak(), 2)
+        self.assertFalse(analytics.stale)
+
+    def test_rebuild(self):
+        self.assertEqual(self.analytics.longest_streak(), 2)
+        self.assertEqual(self.analytics.current_streak(self.today), 1)
+        self.assertEqual(self.analytics.slot_hit_rates(), [1.0, 0.75])
+        self.assertEqual(self.analytics.heatmap[2], [1, 0])
+        self.assertEqual(self.analytics.best_weekday(), "Monday")
+
+    def test_completing_a_day_joins_runs(self):
+        self._set("2025-04-02", 1, True)
+        self.assertEqual(self.analytics.longest_streak(), 4)
+        self.assertEqual(self.analytics.current_streak(self.today), 4)
+        self.assertEqual(streak_text(self.analytics, self.today), "Streak: 4 days (best: 4)")
+
+    def test_today_defaults_to_the_trackers_clock(self):
+        self.tracker.clock = VirtualClock(datetime(2025, 4, 4, 9, 0))
+        self.assertEqual(self.analytics.current_streak(), 1)  # Ran through yesterday
+        self.tracker.clock.advance(days=1)
+        self.assertEqual(self.analytics.current_streak(), 0)
+
+    def test_undoing_a_slot_splits_runs(self):
+        self._set("2025-04-02", 1, True)
+        self._set("2025-04-01", 0, False)
+        self.assertEqual(self.analytics.longest_streak(), 2)
+        self.assertEqual(self.analytics.current_streak(self.today), 2)
+        self.assertEqual(self.analytics.slot_hits, [3, 4])
+
+    def test_incremental_matches_rebuild(self):
+        self._set("2025-04-02", 1, True)
+        self._set("2025-03-31", 1, False)
+        incremental = self.analytics.summary(self.today)
+        self.analytics.rebuild()
+        self.assertEqual(incremental, self.analytics.summary(self.today))
+
+
+if __name__ == "__main__":
+    unittest.main()
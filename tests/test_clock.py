@@ -0,0 +1,42 @@
+import unittest
+from datetime import date, datetime
+from src.clock import SystemClock, VirtualClock
+
+
+class TestClocks(unittest.TestCase):
+    def test_system_clock_reads_the_wall_clock(self):
+        before = datetime.now()
+        self.assertLessEqual(before, SystemClock().now())
+        self.assertEqual(SystemClock().today(), datetime.now().date())
+
+    def test_virtual_clock_runs_calls_in_due_order(self):
+        clock = VirtualClock(datetime(2025, 4, 7, 7, 0))
+        calls = []
+        clock.call_later(3600, lambda: calls.append(("hour", clock.now())))
+        clock.call_later(60, lambda: calls.append(("minute", clock.now())))
+        clock.call_later(30, calls.append, "cancelled").cancel()
+
+        clock.advance(days=1)
+        self.assertEqual(calls, [
+            ("minute", datetime(2025, 4, 7, 7, 1)),
+            ("hour", datetime(2025, 4, 7, 8, 0)),
+        ])
+        self.assertEqual(clock.today(), date(2025, 4, 8))
+        self.assertEqual(clock.pending(), 0)
+
+    def test_calls_scheduled_by_a_running_call_fire_in_the_same_advance(self):
+        clock = VirtualClock(datetime(2025, 4, 7, 7, 0))
+        ticks = []
+
+        def tick():
+            ticks.append(clock.now())
+            clock.call_later(1, tick)
+
+        clock.call_later(1, tick)
+        clock.advance(seconds=86400)
+        self.assertEqual(len(ticks), 86400)
+        self.assertEqual(clock.pending(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import io
+import json
+import os
+import struct
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest.mock import patch
+from src.clock import VirtualClock
+from src.details import ENTRY_HEADER, DetailStore
+from src.events import DayAdded
+from tests.trackers import make_tracker
+
+
+class TestDetailStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "squats_details.dat")
+        self.store = DetailStore(self.path, 3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_slots_are_stored_column_wise(self):
+        self.assertIsNone(self.store.day("2025-04-07"))
+        self.store.set_slot("2025-04-07", 1, reps=15, duration=40, completed_at=1744009200)
+        self.store.set_slot("2025-04-08", 0, reps=12)
+        record = self.store.day("2025-04-07")
+        self.assertEqual(list(record.reps), [0, 15, 0])
+        self.assertEqual(list(record.durations), [0, 40, 0])
+        self.assertEqual(list(record.completed_at), [0, 1744009200, 0])
+        self.assertEqual(self.store.reps.itemsize + self.store.durations.itemsize + self.store.completed_at.itemsize, 8)
+        self.assertEqual(len(self.store.reps), 6)
+
+    def test_out_of_range_values_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.store.set_slot("2025-04-07", 0, reps=70000)
+
+    def test_flush_appends_and_later_entries_win(self):
+        self.store.set_slot("2025-04-07", 0, reps=10)
+        self.store.flush()
+        self.store.set_slot("2025-04-07", 0, reps=20)
+        self.store.clear_slot("2025-04-07", 2)
+        self.store.flush()
+        self.assertEqual(os.path.getsize(self.path), 2 * (ENTRY_HEADER.size + 8 * 3))
+
+        reopened = DetailStore(self.path, 3)
+        self.assertEqual(list(reopened.day("2025-04-07").reps), [20, 0, 0])
+
+    def test_superseded_entries_are_compacted(self):
+        with patch("src.details.COMPACT_SLACK_BYTES", ENTRY_HEADER.size + 8 * 3):
+            for reps in range(5):
+                self.store.set_slot("2025-04-07", 0, reps=reps)
+                self.store.flush()
+        self.assertLessEqual(os.path.getsize(self.path), 2 * (ENTRY_HEADER.size + 8 * 3))
+        self.assertEqual(list(DetailStore(self.path, 3).day("2025-04-07").reps), [4, 0, 0])
+
+    def test_compaction_by_another_instance_is_rescanned(self):
+        other = DetailStore(self.path, 3)
+        for reps in range(3):
+            other.set_slot("2025-04-06", 0, reps=reps)
+            other.flush()
+        with patch("src.details.COMPACT_SLACK_BYTES", ENTRY_HEADER.size + 8 * 3):
+            for reps in range(5):
+                self.store.set_slot("2025-04-07", 0, reps=reps)
+                self.store.flush()
+        other.set_slot("2025-04-08", 1, reps=5)
+        other.flush()  # Its scan position predates the compaction
+
+        self.assertEqual(os.path.getsize(self.path), 3 * (ENTRY_HEADER.size + 8 * 3))
+        reopened = DetailStore(self.path, 3)
+        self.assertEqual(list(reopened.day("2025-04-06").reps), [2, 0, 0])
+        self.assertEqual(list(reopened.day("2025-04-07").reps), [4, 0, 0])
+        self.assertEqual(list(reopened.day("2025-04-08").reps), [0, 5, 0])
+        self.assertEqual(list(other.day("2025-04-07").reps), [4, 0, 0])
+
+    def test_damaged_entries_are_skipped(self):
+        self.store.set_slot("2025-04-07", 0, reps=10)
+        self.store.flush()
+        with open(self.path, "r+b") as f:
+            f.write(b"XXXX")  # Break the first entry's magic
+        self.store.set_slot("2025-04-08", 0, reps=3)
+        self.store.flush()
+        reopened = DetailStore(self.path, 3)
+        self.assertIsNone(reopened.day("2025-04-07"))
+        self.assertEqual(list(reopened.day("2025-04-08").reps), [3, 0, 0])
+
+    def test_entries_after_a_damaged_header_are_kept(self):
+        for offset, damage in ((4, b"\x00\x00\x00\x00"), (8, struct.pack("<H", 60000))):  # Ordinal, slot count
+            with self.subTest(offset=offset):
+                path = os.path.join(self.temp_dir.name, f"damaged_at_{offset}.dat")
+                store = DetailStore(path, 3)
+                for day in ("2025-04-07", "2025-04-08", "2025-04-09"):
+                    store.set_slot(day, 0, reps=10)
+                    store.flush()
+                with open(path, "r+b") as f:
+                    f.seek(offset)
+                    f.write(damage)
+
+                reopened = DetailStore(path, 3)
+                with redirect_stdout(io.StringIO()):
+                    reopened.set_slot("2025-04-10", 1, reps=3)
+                    reopened.flush()
+                self.assertIsNone(reopened.day("2025-04-07"))
+                after_flush = DetailStore(path, 3)
+                for day in ("2025-04-08", "2025-04-09"):
+                    self.assertEqual(list(after_flush.day(day).reps), [10, 0, 0])
+                self.assertEqual(list(after_flush.day("2025-04-10").reps), [0, 3, 0])
+
+    def test_other_instances_entries_are_merged(self):
+        other = DetailStore(self.path, 3)
+        self.store.set_slot("2025-04-07", 0, reps=10)
+        self.store.flush()
+        other.set_slot("2025-04-08", 1, reps=5)
+        other.flush()
+        self.assertEqual(list(other.day("2025-04-07").reps), [10, 0, 0])
+        self.store.refresh()
+        self.assertEqual(list(self.store.day("2025-04-08").reps), [0, 5, 0])
+
+    def test_other_instances_slots_of_a_day_edited_here_are_merged(self):
+        self.store.set_slot("2025-04-07", 0, reps=10, completed_at=100)
+        self.store.set_slot("2025-04-07", 1, reps=12, completed_at=200)
+        self.store.flush()
+        other = DetailStore(self.path, 3)
+        other.clear_slot("2025-04-07", 1)
+        other.flush()
+        self.store.set_slot("2025-04-07", 2, reps=8, completed_at=300)
+        self.store.flush()
+
+        for store in (self.store, DetailStore(self.path, 3)):
+            record = store.day("2025-04-07")
+            self.assertEqual(list(record.reps), [10, 0, 8])
+            self.assertEqual(list(record.completed_at), [100, 0, 300])
+
+    def test_corrupted_tail_is_ignored_and_overwritten(self):
+        self.store.set_slot("2025-04-07", 0, reps=10)
+        self.store.flush()
+        with open(self.path, "ab") as f:
+            f.write(b"SQDR\x00")
+        reopened = DetailStore(self.path, 3)
+        self.assertEqual(list(reopened.day("2025-04-07").reps), [10, 0, 0])
+        reopened.set_slot("2025-04-08", 0, reps=3)
+        reopened.flush()
+        self.assertEqual(list(DetailStore(self.path, 3).day("2025-04-08").reps), [3, 0, 0])
+
+    def test_slot_count_changes_are_padded(self):
+        self.store.set_slot("2025-04-07", 2, reps=9)
+        self.store.flush()
+        self.assertEqual(list(DetailStore(self.path, 4).day("2025-04-07").reps), [0, 0, 9, 0])
+        self.assertEqual(list(DetailStore(self.path, 2).day("2025-04-07").reps), [0, 0])
+
+
+class TestTrackerDetails(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clock = VirtualClock(datetime(2099, 1, 5, 8, 1))
+        self.tracker = make_tracker(self.temp_dir.name, {"2099-01-05": [False] * 13}, self.clock)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_marking_records_details_next_to_the_boolean_view(self):
+        self.tracker.mark_as_completed("2099-01-05", 0, reps=15, duration=45)
+        self.tracker.mark_as_completed("2099-01-05", 1)
+        self.tracker.mark_as_completed("2099-01-05", 1, completed=False)
+
+        with open(self.tracker.tracker_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["2099-01-05"][:3], [True, False, False])
+        record = make_tracker(self.temp_dir.name, clock=self.clock).details.day("2099-01-05")
+        self.assertEqual((record.reps[0], record.durations[0]), (15, 45))
+        self.assertEqual(record.completed_at[0], int(datetime(2099, 1, 5, 8, 1).timestamp()))
+        self.assertEqual(record.completed_at[1], 0)
+
+    def test_invalid_reps_leave_the_slot_unchanged(self):
+        with self.assertRaises(ValueError):
+            self.tracker.mark_as_completed("2099-01-05", 0, reps=-1)
+        self.assertFalse(self.tracker.tracker_data["2099-01-05"][0])
+
+    def test_invalid_marks_leave_a_missing_day_missing(self):
+        events = []
+        self.tracker.events.subscribe(DayAdded, events.append)
+        with self.assertRaises(ValueError):
+            self.tracker.mark_as_completed("2099-01-06", 0, duration=70000)
+        with self.assertRaises(ValueError):
+            self.tracker.mark_as_completed("2099-01-06", 13)
+        self.assertNotIn("2099-01-06", self.tracker.tracker_data)
+        self.assertEqual(events, [])
+        self.assertFalse(self.tracker.has_unsaved_changes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from src.events import DataReplaced, DayAdded, EventBus, SlotChanged
+from tests.trackers import make_tracker
+
+
+class TestEventBus(unittest.TestCase):
+    def test_publish_reaches_subscribers_of_the_event_type(self):
+        bus = EventBus()
+        received = []
+        handler = bus.subscribe(SlotChanged, received.append)
+        bus.subscribe(DayAdded, lambda event: received.append(("day", event.date)))
+
+        bus.publish(SlotChanged("2025-04-07", 1, False, True))
+        bus.publish(DataReplaced())
+        bus.unsubscribe(SlotChanged, handler)
+        bus.publish(SlotChanged("2025-04-07", 1, True, False))
+        bus.publish(DayAdded("2025-04-08"))
+        self.assertEqual(received, [SlotChanged("2025-04-07", 1, False, True), ("day", "2025-04-08")])
+
+
+class TestTrackerEvents(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tracker = make_tracker(self.temp_dir.name, {"2099-01-05": [False] * 13})
+        self.events = []
+        for event_type in (SlotChanged, DayAdded, DataReplaced):
+            self.tracker.events.subscribe(event_type, self.events.append)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_changes_publish_typed_events(self):
+        self.tracker.mark_as_completed("2099-01-05", 2)
+        self.tracker.mark_as_completed("2099-01-06", 0)
+        self.assertEqual(self.events, [
+            SlotChanged("2099-01-05", 2, False, True),
+            DayAdded("2099-01-06"),
+            SlotChanged("2099-01-06", 0, False, True),
+        ])
+
+    def test_reset_also_drops_sealed_weeks(self):
+        self.tracker.mark_as_completed("2025-04-01", 0)  # Sealed into the archive on save
+        self.assertTrue(self.tracker.archive.has_week("2025-03-31"))
+        with redirect_stdout(io.StringIO()):
+            self.tracker.reset_weekly_data("2099-01-05")
+        self.assertEqual(len(self.tracker.tracker_data), 7)
+        self.assertEqual(self.tracker.analytics.slot_hit_rates()[0], 0)
+        self.assertEqual(len(make_tracker(self.temp_dir.name).tracker_data), 7)
+
+    def test_cache_and_analytics_follow_the_events(self):
+        self.tracker.analytics.rebuild()
+        self.assertEqual(self.tracker.aggregates.day("2099-01-05").completed, 0)
+        self.tracker.aggregates.day("2099-01-06")
+        for slot_index in range(13):
+            self.tracker.mark_as_completed("2099-01-05", slot_index)
+
+        self.assertEqual(self.tracker.aggregates.day("2099-01-05").completed, 13)
+        self.assertIn(("day", "2099-01-06"), self.tracker.aggregates.entries)
+        self.assertFalse(self.tracker.analytics.stale)
+        self.assertEqual(self.tracker.analytics.longest_streak(), 1)
+
+    def test_bulk_replacement_publishes_data_replaced(self):
+        self.tracker.tracker_data = {"2099-01-12": [True] * 13}
+        self.assertEqual(self.events, [DataReplaced()])
+        self.assertTrue(self.tracker.analytics.stale)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+import tempfile
+import unittest
+from src.export import _date_arg, export_history, iter_csv_chunks, iter_days, read_columnar
+from src.storage import TieredTrackerData, WeekArchive
+
+TIME_SLOTS = ["8:00 AM", "8:45 AM", "9:30 AM"]
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tracker_data = {
+            "2025-04-02": [True, False, True],
+            "2025-03-31": [False, False, False],
+            "2025-04-01": [True, True, True],
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_iter_days_orders_and_filters(self):
+        days = list(iter_days(self.tracker_data, start="2025-04-01"))
+        self.assertEqual([day for day, _ in days], ["2025-04-01", "2025-04-02"])
+
+    def test_tiered_data_is_streamed_in_date_order(self):
+        archive = WeekArchive(os.path.join(self.temp_dir.name, "squats_archive.dat"))
+        tracker_data = TieredTrackerData(dict(self.tracker_data, **{
+            "2025-03-25": [True, False, False], "2025-04-08": [True, True, True],
+        }), archive)
+        tracker_data.seal_closed_weeks("2025-04-14")
+        tracker_data.thaw("2025-04-01")[0] = False  # Its week is hot again, between two archived weeks
+        archive.cache.clear()
+        days = list(iter_days(tracker_data, end="2025-04-08"))
+        self.assertEqual([day for day, _ in days], [
+            "2025-03-25", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-08",
+        ])
+        self.assertEqual(days[2][1], [False, True, True])
+        self.assertEqual(list(archive.cache), [])
+
+    def test_dates_on_the_command_line_are_validated(self):
+        self.assertEqual(_date_arg("2025-4-1"), "2025-04-01")
+        with self.assertRaises(argparse.ArgumentTypeError):
+            _date_arg("2025-13-01")
+
+    def test_csv_chunks(self):
+        chunks = list(iter_csv_chunks(iter_days(self.tracker_data), TIME_SLOTS, chunk_rows=2))
+        self.assertEqual(len(chunks), 2)
+        lines = "".join(chunks).splitlines()
+        self.assertEqual(lines[0], "date,8:00 AM,8:45 AM,9:30 AM,completed")
+        self.assertEqual(lines[1], "2025-03-31,0,0,0,0")
+        self.assertEqual(lines[3], "2025-04-02,1,0,1,2")
+
+    def test_jsonl_export(self):
+        path = os.path.join(self.temp_dir.name, "history.jsonl")
+        export_history(self.tracker_data, path, TIME_SLOTS, fmt="jsonl", end="2025-04-01")
+        with open(path, "r", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(rows, [
+            {"date": "2025-03-31", "slots": [False, False, False]},
+            {"date": "2025-04-01", "slots": [True, True, True]},
+        ])
+
+    def test_columnar_round_trip(self):
+        path = os.path.join(self.temp_dir.name, "history.sqtc")
+        export_history(self.tracker_data, path, TIME_SLOTS, fmt="columnar", chunk_rows=2)
+        self.assertEqual(dict(read_columnar(path)), self.tracker_data)
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_failed_export_leaves_no_file(self):
+        path = os.path.join(self.temp_dir.name, "history.sqtc")
+        tracker_data = dict(self.tracker_data, **{"2025-13-01": [True, True, True]})  # Fails after the first chunk
+        with self.assertRaises(ValueError):
+            export_history(tracker_data, path, TIME_SLOTS, fmt="columnar", chunk_rows=1)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export_history(self.tracker_data, os.path.join(self.temp_dir.name, "x"), TIME_SLOTS, fmt="xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from src.heatmap import cell_color, cell_position, completion_matrix, LEVEL_COLORS, NO_DATA_COLOR
+from src.storage import TieredTrackerData, WeekArchive
+
+
+class TestYearHeatmap(unittest.TestCase):
+    def test_completion_matrix(self):
+        tracker_data = {"2025-01-02": [True, False, True], "2025-12-31": [True, True, True]}
+        matrix, has_data = completion_matrix(2025, tracker_data, 3)
+        self.assertEqual(len(has_data), 365)
+        self.assertEqual(len(matrix), 365 * 3)
+        self.assertEqual(sum(has_data), 2)
+        self.assertEqual(list(matrix[3:6]), [1, 0, 1])
+        self.assertEqual(list(matrix[-3:]), [1, 1, 1])
+
+    def test_archived_weeks_bypass_the_week_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive = WeekArchive(os.path.join(temp_dir, "squats_archive.dat"))
+            tracker_data = TieredTrackerData({
+                "2024-12-31": [True, True, True],  # Same week as 2025-01-01, other year
+                "2025-01-02": [True, False, True],
+                "2025-06-10": [False, False, True],
+                "2025-12-31": [True, True, True],
+            }, archive)
+            tracker_data.seal_closed_weeks("2025-12-29")
+            matrix, has_data = completion_matrix(2025, tracker_data, 3)
+            self.assertEqual(list(archive.cache), [])
+        self.assertEqual(sum(has_data), 3)
+        self.assertEqual(list(matrix[3:6]), [1, 0, 1])
+        self.assertEqual(list(matrix[-3:]), [1, 1, 1])
+
+    def test_cell_position(self):
+        # 2025-01-01 is a Wednesday, 2025-01-06 the following Monday
+        self.assertEqual(cell_position(2025, 0), (0, 2))
+        self.assertEqual(cell_position(2025, 5), (1, 0))
+        self.assertEqual(cell_position(2025, 364), (52, 2))
+
+    def test_cell_color(self):
+        self.assertEqual(cell_color(0, 13, has_data=False), NO_DATA_COLOR)
+        self.assertEqual(cell_color(0, 13), LEVEL_COLORS[0])
+        self.assertEqual(cell_color(1, 13), LEVEL_COLORS[1])
+        self.assertEqual(cell_color(13, 13), LEVEL_COLORS[4])
+
+
+if __name__ == "__main__":
+    unittest.main()
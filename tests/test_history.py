@@ -0,0 +1,74 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from src.history import (
+    find_log_sources, iter_log_lines, parse_log_events, rebuild_tracker_data,
+    replay_events, SlotMark, StateDump,
+)
+
+
+class TestHistoryReplay(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, "squats_log.txt")
+        self.snapshot_file = os.path.join(self.temp_dir.name, "squats_tracker.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_log_events(self):
+        lines = [
+            "2025-04-04 13:02:44: Tracker data loaded from file: {'2025-04-04': [False, False, False]}\n",
+            "2025-04-04 13:03:00: User marked slot 1 on 2025-04-04 as completed. "
+            "Current tracker data: [False, True, False]\n",
+            "2025-04-04 13:04:00: Tracker data loaded from file: {'2025-04-04': [Fal\n",
+            "2025-04-04 13:05:00: Backup created: squats_tracker_backup.json\n",
+        ]
+        events = list(parse_log_events(lines))
+        self.assertEqual(events, [
+            StateDump({"2025-04-04": [False, False, False]}),
+            SlotMark("2025-04-04", 1, True, [False, True, False]),
+        ])
+
+    def test_replay_resumes_from_last_dump(self):
+        events = [
+            StateDump({"2025-03-31": [True, True]}),
+            SlotMark("2025-03-31", 0, False, None),
+            StateDump({"2025-04-07": [False, False]}),
+            SlotMark("2025-04-08", 1, True, None),
+        ]
+        self.assertEqual(replay_events(events, 2), {
+            "2025-04-07": [False, False],
+            "2025-04-08": [False, True],
+        })
+
+    def test_rotated_archives_are_read_oldest_first(self):
+        with gzip.open(f"{self.log_file}.2.gz", "wt", encoding="utf-8") as log:
+            log.write("2025-04-01 08:00:00: Tracker data loaded from file: {'2025-04-01': [False, False]}\n")
+        with open(f"{self.log_file}.1", "w", encoding="utf-8") as log:
+            log.write("2025-04-01 09:00:00: User marked slot 0 on 2025-04-01 as completed.\n")
+        with open(self.log_file, "w", encoding="utf-8") as log:
+            log.write("2025-04-01 10:00:00: User marked slot 1 on 2025-04-01 as completed.\n")
+
+        for unrelated in (f"{self.log_file}.bak.1", f"{self.log_file}.1.orig", f"{self.log_file}.x3"):
+            with open(unrelated, "w", encoding="utf-8") as log:
+                log.write("2025-04-01 11:00:00: User marked slot 0 on 2025-04-01 as not completed.\n")
+
+        sources = find_log_sources(self.log_file)
+        self.assertEqual(sources, [f"{self.log_file}.2.gz", f"{self.log_file}.1", self.log_file])
+        self.assertEqual(len(list(iter_log_lines(sources))), 3)
+
+        tracker_data = rebuild_tracker_data(self.log_file, self.snapshot_file, 2)
+        self.assertEqual(tracker_data, {"2025-04-01": [True, True]})
+        with open(self.snapshot_file, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), tracker_data)
+
+    def test_rebuild_without_log_returns_empty(self):
+        self.assertEqual(rebuild_tracker_data(self.log_file, self.snapshot_file, 2), {})
+        self.assertFalse(os.path.exists(self.snapshot_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from src.clock import VirtualClock
+from src.latency import LatencyStore, QuantileSketch, format_latency_report
+from tests.trackers import make_tracker
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def test_quantiles_are_within_the_relative_accuracy(self):
+        rng = random.Random(7)
+        values = sorted(rng.expovariate(1 / 600) + 1 for _ in range(5000))
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q), exact, delta=exact * 0.011)
+
+    def test_memory_does_not_grow_with_the_sample_count(self):
+        sketch = QuantileSketch(max_buckets=64)
+        for value in range(1, 100000, 7):
+            sketch.add(value)
+        self.assertLessEqual(len(sketch.buckets), 64)
+        self.assertEqual(sketch.count, len(range(1, 100000, 7)))
+        self.assertAlmostEqual(sketch.quantile(0.99), 99000, delta=99000 * 0.011)
+
+    def test_merged_sketch_equals_sketch_of_all_values(self):
+        first, second, both = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in (0.2, 30, 45, 300):
+            first.add(value)
+            both.add(value)
+        for value in (60, 3600, 7200):
+            second.add(value)
+            both.add(value)
+        first.merge(second)
+        self.assertEqual(dict(first.buckets), dict(both.buckets))
+        self.assertEqual((first.count, first.zero_count), (7, 1))
+        self.assertEqual(QuantileSketch.from_dict(first.to_dict()).quantile(0.5), both.quantile(0.5))
+
+    def test_empty_sketch_has_no_quantiles(self):
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+
+class TestLatencyStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "squats_latency.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_misshapen_file_is_treated_as_corrupted(self):
+        for content in ("[]", '{"slots": {"0": {"buckets": {}}}}', '{"weeks": []}'):
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(content)
+            store = LatencyStore(self.path)
+            with redirect_stdout(io.StringIO()) as output:
+                store.record_completion("2025-04-07", "2025-04-07", 0, 0, 60)
+                store.flush()
+            self.assertIn("corrupted", output.getvalue())
+            self.assertEqual(LatencyStore(self.path).slot_sketch(0).count, 1)
+
+    def test_delay_is_measured_from_the_first_reminder_or_the_slot_start(self):
+        store = LatencyStore(self.path)
+        store.reminder_fired("2025-04-07", 0, 1000)
+        store.reminder_fired("2025-04-07", 0, 1300)
+        self.assertEqual(store.record_completion("2025-04-07", "2025-04-07", 0, 900, 1600), 600)
+        self.assertEqual(store.record_completion("2025-04-07", "2025-04-07", 1, 1500, 1620), 120)
+        self.assertIsNone(store.record_completion("2025-04-07", "2025-04-07", 2, 2000, 1700))
+
+    def test_instances_merge_their_samples_on_flush(self):
+        first, second = LatencyStore(self.path), LatencyStore(self.path)
+        first.record_completion("2025-04-07", "2025-04-07", 0, 0, 60)
+        first.flush()
+        second.record_completion("2025-04-08", "2025-04-07", 0, 0, 120)
+        second.record_completion("2025-04-14", "2025-04-14", 1, 0, 240)
+        second.flush()
+        first.flush()  # Nothing new; must not drop the other instance's samples
+
+        reopened = LatencyStore(self.path)
+        self.assertEqual(reopened.slot_sketch(0).count, 2)
+        self.assertEqual(reopened.span_sketch().count, 3)
+        self.assertEqual(reopened.span_sketch(last_week="2025-04-07").count, 2)
+        report = format_latency_report(reopened, ["8:00 AM", "8:45 AM", "9:30 AM"])
+        self.assertIn("8:45 AM", report)
+        self.assertIn("4m02s", report)  # 240s within 1%
+
+
+class TestTrackerLatency(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clock = VirtualClock(datetime(2099, 1, 5, 8, 50))
+        self.tracker = make_tracker(self.temp_dir.name, {"2099-01-05": [False] * 13}, self.clock)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_reminders_and_completions_feed_the_sketches(self):
+        self.tracker.mark_as_completed("2099-01-05", 0)  # 50 minutes after 8:00, no reminder
+        self.tracker.reminder_fired()  # Reminds of 8:45, the only open slot that has started
+        self.clock.advance(minutes=5)
+        self.tracker.mark_as_completed("2099-01-05", 1)
+        self.tracker.mark_as_completed("2099-01-05", 1)  # Already done; not a second sample
+        self.tracker.mark_as_completed("2099-01-04", 3)  # Back-filled day; not responsiveness
+
+        latency = make_tracker(self.temp_dir.name, clock=self.clock).latency
+        self.assertAlmostEqual(latency.slot_sketch(0).quantile(0.5), 3000, delta=30)
+        self.assertAlmostEqual(latency.slot_sketch(1).quantile(0.5), 300, delta=3)
+        self.assertEqual(latency.slot_sketch(3).count, 0)
+        self.assertEqual(latency.span_sketch("2099-01-05", "2099-01-05").count, 2)
+
+    def test_reminders_skip_completed_and_future_slots(self):
+        self.tracker.mark_as_completed("2099-01-05", 1)
+        self.clock.advance(timedelta(minutes=5).total_seconds())
+        self.tracker.reminder_fired()
+        self.assertEqual(set(self.tracker.latency.fires), {0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from src.clock import VirtualClock
+from src.leaderboard import build_leaderboard, find_profiles, format_leaderboard, is_tracker_data, summarize_profile
+
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.reference_date = date(2025, 4, 2)
+        profiles = {
+            "alice": {"2025-03-31": [True, True], "2025-04-01": [True, False]},
+            "bob": {"2025-04-02": [True, True], "2025-03-03": [True, True]},
+            "carol": {"2025-03-30": [True, True]},
+        }
+        for name, tracker_data in profiles.items():
+            with open(os.path.join(self.temp_dir.name, f"{name}.json"), "w", encoding="utf-8") as f:
+                json.dump(tracker_data, f)
+        with open(os.path.join(self.temp_dir.name, "broken.json"), "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_summarize_profile(self):
+        summary = summarize_profile(os.path.join(self.temp_dir.name, "bob.json"), date(2025, 3, 31), "2025-04")
+        self.assertEqual(summary, ("bob", 2, 2, 2, 2))
+        self.assertIsNone(summarize_profile(os.path.join(self.temp_dir.name, "broken.json"), date(2025, 3, 31), "2025-04"))
+
+    def test_files_of_another_shape_are_skipped(self):
+        for content in ("[true, false]", '{"2025-04-02": 5}', '{"2025-04-02": [1, 0]}', "null"):
+            self.assertFalse(is_tracker_data(json.loads(content)))
+            path = os.path.join(self.temp_dir.name, "dave.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            self.assertIsNone(summarize_profile(path, date(2025, 3, 31), "2025-04"))
+        paths = find_profiles([self.temp_dir.name])
+        leaders = build_leaderboard(paths, top_k=1, reference_date=self.reference_date, workers=1)
+        self.assertEqual(format_leaderboard(leaders), ["1. alice: 3/4"])
+
+    def test_build_leaderboard(self):
+        paths = find_profiles([self.temp_dir.name])
+        self.assertEqual(len(paths), 4)
+        leaders = build_leaderboard(paths, top_k=2, reference_date=self.reference_date, workers=2, shard_size=1)
+        self.assertEqual(format_leaderboard(leaders), ["1. alice: 3/4", "2. bob: 2/2"])
+
+        leaders = build_leaderboard(paths, top_k=1, period="month", reference_date=self.reference_date, workers=1)
+        self.assertEqual([leader.profile for leader in leaders], ["bob"])
+
+    def test_period_defaults_to_the_clocks_today(self):
+        paths = find_profiles([self.temp_dir.name])
+        leaders = build_leaderboard(paths, top_k=2, workers=1, clock=VirtualClock(datetime(2025, 4, 2, 12, 0)))
+        self.assertEqual(format_leaderboard(leaders), ["1. alice: 3/4", "2. bob: 2/2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import importlib
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from src.clock import VirtualClock
+from tests.trackers import tracker_module
+
+
+class TestProfileManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tracker_module = tracker_module()
+        self.profiles_module = importlib.import_module("src.profiles")  # Imports src.tracker
+        self.root_dir = os.path.join(self.temp_dir.name, "profiles")
+        self.clock = VirtualClock(datetime(2099, 1, 5, 9, 0))
+        self.manager = self.profiles_module.ProfileManager(self.root_dir, capacity=2, clock=self.clock)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_each_profile_keeps_its_own_files(self):
+        self.manager.get("ana").mark_as_completed("2099-01-05", 0)
+        self.manager.get("ben").mark_as_completed("2099-01-05", 1)
+
+        for name, slot_index in (("ana", 0), ("ben", 1)):
+            directory = os.path.join(self.root_dir, name)
+            with open(os.path.join(directory, self.tracker_module.TRACKER_FILE), encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["2099-01-05"].index(True), slot_index)
+            self.assertTrue(os.path.exists(os.path.join(directory, self.tracker_module.LOG_FILE)))
+            self.assertTrue(os.path.exists(os.path.join(directory, self.tracker_module.DETAILS_FILE)))
+        self.assertEqual(os.listdir(self.temp_dir.name), ["profiles"])
+        self.assertEqual(self.manager.names(), ["ana", "ben"])
+
+    def test_least_recently_used_profile_is_evicted(self):
+        ana = self.manager.get("ana")
+        self.manager.get("ben")
+        self.assertIs(self.manager.get("ana"), ana)  # Still loaded, and now most recently used
+        self.manager.get("cy")
+        self.assertEqual(list(self.manager.trackers), ["ana", "cy"])
+        self.assertEqual(self.manager.names(), ["ana", "ben", "cy"])
+
+    def test_eviction_saves_unsaved_changes(self):
+        ana = self.manager.get("ana")
+        ana.details.set_slot("2099-01-05", 3, reps=12)  # Not saved yet
+        self.assertTrue(ana.has_unsaved_changes())
+        self.manager.get("ben")
+        self.manager.get("cy")
+
+        reloaded = self.manager.get("ana")
+        self.assertIsNot(reloaded, ana)
+        self.assertEqual(reloaded.details.day("2099-01-05").reps[3], 12)
+
+    def test_profile_that_cannot_be_saved_stays_loaded(self):
+        ana = self.manager.get("ana")
+        ana.details.set_slot("2099-01-05", 3, reps=12)
+        ana.save_tracker = lambda: None  # A save that fails only logs, like a permission error
+        self.manager.get("ben")
+        self.manager.get("cy")
+
+        self.assertEqual(list(self.manager.trackers), ["ana", "ben", "cy"])
+        with self.assertRaises(OSError):
+            self.manager.evict()
+        self.assertEqual(self.manager.flush_all(), ["ana"])
+        self.assertIs(self.manager.get("ana"), ana)
+        self.assertTrue(ana.has_unsaved_changes())
+
+    def test_invalid_names_are_rejected(self):
+        for name in ("", " ", "..", os.path.join("a", "b"), "a/b", "a\\b", "C:x", "C:"):
+            with self.assertRaises(ValueError):
+                self.manager.get(name)
+        with self.assertRaises(ValueError):
+            self.profiles_module.ProfileManager(capacity=0)
+
+    def test_without_a_profile_files_stay_in_the_working_directory(self):
+        profile_path, tracker_file = self.tracker_module.profile_path, self.tracker_module.TRACKER_FILE
+        self.assertEqual(profile_path(None, tracker_file), tracker_file)
+        self.assertEqual(profile_path("profiles/ana", tracker_file), os.path.join("profiles/ana", tracker_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import importlib
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+from src.clock import SYSTEM_CLOCK, VirtualClock
+
+
+class TestNotificationManager(unittest.TestCase):
+    def setUp(self):
+        self.reminders = importlib.import_module("src.reminders")
+        self.root = Mock()
+        self.root.after.side_effect = ["after#1", "after#2"]
+        self.manager = self.reminders.NotificationManager.__new__(self.reminders.NotificationManager)
+        self.manager.root = self.root
+        self.manager.pending = None
+
+    def tearDown(self):
+        self.reminders._MANAGER = None
+
+    def test_schedule_uses_the_event_loop_and_replaces_the_pending_reminder(self):
+        self.manager.schedule(5, Mock())
+        self.manager.schedule(300, Mock())
+        self.assertEqual([call.args[0] for call in self.root.after.call_args_list], [5000, 300000])
+        self.root.after_cancel.assert_called_once_with("after#1")
+        self.assertEqual(self.manager.pending, "after#2")
+
+    def test_schedule_next_reminder_routes_through_the_manager(self):
+        self.reminders._MANAGER = self.manager
+        with patch("src.reminders.threading.Timer") as timer:
+            self.reminders.schedule_next_reminder(5)
+        timer.assert_not_called()
+        self.assertEqual(self.root.after.call_args.args[0], 5000)
+
+    def test_without_a_main_window_reminders_run_on_the_clock(self):
+        clock = VirtualClock(datetime(2025, 4, 7, 7, 0))
+        self.reminders.use_clock(clock)
+        shown = Mock()
+        self.reminders.set_popup_mock(shown)
+        try:
+            self.reminders.schedule_next_reminder(300)
+            clock.advance(seconds=299)
+            shown.assert_not_called()
+            clock.advance(seconds=1)
+            shown.assert_called_once()
+        finally:
+            self.reminders.reset_popup_mock()
+            self.reminders.use_clock(SYSTEM_CLOCK)
+
+    def test_popup_reuses_the_shared_window(self):
+        self.reminders._MANAGER = self.manager
+        self.manager.show_reminder = Mock()
+        self.reminders.popup()
+        self.reminders.popup()
+        self.assertEqual(self.manager.show_reminder.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
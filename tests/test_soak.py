@@ -0,0 +1,54 @@
+import unittest
+from datetime import date, datetime, timedelta
+from src.clock import VirtualClock
+from tests.fake_tk import FakeCalendar, FakeRoot, FakeWidget
+from tests.soak import Sample, find_leaks, format_report
+
+
+class TestSoakHarness(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(datetime(2025, 4, 7, 7, 0))
+        self.root = FakeRoot(self.clock)
+
+    def test_after_queue_runs_on_the_virtual_clock(self):
+        calls = []
+        self.root.after(2000, calls.append, "late")
+        self.root.after(1000, lambda: calls.append(self.clock.now()))
+        cancelled = self.root.after(1500, calls.append, "cancelled")
+        self.root.after_cancel(cancelled)
+
+        self.clock.advance_to(self.clock.now() + timedelta(seconds=1, milliseconds=500))
+        self.assertEqual(calls, [datetime(2025, 4, 7, 7, 0, 1)])
+        self.assertEqual(self.clock.pending(), 1)
+        self.clock.advance_to(self.clock.now() + timedelta(minutes=1))
+        self.assertEqual(calls[-1], "late")
+        self.assertEqual(self.clock.now(), datetime(2025, 4, 7, 7, 1, 1, 500000))
+
+    def test_destroyed_widgets_are_no_longer_live(self):
+        frame = FakeWidget(self.root)
+        FakeWidget(frame)
+        self.assertEqual(len(frame.winfo_children()), 1)
+        frame.destroy()
+        self.assertFalse(FakeWidget.live & {frame})
+        self.assertEqual(self.root.winfo_children(), [])
+
+    def test_calendar_events_can_be_replaced_by_date(self):
+        calendar = FakeCalendar(self.root)
+        calendar.calevent_create(date(2025, 4, 7), "", "completed")
+        calendar.calevent_create(date(2025, 4, 8), "", "missed")
+        calendar.calevent_remove(date=date(2025, 4, 7))
+        self.assertEqual(list(calendar.events.values()), [(date(2025, 4, 8), "", "missed")])
+        calendar.calevent_remove("all")
+        self.assertEqual(calendar.events, {})
+
+    def test_find_leaks(self):
+        bounded = [Sample(day, 40000 + day * 1000, 2, 33, 7, 2) for day in range(1, 8)]
+        self.assertEqual(find_leaks(bounded), [])
+        leaking = [Sample(day, 40000, 2 + day, 33 + 13 * day, 7 * day, 2) for day in range(1, 8)]
+        leaks = find_leaks(leaking)
+        self.assertEqual([leak.split()[0] for leak in leaks], ["threads", "widgets", "calendar_events"])
+        self.assertIn("FAILED", format_report(leaking, leaks))
+
+
+if __name__ == "__main__":
+    unittest.main()
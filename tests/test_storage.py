@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.storage import BLOCK_HEADER, TieredTrackerData, WeekArchive, adjacent_months, month_week_starts, week_start_of
+
+
+class TestTieredStorage(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive_file = os.path.join(self.temp_dir.name, "squats_archive.dat")
+        self.data = TieredTrackerData({
+            "2025-03-31": [True, False],
+            "2025-04-01": [True, True],
+            "2025-04-07": [False, False],
+        }, WeekArchive(self.archive_file, cache_size=1))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_week_start_of(self):
+        self.assertEqual(week_start_of("2025-04-06"), "2025-03-31")
+        self.assertEqual(week_start_of("2025-04-07"), "2025-04-07")
+
+    def test_month_helpers(self):
+        self.assertEqual(month_week_starts(2025, 3)[0], "2025-02-24")
+        self.assertEqual(month_week_starts(2025, 3)[-1], "2025-03-31")
+        self.assertEqual(adjacent_months(2025, 1), [(2024, 12), (2025, 2)])
+
+    def test_index_is_built_lazily_and_months_page_in(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        archive = WeekArchive(self.archive_file)
+        self.assertEqual(archive.index, {})
+        data = TieredTrackerData({"2025-04-07": [False, False]}, archive)
+        self.assertEqual(data.month(2025, 4), {"2025-04-01": (True, True), "2025-04-07": [False, False]})
+        self.assertEqual(list(archive.cache), ["2025-03-31"])
+        self.assertEqual(data.month(2025, 3), {"2025-03-31": (True, False)})
+
+    def test_seal_closed_weeks(self):
+        self.assertEqual(self.data.seal_closed_weeks("2025-04-07"), ["2025-03-31"])
+        self.assertEqual(self.data.hot, {"2025-04-07": [False, False]})
+        self.assertEqual(self.data["2025-04-01"], (True, True))
+        self.assertIn("2025-03-31", self.data)
+        self.assertNotIn("2025-04-02", self.data)
+        self.assertEqual(len(self.data), 3)
+        self.assertEqual(sorted(self.data), ["2025-03-31", "2025-04-01", "2025-04-07"])
+
+    def test_scan_reads_only_the_weeks_in_range(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        self.data["2025-03-24"] = [False, True]
+        self.data.seal_closed_weeks("2025-04-07")
+        with patch.object(self.data.archive, "read_week", wraps=self.data.archive.read_week) as read_week:
+            self.assertEqual(dict(self.data.scan("2025-04-01", "2025-04-07")), {
+                "2025-04-01": (True, True), "2025-04-07": [False, False],
+            })
+        self.assertEqual([call.args[0] for call in read_week.call_args_list], ["2025-03-31"])
+
+    def test_archive_survives_reopen(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        reopened = TieredTrackerData({}, WeekArchive(self.archive_file))
+        self.assertEqual(dict(reopened.scan()), {"2025-03-31": (True, False), "2025-04-01": (True, True)})
+
+    def test_thaw_and_reseal_supersedes_block(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        self.data.thaw("2025-03-31")[1] = True
+        self.assertEqual(self.data.hot["2025-04-01"], [True, True])
+        self.data.seal_closed_weeks("2025-04-07")
+        reopened = WeekArchive(self.archive_file)
+        self.assertEqual(reopened.read_week("2025-03-31")["2025-03-31"], (True, True))
+
+    def test_deleted_archived_day_stays_deleted(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        self.assertEqual(self.data.pop("2025-03-31"), (True, False))
+        self.assertNotIn("2025-03-31", self.data)
+        self.assertEqual(sorted(self.data), ["2025-04-01", "2025-04-07"])
+        self.assertIsNone(self.data.thaw("2025-03-31"))
+        self.data.seal_closed_weeks("2025-04-07")
+        self.assertEqual(self.data.deleted, set())
+        reopened = TieredTrackerData({}, WeekArchive(self.archive_file))
+        self.assertEqual(dict(reopened.scan()), {"2025-04-01": (True, True)})
+
+    def test_clear_and_popitem_finish(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        self.assertEqual(self.data.popitem(), ("2025-03-31", (True, False)))
+        self.data.clear()
+        self.assertEqual((len(self.data), list(self.data.scan())), (0, []))
+        self.data.seal_closed_weeks("2025-04-07")
+        self.assertEqual(len(TieredTrackerData({}, WeekArchive(self.archive_file))), 0)
+
+    def test_archive_cleared_by_another_instance_is_forgotten(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        self.assertEqual(len(self.data), 3)
+        WeekArchive(self.archive_file).clear()
+        self.assertEqual(sorted(self.data), ["2025-04-07"])
+        self.data["2025-03-24"] = [True, True]
+        self.data.seal_closed_weeks("2025-04-07")
+        self.assertEqual(WeekArchive(self.archive_file).weeks(), ["2025-03-24"])
+
+    def test_partial_hot_week_is_merged_when_sealed(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        partial = TieredTrackerData({"2025-04-01": [False, False]}, WeekArchive(self.archive_file))
+        partial.seal_closed_weeks("2025-04-07")
+        self.assertEqual(partial["2025-03-31"], (True, False))
+        self.assertEqual(partial["2025-04-01"], (False, False))
+
+    def test_corrupted_tail_is_ignored_and_overwritten(self):
+        self.data.seal_closed_weeks("2025-04-07")
+        with open(self.archive_file, "ab") as f:
+            f.write(b"SQWK2025-04")
+        archive = WeekArchive(self.archive_file)
+        self.assertEqual(archive.weeks(), ["2025-03-31"])
+        archive.seal("2025-04-07", {"2025-04-07": [True, True]})
+        self.assertEqual(WeekArchive(self.archive_file).weeks(), ["2025-03-31", "2025-04-07"])
+
+    def _two_sealed_weeks(self):
+        archive = WeekArchive(self.archive_file)
+        archive.seal("2025-03-31", {"2025-03-31": [True, False]})
+        archive.seal("2025-04-07", {"2025-04-07": [True, True]})
+        return archive.index["2025-03-31"]
+
+    def test_corrupted_payload_is_skipped(self):
+        offset, _, _ = self._two_sealed_weeks()
+        with open(self.archive_file, "r+b") as f:
+            f.seek(offset)
+            f.write(b"\x00\x00\x00")
+        data = TieredTrackerData({}, WeekArchive(self.archive_file))
+        self.assertEqual(dict(data.scan()), {"2025-04-07": (True, True)})
+        self.assertNotIn("2025-03-31", data)
+
+    def test_corrupted_header_in_the_middle_keeps_later_weeks(self):
+        offset, _, _ = self._two_sealed_weeks()
+        with open(self.archive_file, "r+b") as f:
+            f.seek(offset - BLOCK_HEADER.size)
+            f.write(b"XXXX")
+        archive = WeekArchive(self.archive_file)
+        self.assertEqual(archive.weeks(), ["2025-04-07"])
+        archive.seal("2025-04-14", {"2025-04-14": [False, True]})
+        self.assertEqual(WeekArchive(self.archive_file).weeks(), ["2025-04-07", "2025-04-14"])
+
+
+if __name__ == "__main__":
+    unittest.main()
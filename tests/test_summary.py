@@ -0,0 +1,41 @@
+import unittest
+from datetime import date
+from src.aggregates import summarize_day
+from src.summary import RangeRows
+
+
+class TestRangeRows(unittest.TestCase):
+    def setUp(self):
+        self.tracker_data = {
+            "2025-04-01": [True, True],
+            "2025-04-02": [False, False],
+            "2025-04-03": [True, False],
+        }
+        self.looked_up = []
+        self.rows = RangeRows(date(2025, 4, 1), date(2025, 4, 4), self.lookup)
+
+    def lookup(self, date_str):
+        self.looked_up.append(date_str)
+        slots = self.tracker_data.get(date_str)
+        return None if slots is None else summarize_day(slots)
+
+    def test_rows_are_computed_lazily(self):
+        self.assertEqual(len(self.rows), 4)
+        self.assertEqual(self.looked_up, [])
+        self.assertEqual(self.rows.row(2), ("2025-04-03", "1/2", "Partial"))
+        self.assertEqual(self.rows.row(3), ("2025-04-04", "No data", "No data"))
+        self.assertEqual(self.looked_up, ["2025-04-03", "2025-04-04"])
+
+    def test_sort_by_progress(self):
+        self.rows.arrange("progress", descending=True)
+        self.assertEqual([row[0] for row in self.rows], ["2025-04-01", "2025-04-03", "2025-04-02", "2025-04-04"])
+
+    def test_filter_and_reverse_by_date(self):
+        self.rows.arrange("date", descending=True, status_filter="Missed")
+        self.assertEqual(list(self.rows), [("2025-04-02", "0/2", "Missed")])
+        self.rows.arrange("date", descending=True)
+        self.assertEqual(self.rows.row(0)[0], "2025-04-04")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.sync import FileLock, TrackerWatcher, file_digest
+from tests.trackers import make_tracker, tracker_module
+
+
+class TestSyncPrimitives(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "squats_tracker.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_file_digest_tracks_content(self):
+        self.assertIsNone(file_digest(self.path))
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        digest = file_digest(self.path)
+        self.assertEqual(file_digest(self.path), digest)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{\"2025-04-01\": []}")
+        self.assertNotEqual(file_digest(self.path), digest)
+
+    def test_file_lock_can_be_taken_again_after_release(self):
+        lock_file = f"{self.path}.lock"
+        with FileLock(lock_file):
+            pass
+        with FileLock(lock_file):
+            self.assertTrue(os.path.exists(lock_file))
+
+    def _assert_watcher_sees_replace(self, use_inotify):
+        changed = threading.Event()
+        watcher = TrackerWatcher(self.path, changed.set, poll_interval=0.05, use_inotify=use_inotify).start()
+        try:
+            temp_file = f"{self.path}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write("{}")
+            os.replace(temp_file, self.path)
+            self.assertTrue(changed.wait(2))
+        finally:
+            watcher.stop()
+        return watcher
+
+    def test_polling_watcher(self):
+        self.assertEqual(self._assert_watcher_sees_replace(use_inotify=False).mode, "polling")
+
+    def test_default_watcher(self):
+        self.assertIn(self._assert_watcher_sees_replace(use_inotify=True).mode, ("inotify", "polling"))
+
+    def test_stop_does_not_wait_for_the_poll_interval(self):
+        for use_inotify in (True, False):
+            watcher = TrackerWatcher(self.path, lambda: None, poll_interval=5, use_inotify=use_inotify).start()
+            started = time.monotonic()
+            watcher.stop()
+            self.assertLess(time.monotonic() - started, 1, watcher.mode)
+            self.assertFalse(watcher.thread.is_alive())
+
+
+class TestConcurrentTrackers(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tracker_file = os.path.join(self.temp_dir.name, tracker_module().TRACKER_FILE)
+        with open(self.tracker_file, "w", encoding="utf-8") as f:
+            json.dump({"2099-01-05": [False] * 13, "2099-01-06": [False] * 13}, f)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_concurrent_saves_merge_instead_of_overwriting(self):
+        first = make_tracker(self.temp_dir.name)
+        second = make_tracker(self.temp_dir.name)
+        first.mark_as_completed("2099-01-05", 0)
+        second.mark_as_completed("2099-01-06", 1)
+
+        with open(self.tracker_file, encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertTrue(saved["2099-01-05"][0])
+        self.assertTrue(saved["2099-01-06"][1])
+        self.assertTrue(second.tracker_data["2099-01-05"][0])
+
+    def test_reload_merges_only_changed_days(self):
+        first = make_tracker(self.temp_dir.name)
+        second = make_tracker(self.temp_dir.name)
+        second.aggregates.day("2099-01-06")
+        first.mark_as_completed("2099-01-05", 0)
+
+        self.assertEqual(second.reload_external_changes(), ["2099-01-05"])
+        self.assertTrue(second.tracker_data["2099-01-05"][0])
+        self.assertIn(("day", "2099-01-06"), second.aggregates.entries)
+        self.assertEqual(second.reload_external_changes(), [])
+
+    def test_different_slots_of_one_day_are_both_kept(self):
+        first = make_tracker(self.temp_dir.name)
+        second = make_tracker(self.temp_dir.name)
+        first.mark_as_completed("2099-01-05", 0)
+        second.mark_as_completed("2099-01-05", 1)
+        first.mark_as_completed("2099-01-05", 2)
+
+        with open(self.tracker_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["2099-01-05"][:4], [True, True, True, False])
+        self.assertEqual(first.tracker_data["2099-01-05"][:3], [True, True, True])
+        second.reload_external_changes()
+        self.assertEqual(second.tracker_data["2099-01-05"][:3], [True, True, True])
+
+    def test_local_unsaved_edit_wins(self):
+        first = make_tracker(self.temp_dir.name)
+        second = make_tracker(self.temp_dir.name)
+        first.mark_as_completed("2099-01-05", 0)
+        second.tracker_data.thaw("2099-01-05")[0] = False
+        second.dirty_days.add("2099-01-05")
+
+        self.assertEqual(second.reload_external_changes(), [])
+        self.assertFalse(second.tracker_data["2099-01-05"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from src.clock import VirtualClock
+from src.utils import LOG_FILE, StartupTrace, log_message
+
+
+class TestLogMessage(unittest.TestCase):
+    def test_timestamp_comes_from_the_clock(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cwd = os.getcwd()
+            os.chdir(temp_dir)  # The log file is relative to the working directory
+            try:
+                log_message("Started.", clock=VirtualClock(datetime(2099, 1, 5, 9, 30)))
+                with open(LOG_FILE, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), "Mon Jan  5 09:30:00 2099: Started.\n")
+            finally:
+                os.chdir(cwd)
+
+
+class TestStartupTrace(unittest.TestCase):
+    def test_marks_are_reported_in_order(self):
+        trace = StartupTrace()
+        first_paint = trace.mark("first_paint")
+        interactive = trace.mark("interactive")
+        self.assertLessEqual(first_paint, interactive)
+        report = trace.report()
+        self.assertTrue(report.startswith("Startup trace: first_paint "))
+        self.assertIn(", interactive ", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
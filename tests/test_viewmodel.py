@@ -0,0 +1,49 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from src.aggregates import AggregateCache, PeriodAggregate
+from src.viewmodel import (
+    NO_DATA, current_slot_index, month_marks, period_view, progress_view, slot_states, summarize_day,
+)
+
+TIME_SLOTS = ["8:00 AM", "8:45 AM", "9:30 AM"]
+
+
+class TestViewModel(unittest.TestCase):
+    def test_slot_states_for_today(self):
+        now = datetime(2025, 4, 4, 8, 45)
+        states = slot_states("2025-04-04", [False, False, True], now, TIME_SLOTS)
+        self.assertEqual([state.label for state in states], ["8:00 AM ✗", "8:45 AM ⏳", "9:30 AM ✔"])
+        self.assertEqual([state.style for state in states], ["Missed.TButton", "Current.TButton", "Completed.TButton"])
+
+    def test_slot_states_for_other_days(self):
+        now = datetime(2025, 4, 4, 8, 45)
+        past = slot_states("2025-04-03", [True, False, False], now, TIME_SLOTS)
+        future = slot_states("2025-04-05", [True, False, False], now, TIME_SLOTS)
+        self.assertEqual([state.status for state in past], ["✔", "✗", "✗"])
+        self.assertEqual([state.status for state in future], ["✔", "", ""])
+
+    def test_current_slot_index(self):
+        self.assertEqual(current_slot_index(datetime(2025, 4, 4, 9, 30), TIME_SLOTS), 2)
+        self.assertIsNone(current_slot_index(datetime(2025, 4, 4, 9, 31), TIME_SLOTS))
+
+    def test_progress_views(self):
+        self.assertIs(progress_view(None), NO_DATA)
+        view = progress_view(summarize_day([True, True, True]))
+        self.assertEqual((view.progress_text, view.status_color), ("Progress: 3/3", "#006600"))
+        period = period_view("Week", PeriodAggregate(5, 10, 2, 1, 50.0))
+        self.assertEqual(period.progress_text, "Week Progress: 5/10")
+        self.assertEqual(period.status_text, "1/2 days completed")
+
+    def test_month_marks(self):
+        tracker_data = {"2025-04-01": [True, True], "2025-04-02": [False, True], "2025-05-01": [True, True]}
+        tracker = SimpleNamespace(
+            tracker_data=tracker_data,
+            load_month=lambda year, month: {d: s for d, s in tracker_data.items() if d.startswith(f"{year}-{month:02d}")},
+        )
+        tracker.aggregates = AggregateCache(tracker)
+        self.assertEqual(month_marks(tracker, 2025, 4), [("2025-04-01", "completed"), ("2025-04-02", "incomplete")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+Shared setup for tests that need real Tracker instances.
+"""
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+
+
+def tracker_module():
+    """
+    Returns src.tracker. Its first import runs in an empty temporary directory, because the
+    module-level tracker creates its files in the working directory.
+    """
+    if "src.tracker" not in sys.modules:
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                importlib.import_module("src.tracker")
+            finally:
+                os.chdir(cwd)
+    return sys.modules["src.tracker"]
+
+
+def make_tracker(directory, tracker_data=None, clock=None):
+    """
+    Returns a Tracker that keeps its files in directory, seeded with tracker_data if given.
+    """
+    module = tracker_module()
+    if tracker_data is not None:
+        with open(os.path.join(directory, module.TRACKER_FILE), "w", encoding="utf-8") as f:
+            json.dump(tracker_data, f)
+    return module.Tracker(clock, profile_dir=directory)